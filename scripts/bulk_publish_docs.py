@@ -15,14 +15,20 @@ Dry run the default mapped documents::
 Publish a specific subset::
 
     poetry run python scripts/bulk_publish_docs.py docs/overview.md docs/api.md
+
+Keep running and republish whenever a document or the mapping file changes::
+
+    poetry run python scripts/bulk_publish_docs.py --watch
 """
 
 from __future__ import annotations
 
 import argparse
 import logging
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Dict, Iterable, List, Sequence
 
 from confluence_markdown.mapping_store import MappingStore
 from scripts.common import (
@@ -36,11 +42,11 @@ from scripts.common import (
 def _summarise(outcomes: Sequence[PublishOutcome]) -> str:
     """Return a human-readable summary line for the run."""
 
-    total = len(outcomes)
-    successes = sum(1 for outcome in outcomes if outcome.status == "success")
-    failures = sum(1 for outcome in outcomes if outcome.status == "failure")
-    skipped = sum(1 for outcome in outcomes if outcome.status == "skipped")
-    return f"Processed {total} document(s): {successes} succeeded, {failures} failed, {skipped} skipped"
+    counts = Counter(outcome.status for outcome in outcomes)
+    return (
+        f"Processed {len(outcomes)} document(s): {counts['success']} succeeded, "
+        f"{counts['failure']} failed, {counts['skipped']} skipped"
+    )
 
 
 def _render_outcome(outcome: PublishOutcome) -> str:
@@ -73,32 +79,53 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=0,
         help="Increase logging verbosity (can be supplied multiple times).",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and republish whenever a document or the mapping file changes.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between change checks in --watch mode (default: 1.0).",
+    )
     return parser.parse_args(argv)
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    """Run the bulk publishing workflow."""
+def _snapshot(paths: Iterable[Path]) -> Dict[Path, int | None]:
+    """Return the modification time of each path (``None`` if it does not exist)."""
 
-    args = parse_args(argv)
-    configure_logging(args.verbose)
-    logger = logging.getLogger("scripts.bulk_publish")
+    stamps: Dict[Path, int | None] = {}
+    for path in paths:
+        try:
+            stamps[path] = path.stat().st_mtime_ns
+        except OSError:
+            stamps[path] = None
+    return stamps
 
-    mapping_store = MappingStore()
+
+def _collect_targets(args: argparse.Namespace, mapping_store: MappingStore) -> List[Path]:
+    """Return the documents to publish for this run."""
 
     if args.paths:
-        targets: Iterable[Path] = (Path(path) for path in args.paths)
-    else:
-        targets = default_markdown_paths(mapping_store)
+        return [Path(path) for path in args.paths]
+    return default_markdown_paths(mapping_store)
 
-    targets = list(targets)
-    if not targets:
-        logger.error("No documents supplied and no mappings found. Nothing to publish.")
-        return 1
+
+def _publish_once(
+    targets: Sequence[Path],
+    mapping_store: MappingStore,
+    args: argparse.Namespace,
+    logger: logging.Logger,
+) -> int:
+    """Publish ``targets`` once, report the outcomes and return the exit code."""
 
     outcomes = publish_documents(targets, mapping_store=mapping_store, dry_run=args.dry_run)
 
-    for outcome in outcomes:
-        logger.info(_render_outcome(outcome))
+    if logger.isEnabledFor(logging.INFO):
+        for outcome in outcomes:
+            logger.info(_render_outcome(outcome))
 
     logger.info(_summarise(outcomes))
 
@@ -106,5 +133,61 @@ def main(argv: Sequence[str] | None = None) -> int:
     return 1 if failures else 0
 
 
+def _watch(
+    targets: List[Path],
+    mapping_store: MappingStore,
+    args: argparse.Namespace,
+    logger: logging.Logger,
+    exit_code: int = 0,
+) -> int:
+    """Republish whenever a watched file changes, until interrupted.
+
+    Keeping the interpreter (and its Confluence connections) warm avoids paying the
+    start-up cost on every publish. Unchanged documents are skipped by
+    :func:`publish_documents`, so each cycle only uploads what was edited.
+
+    ``exit_code`` is the result of the publish that preceded watching; it is returned
+    if no change is seen before interruption.
+    """
+
+    watched = [*targets, mapping_store.mapping_file]
+    stamps = _snapshot(watched)
+    logger.info("Watching %d file(s) for changes; press Ctrl+C to stop.", len(watched))
+    try:
+        while True:
+            time.sleep(args.interval)
+            current = _snapshot(watched)
+            if current == stamps:
+                continue
+            targets = _collect_targets(args, mapping_store)
+            watched = [*targets, mapping_store.mapping_file]
+            exit_code = _publish_once(targets, mapping_store, args, logger) if targets else 0
+            # Publishing records content hashes in the mapping file, so snapshot afterwards
+            stamps = _snapshot(watched)
+    except KeyboardInterrupt:
+        logger.info("Stopped watching.")
+    return exit_code
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the bulk publishing workflow."""
+
+    args = parse_args(argv)
+    configure_logging(args.verbose)
+    logger = logging.getLogger("scripts.bulk_publish")
+
+    mapping_store = MappingStore()
+
+    targets = _collect_targets(args, mapping_store)
+    if not targets:
+        logger.error("No documents supplied and no mappings found. Nothing to publish.")
+        return 1
+
+    exit_code = _publish_once(targets, mapping_store, args, logger)
+    if args.watch:
+        return _watch(targets, mapping_store, args, logger, exit_code)
+    return exit_code
+
+
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
     raise SystemExit(main())
@@ -8,25 +8,68 @@ own CLI experience.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Literal, Sequence
+from typing import Awaitable, Dict, List, Literal, Sequence, TypeVar
 
-from confluence_markdown.confluence_api import ConfluenceAPIError, ConfluenceClient
+import requests
+
+from confluence_markdown.confluence_api import (
+    AsyncConfluenceClient,
+    ConfluenceAPIError,
+    ConfluenceClient,
+    Page,
+)
 from confluence_markdown.converter import MarkdownToConfluenceConverter
 from confluence_markdown.mapping_store import MappingEntry, MappingStore
 
 __all__ = [
     "PublishOutcome",
     "configure_logging",
+    "convert_documents",
+    "convert_texts",
+    "default_client",
+    "default_converter",
     "find_repository_root",
     "default_markdown_paths",
     "publish_documents",
+    "publish_documents_async",
     "load_markdown",
+    "load_markdown_async",
+    "content_hash",
     "create_page_title",
 ]
 
+#: Upper bound on concurrently in-flight document publications.
+DEFAULT_CONCURRENCY = 8
+
+#: Smallest batch for which conversion is spread across worker processes.
+PARALLEL_CONVERSION_THRESHOLD = 4
+
+#: Documents buffered between pipeline stages (read -> convert -> publish).
+PIPELINE_DEPTH = 4
+
+_T = TypeVar("_T")
+
+_TITLE_TRANSLATION = str.maketrans({"-": " ", "_": " "})
+
+
+@dataclass
+class _PublishJob:
+    """A validated, mapped document moving through the publish pipeline."""
+
+    index: int
+    original_path: Path
+    path: Path
+    mapping: MappingEntry
+    digest: str = ""
+
 
 @dataclass
 class PublishOutcome:
@@ -55,15 +98,42 @@ def configure_logging(verbosity: int = 0) -> None:
     )
 
 
+@lru_cache(maxsize=1)
+def default_client() -> ConfluenceClient:
+    """Return the process-wide client built from the environment.
+
+    Sharing one client keeps its pooled HTTP connections (and TLS sessions) alive
+    across repeated publishes in the same process.
+    """
+
+    return ConfluenceClient.from_env()
+
+
+@lru_cache(maxsize=1)
+def default_converter() -> MarkdownToConfluenceConverter:
+    """Return the process-wide Markdown converter."""
+
+    return MarkdownToConfluenceConverter()
+
+
 def find_repository_root(start: Path | None = None) -> Path:
-    """Locate the repository root by walking upwards until a ``.git`` directory is found."""
+    """Locate the repository root by walking upwards until a ``.git`` directory is found.
+
+    Results are cached per starting directory, so repeated lookups cost no filesystem
+    access.
+    """
+
+    return _find_repository_root(start or Path.cwd())
 
-    current = start or Path.cwd()
+
+@lru_cache(maxsize=32)
+def _find_repository_root(start: Path) -> Path:
+    current = start
     while current != current.parent:
         if (current / ".git").exists():
             return current
         current = current.parent
-    return start or Path.cwd()
+    return start
 
 
 def default_markdown_paths(mapping_store: MappingStore) -> List[Path]:
@@ -76,7 +146,65 @@ def default_markdown_paths(mapping_store: MappingStore) -> List[Path]:
 def load_markdown(path: Path) -> str:
     """Load a Markdown file, normalising newlines."""
 
-    return path.read_text(encoding="utf-8").replace("\r\n", "\n")
+    data = path.read_bytes()
+    text = data.decode("utf-8")
+    if b"\r" in data:
+        # Same result as universal-newline text mode, but only paid for when needed
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def content_hash(markdown: str) -> str:
+    """Return a short, stable digest of ``markdown`` used to detect unchanged documents."""
+
+    return hashlib.blake2b(markdown.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def load_markdown_async(path: Path) -> str:
+    """Load a Markdown file in a worker thread so the event loop keeps running."""
+
+    return await asyncio.to_thread(load_markdown, path)
+
+
+def _convert_one(markdown: str) -> str:
+    """Convert ``markdown`` with the stock converter (process-pool worker entry point)."""
+
+    return MarkdownToConfluenceConverter().convert(markdown)
+
+
+def _use_process_pool(converter: MarkdownToConfluenceConverter, count: int) -> bool:
+    """Decide whether converting ``count`` documents warrants worker processes.
+
+    Conversion is pure-Python and CPU-bound, so threads would serialise on the GIL.
+    Only the stock converter is sent to worker processes; custom converter instances
+    (test doubles, subclasses with extra state) always run in-process.
+    """
+
+    return (
+        count >= PARALLEL_CONVERSION_THRESHOLD and type(converter) is MarkdownToConfluenceConverter
+    )
+
+
+def convert_texts(
+    texts: Sequence[str], *, converter: MarkdownToConfluenceConverter | None = None
+) -> List[str]:
+    """Convert Markdown sources, fanning out to worker processes for larger batches."""
+
+    converter = converter or default_converter()
+    if _use_process_pool(converter, len(texts)):
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(_convert_one, texts))
+    return [converter.convert(text) for text in texts]
+
+
+def convert_documents(
+    paths: Sequence[Path], *, converter: MarkdownToConfluenceConverter | None = None
+) -> Dict[Path, str]:
+    """Load and convert ``paths`` to Confluence storage format, keyed by path."""
+
+    converter = converter or default_converter()
+    texts = [load_markdown(path) for path in paths]
+    return dict(zip(paths, convert_texts(texts, converter=converter)))
 
 
 def create_page_title(path: Path, *, repo_root: Path | None = None) -> str:
@@ -90,11 +218,8 @@ def create_page_title(path: Path, *, repo_root: Path | None = None) -> str:
 
     repo_root = repo_root or find_repository_root(path.parent)
 
-    try:
-        relative_path = path.resolve().relative_to(repo_root)
-    except ValueError:
-        # relative_to raises ValueError when path is not relative to repo_root
-        relative_path = Path(path.name)
+    key = _rel_key(path, repo_root)
+    relative_path = Path(key) if key is not None else Path(path.name)
 
     parts = relative_path.parts
     stem = relative_path.stem
@@ -102,26 +227,40 @@ def create_page_title(path: Path, *, repo_root: Path | None = None) -> str:
     if len(parts) == 1:
         if stem.upper() == stem:
             return stem
-        return stem.replace("-", " ").replace("_", " ").title()
+        return stem.translate(_TITLE_TRANSLATION).title()
 
     directory_context = " / ".join(parts[:-1])
-    title_component = stem.replace("-", " ").replace("_", " ").title()
+    title_component = stem.translate(_TITLE_TRANSLATION).title()
     return f"{directory_context} / {title_component}"
 
 
-def _normalise_key(path: Path) -> str:
-    """Produce a repository-relative key compatible with :class:`MappingStore`."""
+def _rel_key(path: Path, repo_root: Path) -> str | None:
+    """Return ``path`` relative to ``repo_root`` as a POSIX string, or ``None`` if outside.
+
+    Unlike ``path.resolve().relative_to(repo_root)`` this is pure string manipulation,
+    so it costs no ``lstat`` per path component.
+    """
 
     try:
-        repo_root = find_repository_root()
-        relative = path.resolve().relative_to(repo_root)
-        return relative.as_posix()
+        relative = os.path.relpath(os.path.abspath(path), repo_root)
     except ValueError:
-        # relative_to raises ValueError when path is not relative to repo_root
-        return path.as_posix().lstrip("./")
+        # Windows raises ValueError for paths on a different drive
+        return None
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        return None
+    return relative.replace(os.sep, "/")
+
+
+def _normalise_key(path: Path, repo_root: Path) -> str:
+    """Produce a repository-relative key compatible with :class:`MappingStore`."""
 
+    key = _rel_key(path, repo_root)
+    return key if key is not None else path.as_posix().lstrip("./")
 
-def _resolve_mapping(mapping_store: MappingStore, path: Path) -> MappingEntry | None:
+
+def _resolve_mapping(
+    mapping_store: MappingStore, path: Path, repo_root: Path
+) -> MappingEntry | None:
     """Look up the mapping entry for ``path`` using multiple canonicalisations."""
 
     as_posix = path.as_posix()
@@ -129,7 +268,7 @@ def _resolve_mapping(mapping_store: MappingStore, path: Path) -> MappingEntry |
     if mapping:
         return mapping
 
-    resolved_key = _normalise_key(path)
+    resolved_key = _normalise_key(path, repo_root)
     mapping = mapping_store.get_mapping(resolved_key)
     if mapping:
         return mapping
@@ -138,19 +277,51 @@ def _resolve_mapping(mapping_store: MappingStore, path: Path) -> MappingEntry |
     return mapping_store.get_mapping(str(path.resolve()))
 
 
-def _publish_single(
+def _lookup_mapping(
+    mapping_store: MappingStore,
+    index: Dict[str, MappingEntry],
+    path: Path,
+    repo_root: Path,
+) -> MappingEntry | None:
+    """Find the mapping for the resolved ``path`` with a single index lookup.
+
+    Falls back to :func:`_resolve_mapping` when the repository-relative key is not in
+    ``index``, so entries stored under other canonicalisations are still found.
+    """
+
+    try:
+        mapping = index.get(path.relative_to(repo_root).as_posix())
+    except ValueError:
+        mapping = None
+    return mapping or _resolve_mapping(mapping_store, path, repo_root)
+
+
+async def _bounded(semaphore: asyncio.Semaphore, awaitable: Awaitable[_T]) -> _T:
+    """Await ``awaitable`` while holding a slot of ``semaphore``."""
+
+    async with semaphore:
+        return await awaitable
+
+
+#: Page properties fetched before an update so unchanged pages can be skipped.
+_COMPARE_EXPAND = ("version", "body.storage")
+
+
+async def _publish_single(
     *,
     path: Path,
     mapping: MappingEntry,
-    client: ConfluenceClient,
-    converter: MarkdownToConfluenceConverter,
+    html: str,
+    client: AsyncConfluenceClient,
+    existing_pages: Dict[tuple[str, str], Page] | None,
     dry_run: bool,
     logger: logging.Logger,
 ) -> PublishOutcome:
-    """Publish a single Markdown document to Confluence."""
+    """Publish a single converted Markdown document to Confluence.
 
-    content = load_markdown(path)
-    html = converter.convert(content)
+    ``existing_pages`` holds the result of a batched title lookup keyed by
+    ``(space_key, title)``. When it is ``None`` the page is looked up individually.
+    """
 
     if dry_run:
         logger.info("Dry run: would publish %s", path)
@@ -159,8 +330,19 @@ def _publish_single(
     try:
         if mapping.get("page_id"):
             page_id = mapping["page_id"]
+            current = await client.get_page_by_id(page_id, expand=_COMPARE_EXPAND)
+            if current.matches(html):
+                logger.info("Skipping %s: page %s already up to date", path, page_id)
+                return PublishOutcome(
+                    path=path, action="skipped", status="success", detail="no-change"
+                )
             logger.info("Updating page %s from %s", page_id, path)
-            client.update_page(page_id=page_id, html_storage=html, title=mapping.get("title"))
+            await client.update_page(
+                page_id=page_id,
+                html_storage=html,
+                title=mapping.get("title") or current.title,
+                expected_version=current.version.number,
+            )
             return PublishOutcome(path=path, action="updated", status="success")
 
         space_key = mapping.get("space_key")
@@ -171,12 +353,28 @@ def _publish_single(
             return PublishOutcome(path=path, action="skipped", status="failure", detail=message)
 
         logger.info("Publishing %s to space=%s title=%s", path, space_key, title)
-        existing = client.get_page_by_title(space_key=space_key, title=title)
+        existing = existing_pages.get((space_key, title)) if existing_pages is not None else None
+        if existing is None:
+            # Batched search results only count as hits: the search index can lag behind
+            # recent edits, so a miss is confirmed with an authoritative title lookup
+            existing = await client.get_page_by_title(
+                space_key=space_key, title=title, expand=_COMPARE_EXPAND
+            )
         if existing:
-            client.update_page(page_id=existing.id, html_storage=html, title=title)
+            if existing.matches(html):
+                logger.info("Skipping %s: page %s already up to date", path, existing.id)
+                return PublishOutcome(
+                    path=path, action="skipped", status="success", detail="no-change"
+                )
+            await client.update_page(
+                page_id=existing.id,
+                html_storage=html,
+                title=title,
+                expected_version=existing.version.number,
+            )
             return PublishOutcome(path=path, action="updated", status="success")
 
-        client.create_page(space_key=space_key, title=title, html_storage=html)
+        await client.create_page(space_key=space_key, title=title, html_storage=html)
         return PublishOutcome(path=path, action="created", status="success")
 
     except ConfluenceAPIError as exc:  # pragma: no cover - defensive logging
@@ -185,19 +383,81 @@ def _publish_single(
     except (KeyboardInterrupt, SystemExit):
         raise
     except Exception as exc:  # pragma: no cover - defensive logging
-        logger.exception("Unexpected failure publishing %s (%s)", path, type(exc).__name__)
+        logger.error(
+            "Unexpected failure publishing %s (%s): %s",
+            path,
+            type(exc).__name__,
+            exc,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         return PublishOutcome(path=path, action="skipped", status="failure", detail=str(exc))
 
 
-def publish_documents(
+async def _prefetch_existing_pages(
+    client: AsyncConfluenceClient,
+    mappings: Sequence[MappingEntry],
+    logger: logging.Logger,
+) -> Dict[tuple[str, str], Page] | None:
+    """Look up all title-mapped pages with one batched search per space.
+
+    Returns ``None`` if any batch lookup fails, so callers fall back to per-document
+    lookups and report errors against the individual documents.
+    """
+
+    titles_by_space: Dict[str, List[str]] = {}
+    for mapping in mappings:
+        space_key = mapping.get("space_key")
+        title = mapping.get("title")
+        if not mapping.get("page_id") and space_key and title:
+            titles_by_space.setdefault(space_key, []).append(title)
+
+    spaces = list(titles_by_space)
+    try:
+        results = await asyncio.gather(
+            *(
+                client.get_pages_by_titles(
+                    space_key=space_key,
+                    titles=titles_by_space[space_key],
+                    expand=_COMPARE_EXPAND,
+                )
+                for space_key in spaces
+            )
+        )
+    except (ConfluenceAPIError, requests.RequestException) as exc:
+        logger.warning("Batched page lookup failed, looking up pages individually: %s", exc)
+        return None
+
+    return {
+        (space_key, title): page
+        for space_key, pages in zip(spaces, results)
+        for title, page in pages.items()
+    }
+
+
+async def publish_documents_async(
     paths: Sequence[Path | str],
     *,
     mapping_store: MappingStore | None = None,
     client: ConfluenceClient | None = None,
     converter: MarkdownToConfluenceConverter | None = None,
     dry_run: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> List[PublishOutcome]:
-    """Publish the given Markdown documents to Confluence.
+    """Publish the given Markdown documents to Confluence concurrently.
+
+    Paths are validated and resolved against the mapping store up front, and pages
+    mapped by title are looked up with one batched search per space in the background.
+    Documents then flow through a bounded read -> convert -> publish pipeline, so
+    reading one file, converting another and uploading a third overlap. Conversion uses
+    worker processes for larger batches (see :func:`convert_documents`), and at most
+    ``concurrency`` documents talk to Confluence at any one time.
+
+    Documents mapped to a ``page_id`` whose content hash matches the
+    ``last_published_hash`` recorded in the mapping are skipped without converting or
+    calling Confluence, and existing pages whose stored body already matches the
+    converted HTML are not updated. Read or conversion errors fail only the affected
+    document. Hashes of successfully published documents are written back to the
+    mapping store once all tasks finish.
 
     Args:
         paths: Iterable of filesystem paths to Markdown files.
@@ -205,19 +465,27 @@ def publish_documents(
         client: Optional Confluence client instance.
         converter: Optional converter instance.
         dry_run: If ``True`` the script will simulate publishing without API calls.
+        concurrency: Maximum number of documents published simultaneously.
 
     Returns:
-        List of :class:`PublishOutcome` entries describing the processing results.
+        List of :class:`PublishOutcome` entries in the same order as ``paths``.
     """
 
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
     logger = logging.getLogger("scripts.publish")
     mapping_store = mapping_store or MappingStore()
-    client = client or ConfluenceClient.from_env()
-    converter = converter or MarkdownToConfluenceConverter()
+    client = client or default_client()
+    converter = converter or default_converter()
+    async_client = AsyncConfluenceClient(client)
+    semaphore = asyncio.Semaphore(concurrency)
 
-    outcomes: List[PublishOutcome] = []
+    outcomes: List[PublishOutcome | None] = []
+    jobs: List[_PublishJob] = []
     # Enforce repository-root containment for any provided paths
     repo_root = find_repository_root()
+    index = mapping_store.index()
 
     for raw_path in paths:
         path = Path(raw_path)
@@ -250,7 +518,7 @@ def publish_documents(
             continue
 
         path = resolved
-        mapping = _resolve_mapping(mapping_store, path)
+        mapping = _lookup_mapping(mapping_store, index, path, repo_root)
         if not mapping:
             message = "No mapping found"
             logger.warning("%s for %s", message, original_path)
@@ -264,16 +532,145 @@ def publish_documents(
             )
             continue
 
-        outcome = _publish_single(
-            path=path,
-            mapping=mapping,
+        jobs.append(_PublishJob(len(outcomes), original_path, path, mapping))
+        outcomes.append(None)
+
+    prefetch = (
+        None
+        if dry_run
+        else asyncio.create_task(
+            _prefetch_existing_pages(async_client, [job.mapping for job in jobs], logger)
+        )
+    )
+    pool = ProcessPoolExecutor() if _use_process_pool(converter, len(jobs)) else None
+    converter_workers = (os.cpu_count() or 1) if pool else 1
+    to_convert: asyncio.Queue[tuple[_PublishJob, str] | None] = asyncio.Queue(PIPELINE_DEPTH)
+    to_publish: asyncio.Queue[tuple[_PublishJob, str] | None] = asyncio.Queue(PIPELINE_DEPTH)
+    publish_tasks: List[tuple[_PublishJob, asyncio.Task[PublishOutcome]]] = []
+
+    def fail(job: _PublishJob, stage: str, exc: Exception) -> None:
+        logger.error("Failed to %s %s: %s", stage, job.original_path, exc)
+        outcomes[job.index] = PublishOutcome(
+            path=job.original_path, action="skipped", status="failure", detail=str(exc)
+        )
+
+    async def read_stage() -> None:
+        try:
+            for job in jobs:
+                try:
+                    text = await load_markdown_async(job.path)
+                except (OSError, UnicodeDecodeError) as exc:
+                    fail(job, "read", exc)
+                    continue
+                job.digest = content_hash(text)
+                mapping = job.mapping
+                if mapping.get("page_id") and mapping.get("last_published_hash") == job.digest:
+                    logger.info("Skipping %s: unchanged since last publish", job.original_path)
+                    outcomes[job.index] = PublishOutcome(
+                        path=job.original_path,
+                        action="skipped",
+                        status="success",
+                        detail="unchanged",
+                    )
+                    continue
+                await to_convert.put((job, text))
+        finally:
+            for _ in range(converter_workers):
+                await to_convert.put(None)
+
+    async def convert_stage() -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while (item := await to_convert.get()) is not None:
+                job, text = item
+                try:
+                    if pool is not None:
+                        html = await loop.run_in_executor(pool, _convert_one, text)
+                    else:
+                        html = await asyncio.to_thread(converter.convert, text)
+                except Exception as exc:
+                    fail(job, "convert", exc)
+                    continue
+                # Release the Markdown source while the HTML waits for a publisher
+                del item, text
+                await to_publish.put((job, html))
+        finally:
+            await to_publish.put(None)
+
+    async def publish_stage() -> None:
+        existing_pages = await prefetch if prefetch is not None else None
+        finished_converters = 0
+        while finished_converters < converter_workers:
+            item = await to_publish.get()
+            if item is None:
+                finished_converters += 1
+                continue
+            job, html = item
+            task = asyncio.create_task(
+                _bounded(
+                    semaphore,
+                    _publish_single(
+                        path=job.path,
+                        mapping=job.mapping,
+                        html=html,
+                        client=async_client,
+                        existing_pages=existing_pages,
+                        dry_run=dry_run,
+                        logger=logger,
+                    ),
+                )
+            )
+            publish_tasks.append((job, task))
+        await asyncio.gather(*(task for _, task in publish_tasks))
+
+    try:
+        await asyncio.gather(
+            read_stage(), *(convert_stage() for _ in range(converter_workers)), publish_stage()
+        )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    published: Dict[str, str] = {}
+    for job, task in publish_tasks:
+        outcome = task.result()
+        if outcome.status == "success" and outcome.action != "dry-run":
+            published[str(job.path)] = job.digest
+        # Preserve the user-provided path for reporting consistency
+        outcome.path = job.original_path
+        outcomes[job.index] = outcome
+
+    if published:
+        mapping_store.record_published_hashes(published)
+
+    return [outcome for outcome in outcomes if outcome is not None]
+
+
+def publish_documents(
+    paths: Sequence[Path | str],
+    *,
+    mapping_store: MappingStore | None = None,
+    client: ConfluenceClient | None = None,
+    converter: MarkdownToConfluenceConverter | None = None,
+    dry_run: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> List[PublishOutcome]:
+    """Publish the given Markdown documents to Confluence.
+
+    Synchronous entry point for the development scripts; see
+    :func:`publish_documents_async` for the argument reference.
+
+    Returns:
+        List of :class:`PublishOutcome` entries describing the processing results.
+    """
+
+    return asyncio.run(
+        publish_documents_async(
+            paths,
+            mapping_store=mapping_store,
             client=client,
             converter=converter,
             dry_run=dry_run,
-            logger=logger,
+            concurrency=concurrency,
         )
-        # Preserve the user-provided path for reporting consistency
-        outcome.path = original_path
-        outcomes.append(outcome)
-
-    return outcomes
+    )
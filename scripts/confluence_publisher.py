@@ -12,34 +12,133 @@ import argparse
 import getpass
 import logging
 import os
+import re
 import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
 
 from confluence_markdown.confluence_api import (
     ConfluenceAPIError,
     ConfluenceClient,
     NotFoundError,
+    Page,
+)
+from scripts.common import (
+    convert_documents,
+    create_page_title,
+    default_converter,
+    find_repository_root,
+    load_markdown,
 )
-from confluence_markdown.converter import MarkdownToConfluenceConverter
-from scripts.common import create_page_title, find_repository_root
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regular expression source string.
+
+    ``**`` spans directory separators and ``*`` and ``?`` stay within a single path
+    segment. Like ``PurePath.match``, patterns match at the end of the path, so
+    ``venv/**`` also excludes ``pkg/venv/...`` and ``docs/*.md`` includes
+    ``sub/docs/a.md``.
+    """
+    parts = ["(?:.*/)?"]
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(parts)
+
+
+def _compile_globs(patterns: Iterable[str]) -> "re.Pattern[str]":
+    """Compile glob patterns into a single regex to ``fullmatch`` against POSIX paths."""
+    return re.compile("|".join(f"(?:{_glob_to_regex(pattern)})" for pattern in patterns))
+
+
+def _compile_dir_globs(patterns: Iterable[str]) -> "re.Pattern[str]":
+    """Compile the ``dir/**`` patterns into one regex matching wholly excluded directories."""
+    sources = [
+        _glob_to_regex(pattern)[: -len("/.*")] for pattern in patterns if pattern.endswith("/**")
+    ]
+    return re.compile("|".join(f"(?:{source})" for source in sources) or "(?!)")
+
+
+def _iter_markdown(
+    root: Path, prune_re: Optional["re.Pattern[str]"] = None
+) -> Iterator[Tuple[Path, str]]:
+    """Yield ``(path, relative POSIX path)`` for every ``.md`` file below ``root``.
+
+    Walks with ``os.scandir`` and an explicit stack, relying on the cached ``DirEntry``
+    type information instead of a ``stat`` per entry. Directories whose relative path
+    matches ``prune_re`` are never entered.
+    """
+    stack = [(str(root), "")]
+    while stack:
+        top, prefix = stack.pop()
+        try:
+            entries = os.scandir(top)
+        except OSError:
+            # Unreadable directories are skipped, matching os.walk/rglob behaviour
+            continue
+        with entries:
+            for entry in entries:
+                relative = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if prune_re is None or not prune_re.fullmatch(relative):
+                        stack.append((entry.path, relative + "/"))
+                elif entry.name.endswith(".md"):
+                    yield Path(entry.path), relative
+
+
 class ConfluencePublisher:
     """Enhanced Confluence publisher with interactive features and robust error handling."""
 
+    # Default exclude patterns
+    _EXCLUDE_PATTERNS = (
+        "tests/golden_corpus/**",  # Test files
+        ".git/**",  # Git metadata
+        "htmlcov/**",  # Coverage reports
+        ".venv/**",  # Virtual environment
+        "venv/**",  # Alternative venv name
+        ".pytest_cache/**",  # Pytest cache
+        "**/.pytest_cache/**",  # Pytest cache in subdirs
+        "**/node_modules/**",  # Node modules
+        "**/__pycache__/**",  # Python cache
+        "**/.tox/**",  # Tox environments
+        "**/build/**",  # Build directories
+        "**/dist/**",  # Distribution directories
+    )
+
+    # Number of --dry-run files whose status lines are buffered before printing
+    _REPORT_EVERY = 50
+
     def __init__(self, base_url: str, space_key: str, parent_page_id: str):
         """Initialize the publisher with Confluence connection details."""
         self.base_url = base_url
         self.space_key = space_key
         self.parent_page_id = parent_page_id
         self.client: Optional[ConfluenceClient] = None
-        self.converter = MarkdownToConfluenceConverter()
+        self.converter = default_converter()
         self.repo_root = find_repository_root(Path(__file__).resolve().parent)
+        self._exclude_re = _compile_globs(self._EXCLUDE_PATTERNS)
+        self._prune_re = _compile_dir_globs(self._EXCLUDE_PATTERNS)
 
     def setup_credentials(self, email: str = None, token: str = None) -> bool:
         """Setup Confluence credentials either from parameters or interactive input."""
@@ -96,35 +195,18 @@ class ConfluencePublisher:
         repo_root = self.repo_root
         markdown_files = []
 
-        # Default exclude patterns
-        exclude_patterns = [
-            "tests/golden_corpus/**",  # Test files
-            ".git/**",  # Git metadata
-            "htmlcov/**",  # Coverage reports
-            ".venv/**",  # Virtual environment
-            "venv/**",  # Alternative venv name
-            ".pytest_cache/**",  # Pytest cache
-            "**/.pytest_cache/**",  # Pytest cache in subdirs
-            "**/node_modules/**",  # Node modules
-            "**/__pycache__/**",  # Python cache
-            "**/.tox/**",  # Tox environments
-            "**/build/**",  # Build directories
-            "**/dist/**",  # Distribution directories
-        ]
-
-        for md_file in repo_root.rglob("*.md"):
-            relative_path = md_file.relative_to(repo_root)
-
-            include_match = False
-            if include_patterns:
-                include_match = any(relative_path.match(pattern) for pattern in include_patterns)
-                if not include_match:
-                    continue
+        exclude_re = self._exclude_re
+        include_re = _compile_globs(include_patterns) if include_patterns else None
+        # Included files bypass the excludes, so whole directories can only be skipped
+        # when there are no include patterns.
+        prune_re = None if include_re else self._prune_re
 
-            if not include_match:
-                should_exclude = any(relative_path.match(pattern) for pattern in exclude_patterns)
-                if should_exclude:
+        for md_file, relative_path in _iter_markdown(repo_root, prune_re):
+            if include_re is not None:
+                if not include_re.fullmatch(relative_path):
                     continue
+            elif exclude_re.fullmatch(relative_path):
+                continue
 
             markdown_files.append(md_file)
 
@@ -140,29 +222,53 @@ class ConfluencePublisher:
 
         print(f"\n📤 {'Previewing' if dry_run else 'Publishing'} {len(markdown_files)} files...")
 
+        titles = {
+            md_file: create_page_title(md_file, repo_root=self.repo_root)
+            for md_file in markdown_files
+        }
+        htmls = {} if dry_run else self._convert_all(markdown_files)
+        existing_pages = None if dry_run else self._lookup_existing_pages(titles.values())
+
+        # A dry run touches no network, so its status lines are printed in batches; a real
+        # publish prints each file as soon as its round trips finish
+        report: List[str] = []
+
+        def flush_report() -> None:
+            if report:
+                print("\n".join(report))
+                report.clear()
+
+        root_prefix = str(self.repo_root) + os.sep
         for i, md_file in enumerate(markdown_files, 1):
+            md_str = str(md_file)
+            relative_path = md_str[len(root_prefix) :] if md_str.startswith(root_prefix) else md_str
             try:
-                relative_path = md_file.relative_to(self.repo_root)
-                print(f"\n[{i}/{len(markdown_files)}] 📝 {relative_path}")
+                report.append(f"\n[{i}/{len(markdown_files)}] 📝 {relative_path}")
 
                 # Create page title
-                page_title = create_page_title(md_file, repo_root=self.repo_root)
+                page_title = titles[md_file]
 
                 if dry_run:
-                    print(f"   📋 Would create/update: '{page_title}'")
+                    report.append(f"   📋 Would create/update: '{page_title}'")
                     success_count += 1
                     continue
 
-                # Convert markdown to Confluence format
-                with open(md_file, encoding="utf-8") as f:
-                    markdown_content = f.read()
-                confluence_html = self.converter.convert(markdown_content)
+                # Use the batch conversion; convert here only if the batch failed
+                confluence_html = htmls.get(md_file)
+                if confluence_html is None:
+                    confluence_html = self.converter.convert(load_markdown(md_file))
 
                 # Check if page already exists and publish
                 try:
-                    existing_page = self.client.get_page_by_title(
-                        space_key=self.space_key, title=page_title
+                    existing_page = (
+                        existing_pages.get(page_title) if existing_pages is not None else None
                     )
+                    if existing_page is None:
+                        # Batched search results only count as hits: the search index can
+                        # lag behind recent edits, so misses are confirmed individually
+                        existing_page = self.client.get_page_by_title(
+                            space_key=self.space_key, title=page_title
+                        )
                 except NotFoundError:
                     existing_page = None
                 except ConfluenceAPIError as lookup_error:
@@ -175,7 +281,7 @@ class ConfluencePublisher:
                         html_storage=confluence_html,
                         title=page_title,
                     )
-                    print(f"   ✅ Updated: {page_title}")
+                    report.append(f"   ✅ Updated: {page_title}")
                 else:
                     self.client.create_page(
                         space_key=self.space_key,
@@ -184,17 +290,45 @@ class ConfluencePublisher:
                         parent_id=self.parent_page_id,
                         labels=["documentation", "confluence-markdown", "auto-generated"],
                     )
-                    print(f"   ✅ Created: {page_title}")
+                    report.append(f"   ✅ Created: {page_title}")
 
                 success_count += 1
 
             except Exception as e:
-                print(f"   ❌ Failed: {e}")
-                logger.exception(f"Failed to process {relative_path}")
+                report.append(f"   ❌ Failed: {e}")
+                flush_report()
+                logger.error(
+                    "Failed to process %s: %s",
+                    relative_path,
+                    e,
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
                 error_count += 1
 
+            finally:
+                if not dry_run or i % self._REPORT_EVERY == 0:
+                    flush_report()
+
+        flush_report()
+
         return success_count, error_count
 
+    def _convert_all(self, markdown_files: List[Path]) -> Dict[Path, str]:
+        """Convert all files up front; on failure, fall back to per-file conversion."""
+        try:
+            return convert_documents(markdown_files, converter=self.converter)
+        except Exception as e:
+            logger.warning("Batch conversion failed, converting files individually: %s", e)
+            return {}
+
+    def _lookup_existing_pages(self, titles: Iterable[str]) -> Optional[Dict[str, Page]]:
+        """Batch-look up pages by title; ``None`` means fall back to per-file lookups."""
+        try:
+            return self.client.get_pages_by_titles(space_key=self.space_key, titles=titles)
+        except (ConfluenceAPIError, requests.RequestException) as e:
+            logger.warning("Batched page lookup failed, looking up pages individually: %s", e)
+            return None
+
     def print_summary(self, success_count: int, error_count: int, dry_run: bool = False):
         """Print publishing summary."""
         print(f"\n🎉 {'Preview' if dry_run else 'Publishing'} complete!")
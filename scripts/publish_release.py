@@ -8,10 +8,11 @@ This script automatically publishes release notes to Confluence
 when a new GitHub release is created.
 """
 
+import base64
 import html
-import json
 import re
 import sys
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import urlparse
 
@@ -27,6 +28,25 @@ else:
     except ImportError:
         from requests.packages.urllib3.util.retry import Retry  # type: ignore
 
+# Markdown patterns used by ConfluencePublisher._convert_markdown_to_confluence,
+# compiled once at import time
+_RE_FENCE = re.compile(r"```(\w+)?\n(.*?)\n```", re.DOTALL)
+_RE_INLINE_CODE = re.compile(r"`([^`]+)`")
+_RE_HEADER = re.compile(r"^(#{1,3}) (.*)", re.MULTILINE)
+_RE_LI = re.compile(r"^- (.*)", re.MULTILINE)
+_RE_UL = re.compile(r"(<li>.*</li>\n)+", re.DOTALL)
+_RE_BOLD = re.compile(r"\*\*(.*?)\*\*")
+_RE_ITALIC = re.compile(r"\*([^*]+)\*")
+_RE_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_RE_LINE_TRIM = re.compile(r"^[^\S\n]+|[^\S\n]+$", re.MULTILINE)
+_RE_PARAGRAPH = re.compile(r"^(?!<|__CODE_BLOCK_)(.+)$", re.MULTILINE)
+
+
+def _header_replacement(match: re.Match[str]) -> str:
+    """Render an ATX header match as the <hN> tag matching its number of '#' characters."""
+    level = len(match.group(1))
+    return f"<h{level}>{match.group(2)}</h{level}>"
+
 
 class ConfluencePublisher:
     """Publishes release notes to Confluence."""
@@ -63,33 +83,46 @@ class ConfluencePublisher:
                 "(URL, user, token, and space are required)"
             )
 
+        auth_b64 = base64.b64encode(
+            f"{self.confluence_user}:{self.confluence_token}".encode("ascii")
+        ).decode("ascii")
+        self._headers = {
+            "Authorization": f"Basic {auth_b64}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+        # Created on first use and reused so every API call shares one keep-alive connection
+        self._session: Optional[requests.Session] = None
+
     def get_auth_headers(self) -> dict[str, str]:
         """
         Return HTTP headers configured for Confluence REST API requests.
 
+        The headers are built once during initialization; a copy is returned so callers can
+        modify it freely.
+
         Returns:
             Dict[str, str]: Headers including an HTTP Basic `Authorization` header (built from the configured Confluence user and token) and JSON `Content-Type`/`Accept` headers.
         """
-        import base64
-
-        auth_string = f"{self.confluence_user}:{self.confluence_token}"
-        auth_bytes = auth_string.encode("ascii")
-        auth_b64 = base64.b64encode(auth_bytes).decode("ascii")
-
-        return {
-            "Authorization": f"Basic {auth_b64}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        return dict(self._headers)
 
     def get_session(self) -> requests.Session:
         """
-        Create a requests session with retry logic and timeout configuration.
+        Return the publisher's requests session, creating it on first use.
+
+        The session carries the authentication headers and a retry strategy, and is reused
+        for every Confluence API call so HTTP keep-alive avoids a new TCP/TLS handshake per
+        request.
 
         Returns:
-            requests.Session: Session configured with retry strategy for resilient HTTP requests.
+            requests.Session: Session configured with auth headers and retry strategy for resilient HTTP requests.
         """
+        if self._session is not None:
+            return self._session
+
         session = requests.Session()
+        session.headers.update(self.get_auth_headers())
         retry: Retry = Retry(
             total=3,
             backoff_factor=1,
@@ -99,8 +132,33 @@ class ConfluencePublisher:
         adapter = HTTPAdapter(max_retries=retry)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
+        self._session = session
         return session
 
+    def _request(self, method: str, url: str, *, decode: bool = True, **kwargs: Any) -> Any:
+        """
+        Send a Confluence REST API request on the shared session and decode the JSON reply.
+
+        Parameters:
+            method: HTTP method name ("get", "post" or "put").
+            url: Absolute request URL.
+            decode: Whether to decode the reply body; callers that ignore the body pass
+                False so an empty or non-JSON 2xx reply still counts as success.
+            **kwargs: Passed through to the session method (e.g. `params`, `json`).
+
+        Returns:
+            Any: The decoded JSON body of a successful (2xx) response, or None when
+                `decode` is False.
+
+        Raises:
+            requests.HTTPError: If the response status is not 2xx; the message carries the
+                status code and response text.
+        """
+        response = getattr(self.get_session(), method)(url, timeout=30, **kwargs)
+        if response.status_code // 100 != 2:
+            raise requests.HTTPError(f"{response.status_code} - {response.text}", response=response)
+        return response.json() if decode else None
+
     def create_confluence_content(self, title: str, version: str, release_notes: str) -> str:
         """
         Build Confluence storage-format HTML for a release page including header, release notes, installation snippet, and metadata.
@@ -170,52 +228,53 @@ pip install confluence-markdown=={version.lstrip("v")}
             str: Converted string in Confluence storage format.
         """
         # Store code blocks temporarily to protect them during processing
-        code_blocks: list[str] = []
+        code_blocks: list[tuple[str, str]] = []
 
         def store_code_block(match: re.Match[str]) -> str:
             """
             Store a matched fenced code block and return a placeholder token.
 
             Parameters:
-                match (re.Match[str]): A regex Match object representing a fenced code block. The entire matched text (match.group(0)) is appended to the module-level `code_blocks` list.
+                match (re.Match[str]): A regex Match object representing a fenced code block. Its language (defaulting to "text") and content are appended to the `code_blocks` list.
 
             Returns:
                 str: A placeholder token of the form "__CODE_BLOCK_{n}__" where n is the index of the stored block in `code_blocks`.
 
             Side effects:
-                Appends the matched code block text to the `code_blocks` list in the enclosing scope.
+                Appends a `(language, content)` tuple to the `code_blocks` list in the enclosing scope.
             """
-            code_blocks.append(match.group(0))
+            code_blocks.append((match.group(1) or "text", match.group(2)))
             return f"__CODE_BLOCK_{len(code_blocks) - 1}__"
 
         # Extract and store fenced code blocks first (before HTML escaping)
-        markdown = re.sub(
-            r"```(\w+)?\n(.*?)\n```",
-            store_code_block,
-            markdown,
-            flags=re.DOTALL,
-        )
+        markdown = _RE_FENCE.sub(store_code_block, markdown)
 
         # Escape HTML special characters to prevent XSS and format issues
         markdown = html.escape(markdown)
 
+        # Each pass below is guarded by a substring check so plain-text notes skip the
+        # regex scan entirely when the markup cannot occur
+
         # Convert inline code blocks (after escaping, since backticks are safe)
-        markdown = re.sub(r"`([^`]+)`", r"<code>\1</code>", markdown)
+        if "`" in markdown:
+            markdown = _RE_INLINE_CODE.sub(r"<code>\1</code>", markdown)
 
         # Convert headers
-        markdown = re.sub(r"^### (.*)", r"<h3>\1</h3>", markdown, flags=re.MULTILINE)
-        markdown = re.sub(r"^## (.*)", r"<h2>\1</h2>", markdown, flags=re.MULTILINE)
-        markdown = re.sub(r"^# (.*)", r"<h1>\1</h1>", markdown, flags=re.MULTILINE)
+        if "# " in markdown:
+            markdown = _RE_HEADER.sub(_header_replacement, markdown)
 
         # Convert lists
-        markdown = re.sub(r"^- (.*)", r"<li>\1</li>", markdown, flags=re.MULTILINE)
-        markdown = re.sub(r"(<li>.*</li>\n)+", r"<ul>\g<0></ul>", markdown, flags=re.DOTALL)
+        if "- " in markdown:
+            markdown = _RE_LI.sub(r"<li>\1</li>", markdown)
+            markdown = _RE_UL.sub(r"<ul>\g<0></ul>", markdown)
 
-        # Convert bold
-        markdown = re.sub(r"\*\*(.*?)\*\*", r"<strong>\1</strong>", markdown)
+        if "*" in markdown:
+            # Convert bold
+            if "**" in markdown:
+                markdown = _RE_BOLD.sub(r"<strong>\1</strong>", markdown)
 
-        # Convert italic
-        markdown = re.sub(r"\*([^*]+)\*", r"<em>\1</em>", markdown)
+            # Convert italic
+            markdown = _RE_ITALIC.sub(r"<em>\1</em>", markdown)
 
         # Convert links with security filtering
         def secure_link_replacement(match: re.Match[str]) -> str:
@@ -259,35 +318,23 @@ pip install confluence-markdown=={version.lstrip("v")}
                 # Dangerous scheme - return only the link text (safely escaped)
                 return html.escape(link_text)
 
-        markdown = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", secure_link_replacement, markdown)
-
-        # Convert paragraphs (but skip lines that are already HTML or empty)
-        lines = markdown.split("\n")
-        result: list[str] = []
+        if "](" in markdown:
+            markdown = _RE_LINK.sub(secure_link_replacement, markdown)
 
-        for line in lines:
-            line = line.strip()
-
-            # Only wrap in paragraphs if not already HTML and not a placeholder
-            if line and not line.startswith("<") and not line.startswith("__CODE_BLOCK_"):
-                line = f"<p>{line}</p>"
-            result.append(line)
+        # Convert paragraphs: trim every line, then wrap the non-empty ones that are
+        # not already HTML or a code block placeholder
+        final_result = _RE_LINE_TRIM.sub("", markdown)
+        final_result = _RE_PARAGRAPH.sub(r"<p>\1</p>", final_result)
 
         # Restore code blocks with proper Confluence format
-        final_result = "\n".join(result)
-        for i, code_block in enumerate(code_blocks):
-            # Parse the original code block to extract language and content
-            match = re.match(r"```(\w+)?\n(.*?)\n```", code_block, re.DOTALL)
-            if match:
-                language = match.group(1) or "text"
-                content = match.group(2)
-                confluence_code = (
-                    f'<ac:structured-macro ac:name="code" ac:schema-version="1">'
-                    f'<ac:parameter ac:name="language">{language}</ac:parameter>'
-                    f"<ac:plain-text-body><![CDATA[{content}]]></ac:plain-text-body>"
-                    f"</ac:structured-macro>"
-                )
-                final_result = final_result.replace(f"__CODE_BLOCK_{i}__", confluence_code)
+        for i, (language, content) in enumerate(code_blocks):
+            confluence_code = (
+                f'<ac:structured-macro ac:name="code" ac:schema-version="1">'
+                f'<ac:parameter ac:name="language">{language}</ac:parameter>'
+                f"<ac:plain-text-body><![CDATA[{content}]]></ac:plain-text-body>"
+                f"</ac:structured-macro>"
+            )
+            final_result = final_result.replace(f"__CODE_BLOCK_{i}__", confluence_code)
 
         return final_result
 
@@ -298,15 +345,13 @@ pip install confluence-markdown=={version.lstrip("v")}
         Returns:
             str: Current date in "Month Day, Year" format.
         """
-        from datetime import datetime
-
         return datetime.now().strftime("%B %d, %Y")
 
     def find_parent_page_id(self) -> Optional[str]:
         """
         Return the Confluence page ID of the configured parent page, or None.
 
-        If a parent page title was configured (CONFLUENCE_PARENT_PAGE) this method queries the Confluence REST API for a page with that title in the configured space and returns its id as a string when found. Returns None if no parent page is configured, if no matching page is found, or if the API request does not return a successful (200) response.
+        If a parent page title was configured (CONFLUENCE_PARENT_PAGE) this method queries the Confluence REST API for a page with that title in the configured space and returns its id as a string when found. Returns None if no parent page is configured, if no matching page is found, or if the API request does not return a successful (2xx) response.
         """
         if not self.confluence_parent_page:
             return None
@@ -318,13 +363,13 @@ pip install confluence-markdown=={version.lstrip("v")}
             "expand": "version",
         }
 
-        session = self.get_session()
-        response = session.get(url, headers=self.get_auth_headers(), params=params, timeout=30)
+        try:
+            data = self._request("get", url, params=params)
+        except requests.HTTPError:
+            return None
 
-        if response.status_code == 200:
-            data = response.json()
-            if data["results"]:
-                return str(data["results"][0]["id"])
+        if data["results"]:
+            return str(data["results"][0]["id"])
 
         return None
 
@@ -381,7 +426,7 @@ pip install confluence-markdown=={version.lstrip("v")}
         """
         Return the first Confluence page matching the given title in the configured space, or None if not found.
 
-        Performs a GET to the Confluence REST API (/rest/api/content) with the title and spaceKey, requesting the `version` expansion. If the request is successful and results are present, returns the first page as a dict (including expanded `version` info). Returns None on non-200 responses or when no matching page exists.
+        Performs a GET to the Confluence REST API (/rest/api/content) with the title and spaceKey, requesting the `version` expansion. If the request is successful and results are present, returns the first page as a dict (including expanded `version` info). Returns None on non-2xx responses or when no matching page exists.
         """
         url = f"{self.confluence_url}/rest/api/content"
         params = {
@@ -390,13 +435,13 @@ pip install confluence-markdown=={version.lstrip("v")}
             "expand": "version",
         }
 
-        session = self.get_session()
-        response = session.get(url, headers=self.get_auth_headers(), params=params, timeout=30)
+        try:
+            data = self._request("get", url, params=params)
+        except requests.HTTPError:
+            return None
 
-        if response.status_code == 200:
-            data = response.json()
-            if data["results"]:
-                return dict(data["results"][0])
+        if data["results"]:
+            return dict(data["results"][0])
 
         return None
 
@@ -407,7 +452,7 @@ pip install confluence-markdown=={version.lstrip("v")}
         If a parent page is configured, the new page will be created as a child of that parent. Performs an HTTP POST to the Confluence content endpoint with the provided title and storage-format content, and prints a success or failure message.
 
         Returns:
-            bool: True if the page was created (HTTP 200), False otherwise.
+            bool: True if the page was created (any 2xx status), False otherwise.
         """
         url = f"{self.confluence_url}/rest/api/content"
 
@@ -423,19 +468,16 @@ pip install confluence-markdown=={version.lstrip("v")}
         if parent_id:
             page_data["ancestors"] = [{"id": parent_id}]  # type: ignore
 
-        session = self.get_session()
-        response = session.post(
-            url, headers=self.get_auth_headers(), data=json.dumps(page_data), timeout=30
-        )
-        if response.status_code // 100 == 2:  # Accept any 2xx success code
-            page_info = response.json()
-            page_url = f"{self.confluence_url}/pages/viewpage.action?pageId={page_info['id']}"
-            print(f"✅ Created Confluence page: {page_url}")
-            return True
-        else:
-            print(f"❌ Failed to create page: {response.status_code} - {response.text}")
+        try:
+            page_info = self._request("post", url, json=page_data)
+        except requests.HTTPError as e:
+            print(f"❌ Failed to create page: {e}")
             return False
 
+        page_url = f"{self.confluence_url}/pages/viewpage.action?pageId={page_info['id']}"
+        print(f"✅ Created Confluence page: {page_url}")
+        return True
+
     def _update_page(self, page_id: str, title: str, content: str, current_version: int) -> bool:
         """
         Update an existing Confluence page by sending a PUT request that increments its version.
@@ -450,7 +492,7 @@ pip install confluence-markdown=={version.lstrip("v")}
             current_version: Current numeric page version; the request will publish version current_version + 1.
 
         Returns:
-            True if the HTTP update succeeded (status code 200), False otherwise.
+            True if the HTTP update succeeded (any 2xx status), False otherwise.
         """
         url = f"{self.confluence_url}/rest/api/content/{page_id}"
 
@@ -461,19 +503,16 @@ pip install confluence-markdown=={version.lstrip("v")}
             "body": {"storage": {"value": content, "representation": "storage"}},
         }
 
-        session = self.get_session()
-        response = session.put(
-            url, headers=self.get_auth_headers(), data=json.dumps(page_data), timeout=30
-        )
-
-        if response.status_code // 100 == 2:  # Accept any 2xx success code
-            page_url = f"{self.confluence_url}/pages/viewpage.action?pageId={page_id}"
-            print(f"✅ Updated Confluence page: {page_url}")
-            return True
-        else:
-            print(f"❌ Failed to update page: {response.status_code} - {response.text}")
+        try:
+            self._request("put", url, decode=False, json=page_data)
+        except requests.HTTPError as e:
+            print(f"❌ Failed to update page: {e}")
             return False
 
+        page_url = f"{self.confluence_url}/pages/viewpage.action?pageId={page_id}"
+        print(f"✅ Updated Confluence page: {page_url}")
+        return True
+
 
 def main() -> None:
     """
@@ -2,49 +2,78 @@
 """Simple script to push core markdown documentation to Confluence."""
 
 import argparse
+import asyncio
 import getpass
+import json
 import logging
+import os
 import sys
 from pathlib import Path
 
-# Add src to path for imports (repo root src, not scripts/src)
+import requests
+
+# Add src to path for imports (repo root src, not scripts/src) when run as a script;
+# importers already have the package on their path
 SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR.parent / "src"))
+if __name__ == "__main__":
+    sys.path.insert(0, str(SCRIPT_DIR.parent / "src"))
 
 from confluence_markdown.confluence_api import (  # noqa: E402
+    AsyncConfluenceClient,
     ConfluenceAPIError,
     ConfluenceClient,
     NotFoundError,
 )
-from confluence_markdown.converter import MarkdownToConfluenceConverter  # noqa: E402
-from scripts.common import create_page_title, find_repository_root  # noqa: E402
+from scripts.common import (  # noqa: E402
+    DEFAULT_CONCURRENCY,
+    content_hash,
+    create_page_title,
+    default_converter,
+    find_repository_root,
+    load_markdown,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Per-file record of the last pushed content hash and resulting page version
+PUSH_CACHE_FILE = ".confluence-push-cache.json"
+
 
 def get_credentials():
-    """Get Confluence credentials from user input."""
+    """Get Confluence credentials from the environment, prompting for any that are missing.
+
+    CMT_CONF_EMAIL and CMT_CONF_TOKEN are read first, falling back to CONFLUENCE_USER and
+    CONFLUENCE_TOKEN (the same names ConfluenceClient.from_env accepts), so automated runs
+    never block on a prompt.
+    """
+    email = (os.getenv("CMT_CONF_EMAIL") or os.getenv("CONFLUENCE_USER") or "").strip()
+    token = (os.getenv("CMT_CONF_TOKEN") or os.getenv("CONFLUENCE_TOKEN") or "").strip()
+    if email and token:
+        return email, token
+
     print("🔐 Confluence Credentials Setup")
     print("=" * 50)
 
-    email = input("Enter your Confluence email: ").strip()
     if not email:
-        print("❌ Email is required")
-        sys.exit(1)
-
-    print("\n📖 API Token Instructions:")
-    print("   1. Go to https://id.atlassian.com/manage-profile/security/api-tokens")
-    print("   2. Click 'Create API token'")
-    print("   3. Give it a label like 'Confluence Markdown'")
-    print("   4. Copy the token and paste it below")
-    print()
+        email = input("Enter your Confluence email: ").strip()
+        if not email:
+            print("❌ Email is required")
+            sys.exit(1)
 
-    token = getpass.getpass("Enter your API token (hidden input): ").strip()
     if not token:
-        print("❌ API token is required")
-        sys.exit(1)
+        print("\n📖 API Token Instructions:")
+        print("   1. Go to https://id.atlassian.com/manage-profile/security/api-tokens")
+        print("   2. Click 'Create API token'")
+        print("   3. Give it a label like 'Confluence Markdown'")
+        print("   4. Copy the token and paste it below")
+        print()
+
+        token = getpass.getpass("Enter your API token (hidden input): ").strip()
+        if not token:
+            print("❌ API token is required")
+            sys.exit(1)
 
     return email, token
 
@@ -90,11 +119,31 @@ def get_core_markdown_files():
     return sorted(markdown_files)
 
 
-def convert_markdown_to_confluence(md_file_path):
-    """Convert a markdown file to Confluence storage format."""
+def load_push_cache(cache_path):
+    """Load the push cache, returning an empty cache if it is missing or unreadable."""
     try:
-        with open(md_file_path, encoding="utf-8") as f:
-            markdown_content = f.read()
+        cache = json.loads(Path(cache_path).read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable push cache %s: %s", cache_path, e)
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_push_cache(cache_path, cache):
+    """Write the push cache atomically so an interrupted run cannot corrupt it."""
+    cache_path = Path(cache_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    tmp_path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def read_markdown(md_file_path):
+    """Read a markdown file, re-raising read errors with the file path for context."""
+    try:
+        # One sized read and decode instead of buffered text-mode reads
+        markdown_content = load_markdown(Path(md_file_path))
     except FileNotFoundError as e:
         msg = f"Markdown file not found: {md_file_path}"
         logger.error("%s: %s", msg, e)
@@ -110,14 +159,165 @@ def convert_markdown_to_confluence(md_file_path):
         logger.exception("Unexpected error reading markdown file '%s': %s", md_file_path, e)
         raise
 
-    converter = MarkdownToConfluenceConverter()
+    return markdown_content
+
+
+def convert_markdown_to_confluence(md_file_path, converter=None):
+    """Convert a markdown file to Confluence storage format.
+
+    Args:
+        md_file_path: Path to the markdown file.
+        converter: Converter to use; defaults to the process-wide shared instance.
+    """
+    markdown_content = read_markdown(md_file_path)
+    if converter is None:
+        converter = default_converter()
     confluence_html = converter.convert(markdown_content)
     return confluence_html
 
 
+async def push_one(
+    client,
+    md_file,
+    *,
+    space_key,
+    parent_page_id,
+    repo_root,
+    existing_pages=None,
+    cache=None,
+):
+    """Convert one markdown file and create or update its Confluence page.
+
+    Args:
+        existing_pages: Optional title -> page map from a batched lookup; titles it does
+            not contain (or all titles, when omitted) are looked up individually.
+        cache: Optional push cache (relative path -> [content hash, page version]). Files
+            whose content and remote page version match their entry are skipped, and
+            entries are refreshed after each successful push.
+
+    Returns:
+        The status line to print for the file.
+    """
+    markdown_content = await asyncio.to_thread(read_markdown, md_file)
+    digest = content_hash(markdown_content)
+    cache_key = md_file.relative_to(repo_root).as_posix()
+    page_title = create_page_title(md_file, repo_root=repo_root)
+
+    existing_page = existing_pages.get(page_title) if existing_pages is not None else None
+    if existing_page is None:
+        # Batched search results only count as hits: the search index can lag behind
+        # recent edits, so a miss is confirmed with an authoritative title lookup
+        try:
+            existing_page = await client.get_page_by_title(space_key=space_key, title=page_title)
+        except NotFoundError:
+            existing_page = None
+        except ConfluenceAPIError as exc:  # pragma: no cover - defensive log path
+            logger.exception("Failed to look up page '%s': %s", page_title, exc)
+            raise
+
+    if (
+        cache is not None
+        and existing_page
+        and cache.get(cache_key) == [digest, existing_page.version.number]
+    ):
+        return f"⏭️  Unchanged: {page_title}"
+
+    confluence_html = await asyncio.to_thread(default_converter().convert, markdown_content)
+
+    if existing_page:
+        page = await client.update_page(
+            page_id=existing_page.id,
+            html_storage=confluence_html,
+            title=page_title,
+            parent_id=parent_page_id,
+        )
+        status = f"✅ Updated: {page_title}"
+    else:
+        page = await client.create_page(
+            space_key=space_key,
+            title=page_title,
+            html_storage=confluence_html,
+            parent_id=parent_page_id,
+            labels=["documentation", "confluence-markdown", "auto-generated"],
+        )
+        status = f"✅ Created: {page_title}"
+
+    if cache is not None:
+        cache[cache_key] = [digest, page.version.number]
+    return status
+
+
+async def push_files(
+    client,
+    markdown_files,
+    *,
+    space_key,
+    parent_page_id,
+    repo_root,
+    concurrency=DEFAULT_CONCURRENCY,
+    cache_path=None,
+):
+    """Push ``markdown_files`` with up to ``concurrency`` files in flight at once.
+
+    Existing pages are discovered with one batched CQL title search up front, falling back
+    to per-file lookups if the search fails. Each file's create/update round-trips overlap
+    with the others; a failure is reported for that file only. When ``cache_path`` is
+    given, unchanged files are skipped and the cache is rewritten after the run.
+
+    Returns:
+        Tuple of (success_count, error_count).
+    """
+    async_client = AsyncConfluenceClient(client)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    total = len(markdown_files)
+
+    titles = [create_page_title(md_file, repo_root=repo_root) for md_file in markdown_files]
+    try:
+        existing_pages = await async_client.get_pages_by_titles(space_key=space_key, titles=titles)
+    except (ConfluenceAPIError, requests.RequestException) as exc:
+        logger.warning("Batched page lookup failed, looking up pages individually: %s", exc)
+        existing_pages = None
+
+    cache = load_push_cache(cache_path) if cache_path is not None else None
+
+    async def run(i, md_file):
+        relative_path = md_file.relative_to(repo_root)
+        async with semaphore:
+            try:
+                status = await push_one(
+                    async_client,
+                    md_file,
+                    space_key=space_key,
+                    parent_page_id=parent_page_id,
+                    repo_root=repo_root,
+                    existing_pages=existing_pages,
+                    cache=cache,
+                )
+            except Exception as e:
+                print(f"\n[{i}/{total}] 📝 {relative_path}\n   ❌ Failed: {e}")
+                logger.exception("Failed to process %s", relative_path)
+                return False
+        print(f"\n[{i}/{total}] 📝 {relative_path}\n   {status}")
+        return True
+
+    results = await asyncio.gather(
+        *(run(i, md_file) for i, md_file in enumerate(markdown_files, 1))
+    )
+    if cache is not None:
+        save_push_cache(cache_path, cache)
+    success_count = sum(results)
+    return success_count, total - success_count
+
+
 def main():
     """Main function to push core markdown files to Confluence."""
-    parser = argparse.ArgumentParser(description="Push core markdown documentation to Confluence.")
+    parser = argparse.ArgumentParser(
+        description="Push core markdown documentation to Confluence.",
+        epilog=(
+            "Credentials are read from CMT_CONF_EMAIL and CMT_CONF_TOKEN (or CONFLUENCE_USER "
+            "and CONFLUENCE_TOKEN) when set; otherwise you are prompted for them."
+        ),
+    )
     parser.add_argument(
         "--base-url",
         required=True,
@@ -133,6 +333,12 @@ def main():
         required=True,
         help="Parent page ID (required)",
     )
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Push without asking for confirmation",
+    )
     args = parser.parse_args()
 
     print("🚀 Confluence-Markdown Documentation Publisher")
@@ -183,59 +389,23 @@ def main():
     print("You can override connection details with environment variables or CLI flags:")
     print("  BASE_URL, CONFLUENCE_SPACE_KEY, PARENT_PAGE_ID")
     print("  --base-url, --space-key, --parent-page-id")
-    confirm = input("Push these files to Confluence? (y/N): ").strip().lower()
+    confirm = "y" if args.yes else input("Push these files to Confluence? (y/N): ").strip().lower()
     if confirm != "y":
         print("❌ Cancelled by user")
         sys.exit(0)
 
-    # Push each file
+    # Push the files concurrently
     print(f"\n📤 Pushing {len(markdown_files)} files...")
-    success_count = 0
-    error_count = 0
-
-    for i, md_file in enumerate(markdown_files, 1):
-        try:
-            relative_path = md_file.relative_to(repo_root)
-            print(f"\n[{i}/{len(markdown_files)}] 📝 {relative_path}")
-
-            # Convert markdown to Confluence format
-            confluence_html = convert_markdown_to_confluence(md_file)
-
-            # Create page title
-            page_title = create_page_title(md_file, repo_root=repo_root)
-
-            try:
-                existing_page = client.get_page_by_title(space_key=space_key, title=page_title)
-            except NotFoundError:
-                existing_page = None
-            except ConfluenceAPIError as exc:  # pragma: no cover - defensive log path
-                logger.exception("Failed to look up page '%s': %s", page_title, exc)
-                raise
-
-            if existing_page:
-                client.update_page(
-                    page_id=existing_page.id,
-                    html_storage=confluence_html,
-                    title=page_title,
-                    parent_id=parent_page_id,
-                )
-                print(f"   ✅ Updated: {page_title}")
-            else:
-                client.create_page(
-                    space_key=space_key,
-                    title=page_title,
-                    html_storage=confluence_html,
-                    parent_id=parent_page_id,
-                    labels=["documentation", "confluence-markdown", "auto-generated"],
-                )
-                print(f"   ✅ Created: {page_title}")
-
-            success_count += 1
-
-        except Exception as e:
-            print(f"   ❌ Failed: {e}")
-            logger.exception("Failed to process %s", relative_path)
-            error_count += 1
+    success_count, error_count = asyncio.run(
+        push_files(
+            client,
+            markdown_files,
+            space_key=space_key,
+            parent_page_id=parent_page_id,
+            repo_root=repo_root,
+            cache_path=repo_root / PUSH_CACHE_FILE,
+        )
+    )
 
     # Summary
     print("\n🎉 Push complete!")
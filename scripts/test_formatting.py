@@ -5,14 +5,19 @@ from __future__ import annotations
 import argparse
 import difflib
 import logging
+import os
 from pathlib import Path
 from typing import Sequence
 
 from confluence_markdown.converter import MarkdownToConfluenceConverter
-from scripts.common import configure_logging, find_repository_root
+from scripts.common import configure_logging, convert_texts, find_repository_root
 
 LOGGER = logging.getLogger("scripts.test_formatting")
 
+# Lines of context before the first mismatch, and total lines diffed from there
+DIFF_CONTEXT_LINES = 5
+DIFF_WINDOW_LINES = 200
+
 
 def _golden_directories(repo_root: Path) -> tuple[Path, Path]:
     base = repo_root / "tests" / "golden_corpus"
@@ -42,23 +47,35 @@ def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
 
 
 def _load(path: Path) -> str:
-    return path.read_text(encoding="utf-8").replace("\r\n", "\n").strip()
+    return path.read_bytes().decode("utf-8").replace("\r\n", "\n").strip()
 
 
 def _render_diff(expected: str, actual: str) -> str:
+    """Diff a window around the first mismatching line so large breaks stay cheap to report."""
+    expected_lines = expected.splitlines()
+    actual_lines = actual.splitlines()
+    first = next(
+        (i for i, (want, got) in enumerate(zip(expected_lines, actual_lines)) if want != got),
+        min(len(expected_lines), len(actual_lines)),
+    )
+    start = max(0, first - DIFF_CONTEXT_LINES)
+    end = first + DIFF_WINDOW_LINES
+
     lines = difflib.unified_diff(
-        expected.splitlines(),
-        actual.splitlines(),
+        expected_lines[start:end],
+        actual_lines[start:end],
         fromfile="expected",
         tofile="actual",
         lineterm="",
     )
-    return "\n".join(lines)
+    diff = "\n".join(lines)
+    if start or end < max(len(expected_lines), len(actual_lines)):
+        diff = f"… (truncated to lines {start + 1}-{end})\n{diff}"
+    return diff
 
 
-def _validate_pair(converter: MarkdownToConfluenceConverter, source: Path, expected: Path) -> bool:
-    markdown = _load(source)
-    actual_html = converter.convert(markdown).strip()
+def _validate_pair(source: Path, expected: Path, actual_html: str) -> bool:
+    actual_html = actual_html.strip()
     expected_html = _load(expected)
 
     if actual_html == expected_html:
@@ -90,17 +107,26 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     converter = MarkdownToConfluenceConverter()
     failures = 0
-    processed = 0
+    pairs: list[tuple[Path, Path]] = []
 
-    for source in sorted(input_dir.glob("*.md")):
+    sources = sorted(
+        entry.path
+        for entry in os.scandir(input_dir)
+        if entry.name.endswith(".md") and entry.is_file()
+    )
+    for source in map(Path, sources):
         expected = expected_dir / f"{source.stem}.html"
         if not expected.exists():
             LOGGER.error("Missing expected fixture for %s", source.name)
             failures += 1
             continue
+        pairs.append((source, expected))
 
-        processed += 1
-        if not _validate_pair(converter, source, expected):
+    processed = len(pairs)
+    # Fixtures are independent, so conversion fans out across worker processes
+    converted = convert_texts([_load(source) for source, _ in pairs], converter=converter)
+    for (source, expected), actual_html in zip(pairs, converted):
+        if not _validate_pair(source, expected, actual_html):
             failures += 1
 
     if processed == 0:
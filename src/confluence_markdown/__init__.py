@@ -1,32 +1,40 @@
 # Copyright (c) 2025 Francis Bain
 # SPDX-License-Identifier: Apache-2.0
 
-# Makes top-level imports work and documents public API
-from .confluence_api import (
-    AuthError,
-    ConflictError,
-    ConfluenceAPIError,
-    ConfluenceClient,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-)
-from .converter import MarkdownToConfluenceConverter
-from .errors import (
-    EXIT_API_ERROR,
-    EXIT_CONFIG_ERROR,
-    EXIT_CONVERSION_ERROR,
-    EXIT_SUCCESS,
-    APIError,
-    AuthenticationError,
-    ConfigError,
-    ConversionError,
-    PushError,
-    VersionConflictError,
-)
+# Makes top-level imports work and documents public API. Submodules are imported on
+# first attribute access (PEP 562) so that, for example, using only the converter does
+# not load the HTTP client stack.
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .confluence_api import (
+        AsyncConfluenceClient,
+        AuthError,
+        ConflictError,
+        ConfluenceAPIError,
+        ConfluenceClient,
+        NotFoundError,
+        RateLimitError,
+        ServerError,
+    )
+    from .converter import MarkdownToConfluenceConverter
+    from .errors import (
+        EXIT_API_ERROR,
+        EXIT_CONFIG_ERROR,
+        EXIT_CONVERSION_ERROR,
+        EXIT_SUCCESS,
+        APIError,
+        AuthenticationError,
+        ConfigError,
+        ConversionError,
+        PushError,
+        VersionConflictError,
+    )
 
 __all__ = [
     "ConfluenceClient",
+    "AsyncConfluenceClient",
     "ConfluenceAPIError",
     "AuthError",
     "NotFoundError",
@@ -45,3 +53,49 @@ __all__ = [
     "EXIT_CONFIG_ERROR",
     "EXIT_CONVERSION_ERROR",
 ]
+
+_LAZY_IMPORTS = {
+    **dict.fromkeys(
+        (
+            "AsyncConfluenceClient",
+            "AuthError",
+            "ConflictError",
+            "ConfluenceAPIError",
+            "ConfluenceClient",
+            "NotFoundError",
+            "RateLimitError",
+            "ServerError",
+        ),
+        ".confluence_api",
+    ),
+    "MarkdownToConfluenceConverter": ".converter",
+    **dict.fromkeys(
+        (
+            "EXIT_API_ERROR",
+            "EXIT_CONFIG_ERROR",
+            "EXIT_CONVERSION_ERROR",
+            "EXIT_SUCCESS",
+            "APIError",
+            "AuthenticationError",
+            "ConfigError",
+            "ConversionError",
+            "PushError",
+            "VersionConflictError",
+        ),
+        ".errors",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
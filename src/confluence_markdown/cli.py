@@ -10,11 +10,11 @@ supporting various operations like mapping management, push/pull operations, etc
 import argparse
 import logging
 import sys
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from .confluence_api import AuthError, ConflictError, ConfluenceAPIError, ConfluenceClient
-from .converter import MarkdownToConfluenceConverter
 from .errors import (
     EXIT_API_ERROR,
     EXIT_CONFIG_ERROR,
@@ -23,115 +23,240 @@ from .errors import (
     AuthenticationError,
     ConfigError,
     ConversionError,
+    PushError,
     VersionConflictError,
 )
-from .mapping_store import MappingEntry, MappingStore
+
+if TYPE_CHECKING:
+    from .confluence_api import ConfluenceClient
+    from .converter import MarkdownToConfluenceConverter
+    from .mapping_store import MappingEntry, MappingStore
+
+# Heavy submodules (the HTTP client stack, the converter, the mapping store) are only
+# imported by the commands that use them, so `--help` and argument errors start fast.
+_LAZY_IMPORTS = {
+    "ConfluenceClient": ".confluence_api",
+    "MarkdownToConfluenceConverter": ".converter",
+    "MappingStore": ".mapping_store",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily imported name, preferring a value already bound on this module."""
+    return globals().get(name) or __getattr__(name)
+
+
+_LOG_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
 
 def setup_logging(verbose: bool = False) -> None:
     """Set up logging configuration.
 
+    Like ``logging.basicConfig``, this does nothing once the root logger has handlers,
+    so repeated ``main()`` calls leave the existing configuration alone.
+
     Args:
         verbose: If True, set DEBUG level; otherwise INFO level
     """
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(_LOG_FORMATTER)
+    root.addHandler(handler)
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
 
 
 def cmd_push(args: argparse.Namespace) -> int:
     """Handle the 'push' command.
 
+    Several files can be pushed in one invocation; the mapping store, Confluence client
+    and converter are set up once and shared by every file.
+
     Args:
-        args: Parsed command line arguments containing file path and options
+        args: Parsed command line arguments containing file path(s) and options
 
     Returns:
-        Exit code (0 for success, 1-3 for various error types)
+        Exit code (0 for success, 1-3 for various error types); the highest code across
+        all files when several are pushed
+
+    Raises:
+        Exception: Unexpected errors outside the per-file error handling propagate to
+            ``main()``, which reports them as API errors
     """
     logger = logging.getLogger(__name__)
 
-    try:
-        # Validate required parameters
-        if not args.file:
-            logger.error("--file is required for push command")
-            return EXIT_CONFIG_ERROR
+    files = args.file
+
+    # Validate required parameters
+    if not files:
+        logger.error("--file is required for push command")
+        return EXIT_CONFIG_ERROR
 
-        file_path = Path(args.file)
+    file_args = [files] if isinstance(files, str) else list(files)
+    mapping_store = None
+    client = None
+    converter = None
+    exit_code = EXIT_SUCCESS
 
-        # Validate file exists
-        if not file_path.exists():
-            logger.error(f"File does not exist: {file_path}")
-            return EXIT_CONFIG_ERROR
+    for file_path in file_args:
+        # Read the file up front; a missing file is reported from the failed read
+        # rather than a separate existence check
+        try:
+            markdown_content = Path(file_path).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            logger.error("File does not exist: %s", file_path)
+            exit_code = max(exit_code, EXIT_CONFIG_ERROR)
+            continue
+        except Exception as e:
+            read_error = ConversionError(
+                f"Failed to convert markdown file: {e}", file_path=file_path
+            )
+            read_error.log_error()
+            exit_code = max(exit_code, read_error.exit_code)
+            continue
 
         # Initialize mapping store to find confluence target
-        mapping_store = MappingStore()
-        mapping = mapping_store.get_mapping(str(file_path))
+        if mapping_store is None:
+            mapping_store = _get_mapping_store()
+        mapping = mapping_store.get_mapping(file_path)
 
         if not mapping:
-            logger.error(f"No mapping found for file: {file_path}")
+            logger.error("No mapping found for file: %s", file_path)
             logger.info("Use 'cmt map add' to create a mapping first")
-            return EXIT_CONFIG_ERROR
+            exit_code = max(exit_code, EXIT_CONFIG_ERROR)
+            continue
 
-        # Configure Confluence client with error handling
-        try:
-            client = _get_confluence_client()
-        except AuthenticationError as e:
-            e.log_error()
-            return e.exit_code
-        except ConfigError as e:
-            e.log_error()
-            return e.exit_code
-
-        # Read and convert markdown
+        # Configure Confluence client with error handling; a failure here would
+        # repeat for every remaining file, so stop
+        if client is None:
+            try:
+                client = _get_confluence_client()
+            except AuthenticationError as e:
+                e.log_error()
+                return max(exit_code, e.exit_code)
+            except ConfigError as e:
+                e.log_error()
+                return max(exit_code, e.exit_code)
+
+        # Convert markdown
         try:
-            with open(file_path, encoding="utf-8") as f:
-                markdown_content = f.read()
-
-            converter = MarkdownToConfluenceConverter()
+            if converter is None:
+                converter = _get_converter()
             html_content = converter.convert(markdown_content)
 
         except Exception as e:
             conversion_error = ConversionError(
-                f"Failed to convert markdown file: {e}", file_path=str(file_path)
+                f"Failed to convert markdown file: {e}", file_path=file_path
             )
             conversion_error.log_error()
-            return conversion_error.exit_code
+            exit_code = max(exit_code, conversion_error.exit_code)
+            continue
+
+        # The converter works on the whole document, so the source cannot be streamed;
+        # drop it before the upload so only the HTML is held while the request is sent
+        del markdown_content
+        exit_code = max(exit_code, _push_file(client, mapping, html_content, file_path))
+        del html_content
+
+    return exit_code
 
-        # Push to Confluence with comprehensive error handling
-        try:
-            _push_to_confluence(client, mapping, html_content, str(file_path))
-            logger.info(
-                "Successfully pushed file to Confluence",
-                extra={
-                    "file_path": str(file_path),
-                    "page_id": mapping.get("page_id", "N/A"),
-                },
-            )
-            return EXIT_SUCCESS
-
-        except AuthenticationError as e:
-            e.log_error()
-            return e.exit_code
-        except VersionConflictError as e:
-            e.log_error()
-            return e.exit_code
-        except APIError as e:
-            e.log_error()
-            return e.exit_code
-        except Exception as e:
-            api_error = APIError(
-                f"Unexpected error during push: {e}",
-                file_path=str(file_path),
-                page_id=mapping.get("page_id"),
-            )
-            api_error.log_error()
-            return api_error.exit_code
 
+def _push_file(
+    client: "ConfluenceClient", mapping: "MappingEntry", html_content: str, file_path: str
+) -> int:
+    """Push one converted file and map any failure to its exit code.
+
+    Args:
+        client: Configured Confluence client
+        mapping: File-to-page mapping from mapping store
+        html_content: Converted HTML content
+        file_path: Path of the pushed file
+
+    Returns:
+        Exit code for this file
+    """
+    logger = logging.getLogger(__name__)
+
+    # Push to Confluence with comprehensive error handling
+    try:
+        _push_to_confluence(client, mapping, html_content, file_path)
+        logger.info(
+            "Successfully pushed file to Confluence",
+            extra={
+                "file_path": file_path,
+                "page_id": mapping.get("page_id", "N/A"),
+            },
+        )
+        return EXIT_SUCCESS
+
+    except AuthenticationError as e:
+        e.log_error()
+        return e.exit_code
+    except VersionConflictError as e:
+        e.log_error()
+        return e.exit_code
+    except APIError as e:
+        e.log_error()
+        return e.exit_code
     except Exception as e:
-        logger.error(f"Unexpected error in push command: {e}")
-        return EXIT_API_ERROR
+        api_error = APIError(
+            f"Unexpected error during push: {e}",
+            file_path=file_path,
+            page_id=mapping.get("page_id"),
+        )
+        api_error.log_error()
+        return api_error.exit_code
+
+
+def _get_mapping_store() -> "MappingStore":
+    """Get the mapping store for the current working directory.
+
+    The store is reused across commands in the same process. It re-reads the mapping
+    file only when the file changes, so mappings written by ``map add`` are still
+    seen by a later ``push``.
+
+    Returns:
+        MappingStore rooted at the repository containing the working directory
+    """
+    return _cached_mapping_store(_lazy("MappingStore"), str(Path.cwd()))
+
+
+@lru_cache(maxsize=1)
+def _cached_mapping_store(store_cls: Any, cwd: str) -> "MappingStore":
+    """Build a mapping store once per (class, working directory)."""
+    return store_cls()
+
 
+def _get_converter() -> "MarkdownToConfluenceConverter":
+    """Get the Markdown converter shared by every push in this process.
 
-def _get_confluence_client() -> ConfluenceClient:
+    The converter keeps no state between ``convert()`` calls, so one instance is safe
+    to reuse, including from several threads.
+
+    Returns:
+        MarkdownToConfluenceConverter instance
+    """
+    return _cached_converter(_lazy("MarkdownToConfluenceConverter"))
+
+
+@lru_cache(maxsize=1)
+def _cached_converter(converter_cls: Any) -> "MarkdownToConfluenceConverter":
+    """Build a converter once per class."""
+    return converter_cls()
+
+
+def _get_confluence_client() -> "ConfluenceClient":
     """Get configured Confluence client with authentication validation.
 
     Returns:
@@ -141,12 +266,8 @@ def _get_confluence_client() -> ConfluenceClient:
         AuthenticationError: If authentication credentials are invalid/missing
         ConfigError: If configuration is invalid
     """
-    import os
-
     # Check for required environment variables
-    base_url = os.getenv("CMT_CONF_BASE_URL", "").strip()
-    email = os.getenv("CMT_CONF_EMAIL", "").strip() or None
-    token = os.getenv("CMT_CONF_TOKEN", "").strip() or None
+    base_url, email, token = _env_credentials()
 
     if not base_url:
         raise ConfigError("Missing CMT_CONF_BASE_URL environment variable")
@@ -155,13 +276,42 @@ def _get_confluence_client() -> ConfluenceClient:
         raise AuthenticationError("Invalid or missing Confluence API token.")
 
     try:
-        return ConfluenceClient(base_url=base_url, email=email, token=token)
+        return _cached_client(_lazy("ConfluenceClient"), base_url, email, token)
     except Exception as e:
         raise ConfigError(f"Failed to initialize Confluence client: {e}") from e
 
 
+@lru_cache(maxsize=1)
+def _env_credentials() -> Tuple[str, Optional[str], Optional[str]]:
+    """Read the Confluence settings from the environment once per process.
+
+    Call ``_env_credentials.cache_clear()`` after changing the variables in-process.
+
+    Returns:
+        Tuple of (base URL, email or None, API token or None)
+    """
+    import os
+
+    base_url = os.getenv("CMT_CONF_BASE_URL", "").strip()
+    email = os.getenv("CMT_CONF_EMAIL", "").strip() or None
+    token = os.getenv("CMT_CONF_TOKEN", "").strip() or None
+    return base_url, email, token
+
+
+@lru_cache(maxsize=8)
+def _cached_client(
+    client_cls: Any, base_url: str, email: Optional[str], token: str
+) -> "ConfluenceClient":
+    """Build a client once per (class, credentials) so repeated pushes share its session.
+
+    Reusing the client keeps its pooled ``requests`` session, and therefore its
+    keep-alive TCP/TLS connections, across pushes in the same process.
+    """
+    return client_cls(base_url=base_url, email=email, token=token)
+
+
 def _push_to_confluence(
-    client: ConfluenceClient, mapping: MappingEntry, html_content: str, file_path: str
+    client: "ConfluenceClient", mapping: "MappingEntry", html_content: str, file_path: str
 ) -> bool:
     """Push content to Confluence with error handling.
 
@@ -178,99 +328,104 @@ def _push_to_confluence(
         AuthenticationError: If API returns 401/403
         VersionConflictError: If API returns 409 (version conflict)
         APIError: For other API errors
+        ConfigError: If the mapping names neither a page ID nor a space + title
     """
+    from .confluence_api import AuthError, ConflictError, ConfluenceAPIError
+
     logger = logging.getLogger(__name__)
 
-    try:
-        page_id = mapping.get("page_id")
-        space_key = mapping.get("space_key")
-        title = mapping.get("title")
+    page_id = mapping.get("page_id")
+    space_key = mapping.get("space_key")
+    title = mapping.get("title")
 
-        if page_id:
-            # Update existing page by ID
-            logger.info(f"Updating page {page_id} from {file_path}")
-            try:
-                result = client.update_page(page_id=page_id, html_storage=html_content)
-                logger.info(
-                    f"Page updated successfully: {result.id} (version {result.version.number})"
-                )
-                return True
-
-            except AuthError as e:
-                raise AuthenticationError(
-                    context={
-                        "page_id": page_id,
-                        "file_path": file_path,
-                        "error_code": getattr(e, "status", None),
-                    }
-                ) from e
-            except ConflictError as e:
-                raise VersionConflictError(page_id=page_id, context={"file_path": file_path}) from e
-            except ConfluenceAPIError as e:
-                raise APIError(
-                    f"API error during page update: {e}",
-                    status_code=getattr(e, "status", None),
-                    page_id=page_id,
-                    file_path=file_path,
-                ) from e
-
-        elif space_key and title:
-            # Create or update page by space + title
-            logger.info(f"Creating/updating page '{title}' in space {space_key} from {file_path}")
-            try:
-                # First try to find existing page
-                existing_page = client.get_page_by_title(space_key=space_key, title=title)
-
-                if existing_page:
-                    # Update existing page
-                    result = client.update_page(
-                        page_id=existing_page.id, html_storage=html_content, title=title
-                    )
-                    logger.info(
-                        f"Page updated successfully: {result.id} (version {result.version.number})"
-                    )
-                else:
-                    # Create new page
-                    result = client.create_page(
-                        space_key=space_key, title=title, html_storage=html_content
-                    )
-                    logger.info(
-                        f"Page created successfully: {result.id} (version {result.version.number})"
-                    )
-
-                return True
-
-            except AuthError as e:
-                raise AuthenticationError(
-                    context={
-                        "file_path": file_path,
-                        "space_key": space_key,
-                        "title": title,
-                        "error_code": getattr(e, "status", None),
-                    }
-                ) from e
-            except ConflictError as e:
-                raise VersionConflictError(
-                    context={"file_path": file_path, "space_key": space_key, "title": title}
-                ) from e
-            except ConfluenceAPIError as e:
-                raise APIError(
-                    f"API error during page creation/update: {e}",
-                    status_code=getattr(e, "status", None),
-                    file_path=file_path,
-                    context={"space_key": space_key, "title": title},
-                ) from e
-        else:
-            raise ConfigError(f"Invalid mapping configuration: {mapping}")
+    if page_id:
+        # Update existing page by ID
+        logger.info("Updating page %s from %s", page_id, file_path)
+        try:
+            result = client.update_page(page_id=page_id, html_storage=html_content)
+        except (AuthError, ConflictError, ConfluenceAPIError) as e:
+            raise _translate_api_error(e, page_id=page_id, file_path=file_path) from e
 
-    except Exception as e:
-        if isinstance(e, (AuthenticationError, VersionConflictError, APIError, ConfigError)):
-            raise
-        else:
-            raise APIError(
-                f"Unexpected error during Confluence operation: {e}", file_path=file_path
+        logger.info("Page updated successfully: %s (version %s)", result.id, result.version.number)
+        return True
+
+    if space_key and title:
+        # Create or update page by space + title
+        logger.info("Creating/updating page '%s' in space %s from %s", title, space_key, file_path)
+        try:
+            # First try to find existing page
+            existing_page = client.get_page_by_title(space_key=space_key, title=title)
+
+            if existing_page:
+                # Update existing page
+                result = client.update_page(
+                    page_id=existing_page.id, html_storage=html_content, title=title
+                )
+                action = "updated"
+            else:
+                # Create new page
+                result = client.create_page(
+                    space_key=space_key, title=title, html_storage=html_content
+                )
+                action = "created"
+        except (AuthError, ConflictError, ConfluenceAPIError) as e:
+            raise _translate_api_error(
+                e, file_path=file_path, space_key=space_key, title=title
             ) from e
 
+        logger.info(
+            "Page %s successfully: %s (version %s)", action, result.id, result.version.number
+        )
+        return True
+
+    raise ConfigError(f"Invalid mapping configuration: {mapping}")
+
+
+def _translate_api_error(
+    error: Exception,
+    *,
+    file_path: str,
+    page_id: Optional[str] = None,
+    space_key: Optional[str] = None,
+    title: Optional[str] = None,
+) -> PushError:
+    """Map a Confluence client error to the CLI error carrying its exit code.
+
+    Args:
+        error: AuthError, ConflictError or ConfluenceAPIError raised by the client
+        file_path: Original file path for logging
+        page_id: Target page ID, when pushing by ID
+        space_key: Target space key, when pushing by space + title
+        title: Target page title, when pushing by space + title
+
+    Returns:
+        AuthenticationError, VersionConflictError or APIError for the failure
+    """
+    from .confluence_api import AuthError, ConflictError
+
+    status = getattr(error, "status", None)
+    target = {"page_id": page_id} if page_id else {"space_key": space_key, "title": title}
+
+    if isinstance(error, AuthError):
+        return AuthenticationError(context={"file_path": file_path, **target, "error_code": status})
+    if isinstance(error, ConflictError):
+        if page_id:
+            return VersionConflictError(page_id=page_id, context={"file_path": file_path})
+        return VersionConflictError(context={"file_path": file_path, **target})
+    if page_id:
+        return APIError(
+            f"API error during page update: {error}",
+            status_code=status,
+            page_id=page_id,
+            file_path=file_path,
+        )
+    return APIError(
+        f"API error during page creation/update: {error}",
+        status_code=status,
+        file_path=file_path,
+        context=target,
+    )
+
 
 def cmd_map_add(args: argparse.Namespace) -> int:
     """Handle the 'map add' command.
@@ -282,17 +437,18 @@ def cmd_map_add(args: argparse.Namespace) -> int:
         Exit code (0 for success, 1 for error)
     """
     logger = logging.getLogger(__name__)
+    page_id, space, title = args.page_id, args.space, args.title
 
     try:
         # Validate parameter combinations - fail fast with user-friendly messages
-        if args.page_id and args.title:
+        if page_id and title:
             logger.error(
                 "Cannot use --page with --title; provide either --page or --space and --title"
             )
             return 1
 
         # Validate required parameters
-        if not args.page_id and not (args.space and args.title):
+        if not page_id and not (space and title):
             logger.error("Either --page or both --space and --title must be provided")
             return 1
 
@@ -303,42 +459,43 @@ def cmd_map_add(args: argparse.Namespace) -> int:
         # Validate path exists
         path = Path(args.path)
         if not path.exists():
-            logger.error(f"File does not exist: {path}")
+            logger.error("File does not exist: %s", path)
             return 1
 
         # Initialize mapping store
-        mapping_store = MappingStore()
+        mapping_store = _get_mapping_store()
 
         # Create the mapping entry
-        if args.page_id:
+        if page_id:
             # Direct page ID mapping - only pass space_key if provided
-            if args.space:
-                result = mapping_store.add_mapping(
-                    path=str(path), page_id=args.page_id, space_key=args.space
-                )
+            if space:
+                result = mapping_store.add_mapping(path=str(path), page_id=page_id, space_key=space)
             else:
-                result = mapping_store.add_mapping(path=str(path), page_id=args.page_id)
+                result = mapping_store.add_mapping(path=str(path), page_id=page_id)
         else:
             # Space + title mapping
-            result = mapping_store.add_mapping(
-                path=str(path), space_key=args.space, title=args.title
-            )
+            result = mapping_store.add_mapping(path=str(path), space_key=space, title=title)
 
         if result.get("created"):
-            logger.info(f"Created new mapping: {path} -> {result['mapping']}")
+            logger.info("Created new mapping: %s -> %s", path, result["mapping"])
         else:
-            logger.info(f"Updated existing mapping: {path} -> {result['mapping']}")
+            logger.info("Updated existing mapping: %s -> %s", path, result["mapping"])
 
         return 0
 
     except Exception as e:
-        logger.error(f"Failed to add mapping: {e}")
+        logger.error("Failed to add mapping: %s", e)
         return 1
 
 
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """Create the command line argument parser.
 
+    The parser is built once per process and shared; parsing does not modify it, so
+    repeated ``main()`` calls skip rebuilding the argument tree. Callers must not add
+    arguments to the returned instance.
+
     Returns:
         Configured ArgumentParser instance
     """
@@ -351,8 +508,10 @@ def create_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Push command
-    push_parser = subparsers.add_parser("push", help="Push markdown file to Confluence")
-    push_parser.add_argument("--file", required=True, help="Path to the Markdown file to push")
+    push_parser = subparsers.add_parser("push", help="Push markdown files to Confluence")
+    push_parser.add_argument(
+        "--file", required=True, nargs="+", help="Path(s) to the Markdown file(s) to push"
+    )
 
     # Map command
     map_parser = subparsers.add_parser("map", help="Mapping management commands")
@@ -370,6 +529,78 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Command lines handled without building the argparse tree: command words -> accepted
+# flags (flag -> (namespace attribute, takes several values)) and the attributes that
+# must be supplied
+_FAST_PATH_COMMANDS = {
+    ("push",): ({"--file": ("file", True)}, ("file",)),
+    ("map", "add"): (
+        {
+            "--page": ("page_id", False),
+            "--path": ("path", False),
+            "--space": ("space", False),
+            "--title": ("title", False),
+        },
+        ("path",),
+    ),
+}
+
+
+def _fast_parse(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parse the common, plain command lines without constructing the argument parser.
+
+    Only exact ``--flag value`` forms for known commands are accepted. Anything else
+    (help, abbreviations, ``--flag=value``, repeated or unknown flags, missing required
+    flags) returns None so that argparse parses it and reports errors as usual.
+
+    Args:
+        argv: Command line arguments, without the program name
+
+    Returns:
+        Namespace equivalent to the one argparse would produce, or None
+    """
+    verbose = bool(argv) and argv[0] in ("-v", "--verbose")
+    rest = argv[1:] if verbose else argv
+
+    words = next((w for w in _FAST_PATH_COMMANDS if tuple(rest[: len(w)]) == w), None)
+    if words is None:
+        return None
+    options, required = _FAST_PATH_COMMANDS[words]
+
+    tokens = rest[len(words) :]
+    values: Dict[str, Any] = {dest: None for dest, _ in options.values()}
+    i = 0
+    while i < len(tokens):
+        spec = options.get(tokens[i])
+        if spec is None:
+            return None
+        dest, multiple = spec
+
+        j = i + 1
+        while j < len(tokens) and not tokens[j].startswith("-"):
+            j += 1
+        found = tokens[i + 1 : j]
+        if values[dest] is not None or not found or (len(found) > 1 and not multiple):
+            return None
+        values[dest] = found if multiple else found[0]
+        i = j
+
+    if any(values[dest] is None for dest in required):
+        return None
+
+    args = argparse.Namespace(verbose=verbose, command=words[0], **values)
+    if len(words) > 1:
+        args.map_command = words[1]
+    return args
+
+
+# (command, map subcommand) -> handler; commands without subcommands use None
+_DISPATCH = {
+    ("push", None): cmd_push,
+    ("map", "add"): cmd_map_add,
+}
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """Main CLI entry point.
 
@@ -379,28 +610,29 @@ def main(argv: Optional[List[str]] = None) -> int:
     Returns:
         Exit code
     """
-    parser = create_parser()
-    args = parser.parse_args(argv)
+    args = _fast_parse(sys.argv[1:] if argv is None else list(argv))
+    if args is None:
+        args = create_parser().parse_args(argv)
 
     setup_logging(args.verbose)
     logger = logging.getLogger(__name__)
 
     # Handle commands
-    if args.command == "push":
-        return cmd_push(args)
-    elif args.command == "map":
-        if args.map_command == "add":
-            return cmd_map_add(args)
-        else:
-            logger.error("Unknown map command")
-            parser.print_help(file=sys.stderr)
-            return 1
-    else:
-        # No command specified or unknown command
-        if not args.command:
-            logger.info("confluence-markdown CLI - no command specified")
-        parser.print_help(file=sys.stderr)
-        return 1
+    handler = _DISPATCH.get((args.command, getattr(args, "map_command", None)))
+    if handler is not None:
+        try:
+            return handler(args)
+        except Exception as e:
+            logger.error("Unexpected error in %s command: %s", args.command, e)
+            return EXIT_API_ERROR
+
+    if args.command == "map":
+        logger.error("Unknown map command")
+    elif not args.command:
+        # No command specified
+        logger.info("confluence-markdown CLI - no command specified")
+    create_parser().print_help(file=sys.stderr)
+    return 1
 
 
 if __name__ == "__main__":
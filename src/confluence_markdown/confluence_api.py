@@ -10,13 +10,24 @@ while handling authentication, version control, and retry/backoff logic.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import email.utils
+import gzip
 import json
 import logging
 import os
+import random
+import sys
+import threading
 import time
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import requests
@@ -27,12 +38,17 @@ logger = logging.getLogger("confluence_api")
 logger.addHandler(logging.NullHandler())
 
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__, which adds up when
+# many pages are held at once; older interpreters fall back to regular instances.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class PageVersion:
     number: int
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Page:
     id: str
     title: str
@@ -40,6 +56,14 @@ class Page:
     version: PageVersion
     body_storage: str | None = None
 
+    def matches(self, html_storage: str) -> bool:
+        """Whether ``html_storage`` equals the stored body, i.e. an update would be a no-op.
+
+        Leading and trailing whitespace is ignored. Requires the page to have been fetched
+        with ``body.storage`` expanded; pages without a body never match.
+        """
+        return self.body_storage is not None and self.body_storage.strip() == html_storage.strip()
+
 
 class ConfluenceAPIError(Exception):
     def __init__(self, message: str, *, status: int | None = None, payload: Any = None) -> None:
@@ -57,13 +81,215 @@ class NotFoundError(ConfluenceAPIError): ...
 class ConflictError(ConfluenceAPIError): ...
 
 
-class RateLimitError(ConfluenceAPIError): ...
+class RateLimitError(ConfluenceAPIError):
+    def __init__(
+        self,
+        message: str,
+        *,
+        status: int | None = None,
+        payload: Any = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message, status=status, payload=payload)
+        # Seconds the server asked callers to wait before retrying, when it said so
+        self.retry_after = retry_after
 
 
 class ServerError(ConfluenceAPIError): ...
 
 
+#: HTTP statuses retried automatically by the client's retry policy.
+_RETRYABLE_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+#: Error statuses with a dedicated exception type, and the message prefix used for each.
+_STATUS_ERRORS: dict[int, tuple[type[ConfluenceAPIError], str]] = {
+    401: (AuthError, "Auth failed"),
+    403: (AuthError, "Auth failed"),
+    404: (NotFoundError, "Resource not found"),
+    409: (ConflictError, "Version conflict"),
+    429: (RateLimitError, "Rate limited"),
+}
+
+
+def _rate_limit_wait(headers: Mapping[str, str]) -> float | None:
+    """Return the seconds a throttled response asks callers to wait, if it says.
+
+    ``Retry-After`` may be delta-seconds or an HTTP-date; Confluence Cloud also sends
+    ``X-RateLimit-Reset`` as an ISO 8601 timestamp. Unparseable values are ignored.
+    """
+    retry_after = headers.get("Retry-After")
+    reset = headers.get("X-RateLimit-Reset")
+    try:
+        if retry_after is not None:
+            retry_after = retry_after.strip()
+            if retry_after.isdigit():
+                return float(retry_after)
+            when = email.utils.parsedate_to_datetime(retry_after)
+        elif reset:
+            when = datetime.fromisoformat(reset.strip().replace("Z", "+00:00"))
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - time.time())
+
+
+class _ConfluenceRetry(Retry):
+    """Retry policy that honours ``Retry-After`` but never waits longer than ``backoff_cap``.
+
+    urllib3 sleeps for the server's requested wait on 429/503 responses instead of the
+    exponential backoff. The wait is read from ``Retry-After`` or, failing that,
+    Confluence's ``X-RateLimit-Reset``, and capped so that a misbehaving proxy cannot
+    stall a push for hours.
+
+    With ``jitter`` enabled, backoff uses decorrelated jitter
+    (``uniform(backoff_factor, previous * 3)``, capped at ``backoff_cap``) so that
+    concurrent workers spread out their retries instead of colliding in lockstep.
+
+    The cap is kept here rather than passed to urllib3 as ``backoff_max``, which only
+    urllib3 2.x accepts.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        jitter: bool = True,
+        previous_backoff: float = 0.0,
+        backoff_cap: float = 60.0,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.jitter = jitter
+        self.previous_backoff = previous_backoff
+        self.backoff_cap = backoff_cap
+
+    def new(self, **kw: Any) -> _ConfluenceRetry:
+        params: dict[str, Any] = {
+            "jitter": self.jitter,
+            "previous_backoff": self.previous_backoff,
+            "backoff_cap": self.backoff_cap,
+        }
+        params.update(kw)
+        return super().new(**params)  # type: ignore[return-value]
+
+    def get_backoff_time(self) -> float:
+        backoff = min(super().get_backoff_time(), self.backoff_cap)
+        if not self.jitter or backoff <= 0:
+            return backoff
+        previous = max(self.previous_backoff, self.backoff_factor)
+        self.previous_backoff = min(
+            self.backoff_cap, random.uniform(self.backoff_factor, previous * 3)
+        )
+        return self.previous_backoff
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = _rate_limit_wait(response.headers)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_cap)
+
+
+@lru_cache(maxsize=32)
+def _join_expand(expand: tuple[str, ...]) -> str:
+    """Join ``expand`` into the comma-separated query value, reusing the result per tuple."""
+    return ",".join(expand)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket that paces callers to ``rate`` acquisitions per second.
+
+    Up to ``capacity`` acquisitions may burst through at once; after that each caller
+    reserves the next token and sleeps until it is due, so waiting callers are served
+    in order.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate * 2)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._waited = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self._acquired += 1
+            self._waited += wait
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def stats(self) -> dict[str, float]:
+        """Return the tokens available now, tokens taken so far and total seconds waited.
+
+        ``tokens`` is negative while callers are queued for tokens not yet refilled.
+        """
+        with self._lock:
+            self._refill()
+            return {"tokens": self._tokens, "acquired": self._acquired, "waited": self._waited}
+
+
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTP adapter that takes a token from a shared bucket before each request."""
+
+    def __init__(self, bucket: _TokenBucket, **kwargs: Any) -> None:
+        self.bucket = bucket
+        super().__init__(**kwargs)
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> requests.Response:
+        self.bucket.acquire()
+        return super().send(request, *args, **kwargs)
+
+
+# Shared read-only stand-in for missing nested objects in API responses
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _unique_labels(labels: Iterable[str] | None) -> list[str]:
+    """Return ``labels`` as a list without duplicates, reusing duplicate-free lists as-is."""
+    if not labels:
+        return []
+    if isinstance(labels, list) and len(set(labels)) == len(labels):
+        return labels
+    return list(dict.fromkeys(labels))
+
+
+def _cql_quote(value: str) -> str:
+    """Quote ``value`` as a CQL string literal."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
 class ConfluenceClient:
+    #: Maximum number of titles OR-ed together in a single CQL search.
+    TITLE_BATCH_SIZE = 40
+    #: Maximum number of page IDs looked up in a single CQL search.
+    ID_BATCH_SIZE = 100
+    #: Maximum number of pages kept for conditional (If-None-Match) re-fetches.
+    PAGE_CACHE_SIZE = 256
+    #: Smallest request body, in bytes, worth gzipping when ``compress_requests`` is on.
+    COMPRESS_MIN_BYTES = 1024
+    #: Default longest single wait, in seconds, between retries (including Retry-After).
+    MAX_BACKOFF = 60.0
+
     def __init__(
         self,
         base_url: str,
@@ -73,20 +299,59 @@ class ConfluenceClient:
         timeout: float = 30.0,
         max_retries: int = 5,
         backoff_factor: float = 0.3,
+        compress_requests: bool = False,
+        pool_maxsize: int = 20,
+        backoff_cap: float = MAX_BACKOFF,
+        backoff_jitter: bool = True,
+        rate_limit: float | None = None,
+        rate_limit_burst: float | None = None,
+        page_cache_ttl: float = 0.0,
     ) -> None:
         if not base_url:
             raise ValueError("base_url is required")
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.compress_requests = compress_requests
+        # Seconds a cached page is served without contacting the server (0 = always revalidate)
+        self.page_cache_ttl = page_cache_ttl
+        # (page_id, expand) -> (ETag or None, Page, fetched at), least recently used first
+        self._page_cache: OrderedDict[
+            tuple[str, tuple[str, ...]], tuple[str | None, Page, float]
+        ] = OrderedDict()
+        # (space_key, title, expand) -> (Page, fetched at); only used when page_cache_ttl is set
+        self._title_cache: OrderedDict[tuple[str, str, tuple[str, ...]], tuple[Page, float]] = (
+            OrderedDict()
+        )
+        self._page_cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Lookups currently on the wire, so concurrent identical lookups share one request
+        self._inflight: dict[tuple[Any, ...], Future[Any]] = {}
+        self._inflight_lock = threading.Lock()
         self.session = requests.Session()
-        retry = Retry(
+        retry = _ConfluenceRetry(
             total=max_retries,
             backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_cap=backoff_cap,
+            status_forcelist=_RETRYABLE_STATUSES,
             allowed_methods=["GET", "PUT", "POST", "DELETE"],
             raise_on_status=False,
+            respect_retry_after_header=True,
+            jitter=backoff_jitter,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # Keep enough pooled keep-alive connections for concurrent callers (see
+        # AsyncConfluenceClient) so connections are reused rather than re-handshaked
+        adapter: HTTPAdapter
+        if rate_limit:
+            # Pace requests client-side so bursts stay under the server quota instead
+            # of being answered with 429s
+            adapter = _ThrottledAdapter(
+                _TokenBucket(rate_limit, rate_limit_burst),
+                max_retries=retry,
+                pool_maxsize=pool_maxsize,
+            )
+        else:
+            adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -141,6 +406,25 @@ class ConfluenceClient:
         """Construct an absolute Confluence REST API URL for a relative path."""
         return f"{self.base_url}{path}"
 
+    def _encode_body(self, payload: Any) -> tuple[bytes, dict[str, str] | None]:
+        """Serialise ``payload`` as UTF-8 JSON, gzip-compressing it when enabled.
+
+        The body is encoded straight to bytes without ``\\uXXXX`` escapes, which keeps
+        non-ASCII pages compact and avoids a second copy when ``requests`` sends it.
+        Page bodies dominate upload size, so compressing them pays off on slow links.
+        Compression is opt-in (``compress_requests=True``) because not every Confluence
+        deployment or proxy accepts ``Content-Encoding: gzip`` request bodies. Bodies under
+        ``COMPRESS_MIN_BYTES`` are sent as-is, and the fastest gzip level is used, since
+        XHTML compresses well even then and CPU time would otherwise eat the saving.
+
+        Returns:
+            Tuple of request body and extra headers (``None`` when uncompressed)
+        """
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        if not self.compress_requests or len(body) < self.COMPRESS_MIN_BYTES:
+            return body, None
+        return gzip.compress(body, compresslevel=1), {"Content-Encoding": "gzip"}
+
     def _handle_error(self, resp: requests.Response, context: str) -> None:
         """Raise rich error types for non-success HTTP responses.
 
@@ -154,18 +438,17 @@ class ConfluenceClient:
         except Exception:
             payload = resp.text
 
-        if status in (401, 403):
-            raise AuthError(f"Auth failed during {context}", status=status, payload=payload)
-        if status == 404:
-            raise NotFoundError(
-                f"Resource not found during {context}", status=status, payload=payload
-            )
-        if status == 409:
-            raise ConflictError(
-                f"Version conflict during {context}", status=status, payload=payload
-            )
-        if status == 429:
-            raise RateLimitError(f"Rate limited during {context}", status=status, payload=payload)
+        known = _STATUS_ERRORS.get(status)
+        if known is not None:
+            error_cls, prefix = known
+            if error_cls is RateLimitError:
+                raise RateLimitError(
+                    f"{prefix} during {context}",
+                    status=status,
+                    payload=payload,
+                    retry_after=_rate_limit_wait(resp.headers),
+                )
+            raise error_cls(f"{prefix} during {context}", status=status, payload=payload)
         if 500 <= status < 600:
             raise ServerError(
                 f"Server error {status} during {context}", status=status, payload=payload
@@ -187,30 +470,169 @@ class ConfluenceClient:
         Returns:
             Tuple containing the calculated target version and resolved title.
         """
-        if expected_version is None:
+        if expected_version is not None and title:
+            # Confluence expects the next version number
+            return expected_version + 1, title
+
+        if expected_version is not None:
+            # Every edit, renames included, bumps the version, so a cached copy at
+            # expected_version still carries the title stored at that version
+            known = self._known_page(page_id, expected_version)
+            if known is not None:
+                return expected_version + 1, known.title
+
+        # One fetch supplies whichever of version and title the caller did not provide
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "Fetching current page version for optimistic locking",
+                "Fetching current page version for optimistic locking"
+                if expected_version is None
+                else "Fetching current page title",
                 extra={"operation": "update_page", "page_id": page_id},
             )
-            current = self.get_page_by_id(page_id, expand=("version",))
-            target_version = current.version.number + 1
-            resolved_title = title or current.title
-        else:
-            target_version = expected_version + 1  # Confluence expects next version
-            if not title:
-                logger.info(
-                    "Fetching current page title",
-                    extra={"operation": "update_page", "page_id": page_id},
-                )
-                resolved_title = self.get_page_by_id(page_id).title
-            else:
-                resolved_title = title
+        current = self.get_page_by_id(page_id, expand=("version",))
+        base_version = current.version.number if expected_version is None else expected_version
+        target_version = base_version + 1
+        resolved_title = title or current.title
 
         return target_version, resolved_title
 
+    def _cached_page(
+        self, key: tuple[str, tuple[str, ...]]
+    ) -> tuple[str | None, Page, float] | None:
+        """Return the cached ``(etag, page, fetched_at)`` for ``key``, marking it recently used."""
+        with self._page_cache_lock:
+            entry = self._page_cache.get(key)
+            if entry is not None:
+                self._page_cache.move_to_end(key)
+            return entry
+
+    def _store_page(self, key: tuple[str, tuple[str, ...]], etag: str | None, page: Page) -> None:
+        """Cache ``page`` under ``key``, evicting the least recently used entry if full."""
+        with self._page_cache_lock:
+            self._page_cache[key] = (etag, page, time.monotonic())
+            self._page_cache.move_to_end(key)
+            if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+
+    def _cached_title(self, key: tuple[str, str, tuple[str, ...]]) -> Page | None:
+        """Return the page cached for a title lookup if it is still within the TTL."""
+        with self._page_cache_lock:
+            entry = self._title_cache.get(key)
+            if entry is None or not self._is_fresh(entry[1]):
+                return None
+            self._title_cache.move_to_end(key)
+            return entry[0]
+
+    def _store_title(self, key: tuple[str, str, tuple[str, ...]], page: Page) -> None:
+        """Cache the result of a title lookup, evicting the least recently used entry if full."""
+        with self._page_cache_lock:
+            self._title_cache[key] = (page, time.monotonic())
+            self._title_cache.move_to_end(key)
+            if len(self._title_cache) > self.PAGE_CACHE_SIZE:
+                self._title_cache.popitem(last=False)
+
+    def _known_page(self, page_id: str, version: int) -> Page | None:
+        """Return any cached copy of ``page_id`` at exactly ``version``, without a request."""
+        with self._page_cache_lock:
+            for key, (_, page, _) in self._page_cache.items():
+                if key[0] == page_id and page.version.number == version:
+                    return page
+        return None
+
+    def _forget_page(self, page_id: str) -> None:
+        """Drop every cached representation of ``page_id``.
+
+        Lookups still in flight may have been sent before the change, so later callers
+        must not join them: in-flight fetches of ``page_id`` are detached, as are all
+        in-flight title lookups, whose page is not known until they return.
+        """
+        with self._inflight_lock:
+            for inflight_key in [
+                k for k in self._inflight if k[0] == "title" or k[:2] == ("id", page_id)
+            ]:
+                del self._inflight[inflight_key]
+        with self._page_cache_lock:
+            for key in [key for key in self._page_cache if key[0] == page_id]:
+                del self._page_cache[key]
+            for title_key in [
+                k for k, (page, _) in self._title_cache.items() if page.id == page_id
+            ]:
+                del self._title_cache[title_key]
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        """Whether an entry fetched at ``fetched_at`` may be served without a request."""
+        return time.monotonic() - fetched_at < self.page_cache_ttl
+
+    def _record_cache(self, *, hit: bool) -> None:
+        with self._page_cache_lock:
+            if hit:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+
+    def rate_limit_stats(self) -> dict[str, float] | None:
+        """Return the client-side throttle's counters, or None when ``rate_limit`` is unset.
+
+        Returns:
+            Mapping with ``tokens`` (available now), ``acquired`` (requests paced so far)
+            and ``waited`` (total seconds requests were held back)
+        """
+        adapter = self.session.get_adapter(self.base_url)
+        if not isinstance(adapter, _ThrottledAdapter):
+            return None
+        return adapter.bucket.stats()
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return page cache counters.
+
+        Returns:
+            Mapping with ``hits`` (lookups answered from memory or by a 304), ``misses``
+            (lookups that downloaded the page) and ``size`` (entries currently cached)
+        """
+        with self._page_cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._page_cache) + len(self._title_cache),
+            }
+
+    def _single_flight(
+        self, key: tuple[Any, ...], func: Callable[..., Any], /, **kwargs: Any
+    ) -> Any:
+        """Call ``func`` once for all threads asking for ``key`` at the same time.
+
+        The first caller performs the request; callers arriving while it is in flight wait
+        for it and receive the same result (or exception).
+        """
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                future: Future[Any] = Future()
+                self._inflight[key] = future
+        if pending is not None:
+            return pending.result()
+
+        try:
+            result = func(**kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                # _forget_page may already have detached this request
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
     def get_page_by_id(self, page_id: str, *, expand: tuple[str, ...] = ("version",)) -> Page:
         """Get page by ID with comprehensive logging.
 
+        Pages served with an ``ETag`` are cached per ``(page_id, expand)``; later fetches
+        send ``If-None-Match`` and reuse the cached page when the server answers 304.
+        Concurrent calls for the same page and expansions share a single request.
+
         Args:
             page_id: Confluence page ID
             expand: Additional properties to expand (version, body.storage, etc.)
@@ -223,51 +645,87 @@ class ConfluenceClient:
             AuthError: If authentication fails
             ConfluenceAPIError: For other API errors
         """
-        start_time = time.time()
-        params = {"expand": ",".join(expand)} if expand else None
-
-        logger.info(
-            "Getting page by ID",
-            extra={"page_id": page_id, "expand": list(expand), "operation": "get_page_by_id"},
+        expand = tuple(expand)
+        return self._single_flight(
+            ("id", page_id, expand), self._get_page_by_id, page_id=page_id, expand=expand
         )
 
+    def _get_page_by_id(self, *, page_id: str, expand: tuple[str, ...]) -> Page:
+        start_time = time.monotonic()
+        params = {"expand": _join_expand(expand)} if expand else None
+        cache_key = (page_id, expand)
+        cached = self._cached_page(cache_key)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Getting page by ID",
+                extra={"page_id": page_id, "expand": list(expand), "operation": "get_page_by_id"},
+            )
+
+        if cached and self._is_fresh(cached[2]):
+            self._record_cache(hit=True)
+            return cached[1]
+
         try:
             resp = self.session.get(
-                self._url(f"/rest/api/content/{page_id}"), params=params, timeout=self.timeout
+                self._url(f"/rest/api/content/{page_id}"),
+                params=params,
+                headers={"If-None-Match": cached[0]} if cached and cached[0] else None,
+                timeout=self.timeout,
             )
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
 
-            logger.info(
-                "API call completed",
-                extra={
-                    "operation": "get_page_by_id",
-                    "page_id": page_id,
-                    "status_code": resp.status_code,
-                    "duration_ms": round(duration * 1000, 2),
-                    "success": resp.ok,
-                },
-            )
+            if cached and resp.status_code == 304:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Page not modified; using cached copy",
+                        extra={
+                            "operation": "get_page_by_id",
+                            "page_id": page_id,
+                            "duration_ms": round(duration * 1000, 2),
+                        },
+                    )
+                self._record_cache(hit=True)
+                self._store_page(cache_key, cached[0], cached[1])
+                return cached[1]
+
+            self._record_cache(hit=False)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "API call completed",
+                    extra={
+                        "operation": "get_page_by_id",
+                        "page_id": page_id,
+                        "status_code": resp.status_code,
+                        "duration_ms": round(duration * 1000, 2),
+                        "success": resp.ok,
+                    },
+                )
 
             if not resp.ok:
                 self._handle_error(resp, f"get_page_by_id(page_id={page_id})")
 
             page = self._page_from_json(resp.json())
+            etag = resp.headers.get("ETag")
+            if etag or self.page_cache_ttl:
+                self._store_page(cache_key, etag, page)
 
-            logger.info(
-                "Page retrieved successfully",
-                extra={
-                    "operation": "get_page_by_id",
-                    "page_id": page_id,
-                    "page_title": page.title,
-                    "version": page.version.number,
-                    "space_key": page.space_key,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Page retrieved successfully",
+                    extra={
+                        "operation": "get_page_by_id",
+                        "page_id": page_id,
+                        "page_title": page.title,
+                        "version": page.version.number,
+                        "space_key": page.space_key,
+                    },
+                )
 
             return page
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "API call failed",
                 extra={
@@ -285,6 +743,8 @@ class ConfluenceClient:
     ) -> Page | None:
         """Get page by title with comprehensive logging.
 
+        Concurrent calls for the same space, title and expansions share a single request.
+
         Args:
             space_key: Confluence space key
             title: Page title to search for
@@ -297,74 +757,100 @@ class ConfluenceClient:
             AuthError: If authentication fails
             ConfluenceAPIError: For other API errors
         """
-        start_time = time.time()
+        expand = tuple(expand)
+        return self._single_flight(
+            ("title", space_key, title, expand),
+            self._get_page_by_title,
+            space_key=space_key,
+            title=title,
+            expand=expand,
+        )
+
+    def _get_page_by_title(
+        self, *, space_key: str, title: str, expand: tuple[str, ...]
+    ) -> Page | None:
+        start_time = time.monotonic()
         params: dict[str, str | int] = {
             "title": title,
             "spaceKey": space_key,
-            "expand": ",".join(expand),
+            "expand": _join_expand(expand),
             "limit": 1,
         }
+        cache_key = (space_key, title, expand)
 
-        logger.info(
-            "Getting page by title",
-            extra={
-                "space_key": space_key,
-                "title": title,
-                "expand": list(expand),
-                "operation": "get_page_by_title",
-            },
-        )
-
-        try:
-            resp = self.session.get(
-                self._url("/rest/api/content"), params=params, timeout=self.timeout
-            )
-            duration = time.time() - start_time
-
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "API call completed",
+                "Getting page by title",
                 extra={
-                    "operation": "get_page_by_title",
                     "space_key": space_key,
                     "title": title,
-                    "status_code": resp.status_code,
-                    "duration_ms": round(duration * 1000, 2),
-                    "success": resp.ok,
+                    "expand": list(expand),
+                    "operation": "get_page_by_title",
                 },
             )
 
-            if not resp.ok:
-                self._handle_error(resp, f"get_page_by_title(space={space_key}, title={title})")
+        if self.page_cache_ttl:
+            cached = self._cached_title(cache_key)
+            if cached is not None:
+                self._record_cache(hit=True)
+                return cached
+            self._record_cache(hit=False)
 
-            results = resp.json().get("results", [])
+        try:
+            resp = self.session.get(
+                self._url("/rest/api/content"), params=params, timeout=self.timeout
+            )
+            duration = time.monotonic() - start_time
 
-            if results:
-                page = self._page_from_json(results[0])
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    "Page found",
+                    "API call completed",
                     extra={
                         "operation": "get_page_by_title",
                         "space_key": space_key,
                         "title": title,
-                        "page_id": page.id,
-                        "page_title": page.title,
-                        "version": page.version.number,
+                        "status_code": resp.status_code,
+                        "duration_ms": round(duration * 1000, 2),
+                        "success": resp.ok,
                     },
                 )
+
+            if not resp.ok:
+                self._handle_error(resp, f"get_page_by_title(space={space_key}, title={title})")
+
+            results = resp.json().get("results", [])
+
+            if results:
+                page = self._page_from_json(results[0])
+                if self.page_cache_ttl:
+                    self._store_title(cache_key, page)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Page found",
+                        extra={
+                            "operation": "get_page_by_title",
+                            "space_key": space_key,
+                            "title": title,
+                            "page_id": page.id,
+                            "page_title": page.title,
+                            "version": page.version.number,
+                        },
+                    )
                 return page
             else:
-                logger.info(
-                    "Page not found",
-                    extra={
-                        "operation": "get_page_by_title",
-                        "space_key": space_key,
-                        "title": title,
-                    },
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Page not found",
+                        extra={
+                            "operation": "get_page_by_title",
+                            "space_key": space_key,
+                            "title": title,
+                        },
+                    )
                 return None
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "API call failed",
                 extra={
@@ -378,6 +864,135 @@ class ConfluenceClient:
             )
             raise
 
+    def get_pages_by_titles(
+        self,
+        *,
+        space_key: str,
+        titles: Iterable[str],
+        expand: tuple[str, ...] = ("version",),
+    ) -> dict[str, Page]:
+        """Look up many pages in a space with batched CQL searches.
+
+        Titles are OR-joined into CQL queries of at most ``TITLE_BATCH_SIZE`` titles each,
+        so checking N pages costs roughly N / ``TITLE_BATCH_SIZE`` requests instead of N.
+
+        Args:
+            space_key: Confluence space key
+            titles: Page titles to search for
+            expand: Additional properties to expand (version, body.storage, etc.)
+
+        Returns:
+            Dictionary of title -> Page for every title that exists; missing titles are
+            simply absent
+
+        Raises:
+            AuthError: If authentication fails
+            ConfluenceAPIError: For other API errors
+        """
+        wanted = list(dict.fromkeys(titles))
+        found: dict[str, Page] = {}
+        expand_str = _join_expand(tuple(expand))
+
+        for offset in range(0, len(wanted), self.TITLE_BATCH_SIZE):
+            batch = wanted[offset : offset + self.TITLE_BATCH_SIZE]
+            title_clause = " OR ".join(f"title={_cql_quote(title)}" for title in batch)
+            params: dict[str, str | int] = {
+                "cql": f"space={_cql_quote(space_key)} AND type=page AND ({title_clause})",
+                "limit": len(batch),
+                "expand": expand_str,
+            }
+
+            start_time = time.monotonic()
+            resp = self.session.get(
+                self._url("/rest/api/content/search"), params=params, timeout=self.timeout
+            )
+            duration = time.monotonic() - start_time
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "API call completed",
+                    extra={
+                        "operation": "get_pages_by_titles",
+                        "space_key": space_key,
+                        "title_count": len(batch),
+                        "status_code": resp.status_code,
+                        "duration_ms": round(duration * 1000, 2),
+                        "success": resp.ok,
+                    },
+                )
+
+            if not resp.ok:
+                self._handle_error(
+                    resp, f"get_pages_by_titles(space={space_key}, count={len(batch)})"
+                )
+
+            requested = set(batch)
+            for result in resp.json().get("results", []):
+                page = self._page_from_json(result)
+                if page.title in requested:
+                    found[page.title] = page
+
+        return found
+
+    def get_pages_by_ids(
+        self, page_ids: Iterable[str], *, expand: tuple[str, ...] = ("version",)
+    ) -> dict[str, Page]:
+        """Fetch many pages by ID with batched CQL searches.
+
+        IDs are combined into ``id in (...)`` queries of at most ``ID_BATCH_SIZE`` IDs each,
+        so fetching N pages costs roughly N / ``ID_BATCH_SIZE`` requests instead of N.
+
+        Args:
+            page_ids: Confluence page IDs
+            expand: Additional properties to expand (version, body.storage, etc.)
+
+        Returns:
+            Dictionary of page ID -> Page in the order of ``page_ids``; IDs that do not
+            exist (or are not visible) are simply absent
+
+        Raises:
+            AuthError: If authentication fails
+            ConfluenceAPIError: For other API errors
+        """
+        wanted = list(dict.fromkeys(page_ids))
+        found: dict[str, Page] = {}
+        expand_str = _join_expand(tuple(expand))
+
+        for offset in range(0, len(wanted), self.ID_BATCH_SIZE):
+            batch = wanted[offset : offset + self.ID_BATCH_SIZE]
+            params: dict[str, str | int] = {
+                "cql": f"id in ({','.join(_cql_quote(page_id) for page_id in batch)})",
+                "limit": len(batch),
+                "expand": expand_str,
+            }
+
+            start_time = time.monotonic()
+            resp = self.session.get(
+                self._url("/rest/api/content/search"), params=params, timeout=self.timeout
+            )
+            duration = time.monotonic() - start_time
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "API call completed",
+                    extra={
+                        "operation": "get_pages_by_ids",
+                        "page_count": len(batch),
+                        "status_code": resp.status_code,
+                        "duration_ms": round(duration * 1000, 2),
+                        "success": resp.ok,
+                    },
+                )
+
+            if not resp.ok:
+                self._handle_error(resp, f"get_pages_by_ids(count={len(batch)})")
+
+            for result in resp.json().get("results", []):
+                page = self._page_from_json(result)
+                found[page.id] = page
+
+        return {page_id: found[page_id] for page_id in wanted if page_id in found}
+
     def create_page(
         self,
         *,
@@ -404,19 +1019,20 @@ class ConfluenceClient:
             AuthError: If insufficient permissions
             ConfluenceAPIError: For other API errors
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        logger.info(
-            "Creating new page",
-            extra={
-                "operation": "create_page",
-                "space_key": space_key,
-                "title": title,
-                "parent_id": parent_id,
-                "has_labels": labels is not None,
-                "content_size": len(html_storage),
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Creating new page",
+                extra={
+                    "operation": "create_page",
+                    "space_key": space_key,
+                    "title": title,
+                    "parent_id": parent_id,
+                    "has_labels": labels is not None,
+                    "content_size": len(html_storage),
+                },
+            )
 
         try:
             payload: dict[str, Any] = {
@@ -428,61 +1044,67 @@ class ConfluenceClient:
             if parent_id:
                 payload["ancestors"] = [{"id": parent_id}]
 
+            body, headers = self._encode_body(payload)
             resp = self.session.post(
-                self._url("/rest/api/content"), data=json.dumps(payload), timeout=self.timeout
+                self._url("/rest/api/content"), data=body, headers=headers, timeout=self.timeout
             )
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
 
-            logger.info(
-                "Create page API call completed",
-                extra={
-                    "operation": "create_page",
-                    "space_key": space_key,
-                    "title": title,
-                    "status_code": resp.status_code,
-                    "duration_ms": round(duration * 1000, 2),
-                    "success": resp.ok,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Create page API call completed",
+                    extra={
+                        "operation": "create_page",
+                        "space_key": space_key,
+                        "title": title,
+                        "status_code": resp.status_code,
+                        "duration_ms": round(duration * 1000, 2),
+                        "success": resp.ok,
+                    },
+                )
 
             if not resp.ok:
                 self._handle_error(resp, f"create_page(space={space_key}, title={title})")
 
             page = self._page_from_json(resp.json())
 
-            # Add labels if provided
-            if labels:
+            # Add labels if provided; materialised once so iterators are not exhausted
+            # before they are logged
+            label_names = _unique_labels(labels)
+            if label_names:
                 try:
-                    self.add_labels(page.id, labels)
-                    logger.info(
-                        "Labels added successfully",
-                        extra={
-                            "operation": "create_page",
-                            "page_id": page.id,
-                            "labels": list(labels),
-                        },
-                    )
+                    self._post_labels(page.id, label_names)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "Labels added successfully",
+                            extra={
+                                "operation": "create_page",
+                                "page_id": page.id,
+                                "labels": label_names,
+                            },
+                        )
                 except ConfluenceAPIError as e:
                     logger.warning(
                         "Failed to add labels to page",
                         extra={"operation": "create_page", "page_id": page.id, "error": str(e)},
                     )
 
-            logger.info(
-                "Page created successfully",
-                extra={
-                    "operation": "create_page",
-                    "page_id": page.id,
-                    "page_title": page.title,
-                    "space_key": page.space_key,
-                    "version": page.version.number,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Page created successfully",
+                    extra={
+                        "operation": "create_page",
+                        "page_id": page.id,
+                        "page_title": page.title,
+                        "space_key": page.space_key,
+                        "version": page.version.number,
+                    },
+                )
 
             return page
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "Create page failed",
                 extra={
@@ -523,35 +1145,37 @@ class ConfluenceClient:
             AuthError: If insufficient permissions
             ConfluenceAPIError: For other API errors
         """
-        start_time = time.time()
-
-        logger.info(
-            "Updating page",
-            extra={
-                "operation": "update_page",
-                "page_id": page_id,
-                "expected_version": expected_version,
-                "has_title_update": title is not None,
-                "content_size": len(html_storage),
-            },
-        )
-
-        try:
-            # Handle version control and title resolution
-            expected_version, title = self._resolve_version_and_title(
-                page_id, expected_version, title
-            )
+        start_time = time.monotonic()
 
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "Prepared update payload",
+                "Updating page",
                 extra={
                     "operation": "update_page",
                     "page_id": page_id,
-                    "title": title,
-                    "target_version": expected_version,
+                    "expected_version": expected_version,
+                    "has_title_update": title is not None,
+                    "content_size": len(html_storage),
                 },
             )
 
+        try:
+            # Handle version control and title resolution
+            expected_version, title = self._resolve_version_and_title(
+                page_id, expected_version, title
+            )
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Prepared update payload",
+                    extra={
+                        "operation": "update_page",
+                        "page_id": page_id,
+                        "title": title,
+                        "target_version": expected_version,
+                    },
+                )
+
             payload: dict[str, Any] = {
                 "id": page_id,
                 "type": "page",
@@ -563,46 +1187,51 @@ class ConfluenceClient:
             if parent_id:
                 payload["ancestors"] = [{"id": parent_id}]
 
+            body, headers = self._encode_body(payload)
             resp = self.session.put(
                 self._url(f"/rest/api/content/{page_id}"),
-                data=json.dumps(payload),
+                data=body,
+                headers=headers,
                 timeout=self.timeout,
             )
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
 
-            logger.info(
-                "Update page API call completed",
-                extra={
-                    "operation": "update_page",
-                    "page_id": page_id,
-                    "target_version": expected_version,
-                    "status_code": resp.status_code,
-                    "duration_ms": round(duration * 1000, 2),
-                    "success": resp.ok,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Update page API call completed",
+                    extra={
+                        "operation": "update_page",
+                        "page_id": page_id,
+                        "target_version": expected_version,
+                        "status_code": resp.status_code,
+                        "duration_ms": round(duration * 1000, 2),
+                        "success": resp.ok,
+                    },
+                )
 
             if not resp.ok:
                 self._handle_error(resp, f"update_page(page_id={page_id})")
 
             updated_page = self._page_from_json(resp.json())
+            self._forget_page(page_id)
 
-            logger.info(
-                "Page updated successfully",
-                extra={
-                    "operation": "update_page",
-                    "page_id": page_id,
-                    "page_title": updated_page.title,
-                    "old_version": expected_version - 1,
-                    "new_version": updated_page.version.number,
-                    "space_key": updated_page.space_key,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Page updated successfully",
+                    extra={
+                        "operation": "update_page",
+                        "page_id": page_id,
+                        "page_title": updated_page.title,
+                        "old_version": expected_version - 1,
+                        "new_version": updated_page.version.number,
+                        "space_key": updated_page.space_key,
+                    },
+                )
 
             return updated_page
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "Update page failed",
                 extra={
@@ -617,13 +1246,22 @@ class ConfluenceClient:
             raise
 
     def add_labels(self, page_id: str, labels: Iterable[str]) -> None:
-        """Add labels to a page."""
-        label_objects: list[dict[str, str]] = [
-            {"prefix": "global", "name": label} for label in labels
-        ]
+        """Add labels to a page in a single request.
+
+        Duplicate labels are sent once, and no request is made when there are none.
+        """
+        label_names = _unique_labels(labels)
+        if label_names:
+            self._post_labels(page_id, label_names)
+
+    def _post_labels(self, page_id: str, label_names: list[str]) -> None:
+        """POST already de-duplicated, non-empty ``label_names`` to a page in one call."""
+        label_objects = [{"prefix": "global", "name": name} for name in label_names]
+        body, headers = self._encode_body(label_objects)
         resp = self.session.post(
             self._url(f"/rest/api/content/{page_id}/label"),
-            data=json.dumps(label_objects),
+            data=body,
+            headers=headers,
             timeout=self.timeout,
         )
         if not resp.ok:
@@ -685,11 +1323,11 @@ class ConfluenceClient:
 
     @staticmethod
     def _page_from_json(data: dict[str, Any]) -> Page:
-        page_id = data.get("id") or (data.get("content") or {}).get("id")
+        page_id = data.get("id") or (data.get("content") or _EMPTY).get("id")
         title = data.get("title", "")
-        space_key = (data.get("space") or {}).get("key") or ""
-        version_num = (data.get("version") or {}).get("number") or 1
-        storage = (data.get("body") or {}).get("storage") or {}
+        space_key = (data.get("space") or _EMPTY).get("key") or ""
+        version_num = (data.get("version") or _EMPTY).get("number") or 1
+        storage = (data.get("body") or _EMPTY).get("storage") or _EMPTY
         body_storage = storage.get("value") if storage.get("representation") == "storage" else None
         return Page(
             id=str(page_id),
@@ -698,3 +1336,153 @@ class ConfluenceClient:
             version=PageVersion(number=int(version_num)),
             body_storage=body_storage,
         )
+
+
+class AsyncConfluenceClient:
+    """Awaitable facade over a synchronous :class:`ConfluenceClient`.
+
+    Each call is dispatched to a worker thread with :func:`asyncio.to_thread`, so callers
+    can keep several Confluence requests in flight at once while sharing the wrapped
+    client's pooled ``requests`` session (and therefore its TCP/TLS connections).
+    ``max_concurrency`` caps how many calls run at once so that large fan-outs stay
+    within the server's rate limits. Used as ``async with``, the wrapped client's
+    session is closed on exit.
+    """
+
+    def __init__(self, client: ConfluenceClient, *, max_concurrency: int | None = None) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.client = client
+        self.max_concurrency = max_concurrency
+        # Created on first use so it binds to the running event loop
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def __aenter__(self) -> AsyncConfluenceClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.client.session.close()
+
+    async def _call(self, func: Any, /, *args: Any, **kwargs: Any) -> Any:
+        """Run ``func`` in a worker thread, respecting ``max_concurrency``."""
+        if self.max_concurrency is None:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def get_page_by_id(self, page_id: str, **kwargs: Any) -> Page:
+        """Awaitable variant of :meth:`ConfluenceClient.get_page_by_id`."""
+        return await self._call(self.client.get_page_by_id, page_id, **kwargs)
+
+    async def get_page_by_title(self, *, space_key: str, title: str, **kwargs: Any) -> Page | None:
+        """Awaitable variant of :meth:`ConfluenceClient.get_page_by_title`."""
+        return await self._call(
+            self.client.get_page_by_title, space_key=space_key, title=title, **kwargs
+        )
+
+    async def get_pages_by_titles(
+        self, *, space_key: str, titles: Iterable[str], **kwargs: Any
+    ) -> dict[str, Page]:
+        """Awaitable variant of :meth:`ConfluenceClient.get_pages_by_titles`."""
+        return await self._call(
+            self.client.get_pages_by_titles, space_key=space_key, titles=titles, **kwargs
+        )
+
+    async def get_pages_by_ids(self, page_ids: Iterable[str], **kwargs: Any) -> dict[str, Page]:
+        """Awaitable variant of :meth:`ConfluenceClient.get_pages_by_ids`."""
+        return await self._call(self.client.get_pages_by_ids, page_ids, **kwargs)
+
+    async def create_page(
+        self, *, space_key: str, title: str, html_storage: str, **kwargs: Any
+    ) -> Page:
+        """Awaitable variant of :meth:`ConfluenceClient.create_page`."""
+        return await self._call(
+            self.client.create_page,
+            space_key=space_key,
+            title=title,
+            html_storage=html_storage,
+            **kwargs,
+        )
+
+    async def update_page(self, *, page_id: str, html_storage: str, **kwargs: Any) -> Page:
+        """Awaitable variant of :meth:`ConfluenceClient.update_page`."""
+        return await self._call(
+            self.client.update_page, page_id=page_id, html_storage=html_storage, **kwargs
+        )
+
+    async def add_labels(self, page_id: str, labels: Iterable[str]) -> None:
+        """Awaitable variant of :meth:`ConfluenceClient.add_labels`."""
+        # add_labels materialises the labels itself, in the worker thread
+        await self._call(self.client.add_labels, page_id, labels)
+
+    async def update_pages(self, updates: Iterable[dict[str, Any]]) -> list[Page]:
+        """Update several pages concurrently.
+
+        Current versions and titles that the updates leave out are fetched together with
+        one batched :meth:`get_pages_by_ids` lookup rather than one GET per page. That
+        lookup goes through the search index, which can lag behind recent edits, so an
+        update whose version came from it is retried once on a version conflict with
+        the version resolved by :meth:`update_page` itself.
+
+        Args:
+            updates: Keyword arguments for :meth:`update_page`, one mapping per page
+
+        Returns:
+            Updated pages, in the order of ``updates``
+
+        Raises:
+            ConfluenceAPIError: The first error raised by any update
+        """
+        updates = [dict(update) for update in updates]
+        resolved: list[dict[str, Any]] = [{} for _ in updates]
+        unresolved = [
+            update["page_id"]
+            for update in updates
+            if update.get("expected_version") is None or not update.get("title")
+        ]
+        if unresolved:
+            current = await self.get_pages_by_ids(unresolved)
+            for update, filled in zip(updates, resolved):
+                page = current.get(update["page_id"])
+                if page is None:
+                    continue  # update_page resolves (and reports) it on its own
+                if update.get("expected_version") is None:
+                    filled["expected_version"] = page.version.number
+                # A title is only trusted at the version it belongs to; a lagging index
+                # could otherwise undo a recent rename, so update_page resolves the rest
+                if not update.get("title") and (
+                    "expected_version" in filled
+                    or page.version.number == update["expected_version"]
+                ):
+                    filled["title"] = page.title
+
+        async def update_one(update: dict[str, Any], filled: dict[str, Any]) -> Page:
+            try:
+                return await self.update_page(**{**update, **filled})
+            except ConflictError:
+                if "expected_version" not in filled:
+                    raise
+                # The batched version may be stale; let update_page fetch the current one
+                return await self.update_page(**update)
+
+        return list(
+            await asyncio.gather(
+                *(update_one(update, filled) for update, filled in zip(updates, resolved))
+            )
+        )
+
+    async def create_pages(self, pages: Iterable[dict[str, Any]]) -> list[Page]:
+        """Create several pages concurrently.
+
+        Args:
+            pages: Keyword arguments for :meth:`create_page`, one mapping per page
+
+        Returns:
+            Created pages, in the order of ``pages``
+
+        Raises:
+            ConfluenceAPIError: The first error raised by any creation
+        """
+        return list(await asyncio.gather(*(self.create_page(**page) for page in pages)))
@@ -8,6 +8,15 @@ import re
 from typing import List
 from urllib.parse import urlparse
 
+# ATX headers (#, ##, ###) converted in a single pass
+_HEADER_RE = re.compile(r"^(#{1,3}) (.*)", re.MULTILINE)
+
+
+def _header_replacement(match: re.Match[str]) -> str:
+    """Render a header match as the <hN> tag matching its number of '#' characters."""
+    level = len(match.group(1))
+    return f"<h{level}>{match.group(2)}</h{level}>"
+
 
 class MarkdownToConfluenceConverter:
     """Convert Markdown to Confluence storage format HTML."""
@@ -69,9 +78,7 @@ class MarkdownToConfluenceConverter:
         markdown = re.sub(r"`([^`]+)`", r"<code>\1</code>", markdown)
 
         # Convert headers
-        markdown = re.sub(r"^### (.*)", r"<h3>\1</h3>", markdown, flags=re.MULTILINE)
-        markdown = re.sub(r"^## (.*)", r"<h2>\1</h2>", markdown, flags=re.MULTILINE)
-        markdown = re.sub(r"^# (.*)", r"<h1>\1</h1>", markdown, flags=re.MULTILINE)
+        markdown = _HEADER_RE.sub(_header_replacement, markdown)
 
         # Convert lists - process them to match expected format exactly
         lines = markdown.split("\n")
@@ -169,25 +176,15 @@ class MarkdownToConfluenceConverter:
 
         markdown = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", secure_link_replacement, markdown)
 
-        # Convert paragraphs (but skip lines that are already HTML or empty)
-        lines = markdown.split("\n")
-        result: List[str] = []
-
-        for line in lines:
-            line = line.strip()
-
-            # Only wrap in paragraphs if not already HTML and not a placeholder
-            if (
-                line
-                and not line.startswith("<")
-                and not line.startswith("__CODE_BLOCK_")
-                and not line.startswith("__LIST_")
-            ):
-                line = f"<p>{line}</p>"
-
-            # Only add non-empty lines to avoid excessive whitespace
-            if line:
-                result.append(line)
+        # Convert paragraphs: wrap lines that are not already HTML or a placeholder, and
+        # drop empty lines to avoid excessive whitespace
+        result: List[str] = [
+            line
+            if line[:1] == "<" or line.startswith(("__CODE_BLOCK_", "__LIST_"))
+            else f"<p>{line}</p>"
+            for line in map(str.strip, markdown.split("\n"))
+            if line
+        ]
 
         # Join result with proper spacing, but handle lists specially
         final_result = "\n\n".join(result)
@@ -11,7 +11,7 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, TypedDict
+from typing import Any, Dict, Optional, Tuple, TypedDict
 
 
 class MappingEntry(TypedDict, total=False):
@@ -20,6 +20,7 @@ class MappingEntry(TypedDict, total=False):
     page_id: str
     space_key: str
     title: str
+    last_published_hash: str
 
 
 class MappingStore:
@@ -33,6 +34,9 @@ class MappingStore:
         """
         self.logger = logging.getLogger(__name__)
         self._repo_root: Optional[Path] = None
+        # Parsed mapping file, reused while the file's (mtime_ns, size) stamp is unchanged
+        self._cache: Optional[Dict[str, MappingEntry]] = None
+        self._cache_stamp: Optional[Tuple[int, int]] = None
 
         if mapping_file is None:
             # Find the repository root by looking for .git directory
@@ -62,12 +66,24 @@ class MappingStore:
     def _load_mappings(self) -> Dict[str, MappingEntry]:
         """Load mappings from the JSON file.
 
+        The parsed file is cached and only re-read when its modification time or size
+        changes, so external edits are still picked up. The returned dictionary is
+        shared; callers that modify mappings must work on a copy.
+
         Returns:
             Dictionary of path -> mapping entry
         """
-        if not self.mapping_file.exists():
+        try:
+            stat = self.mapping_file.stat()
+        except OSError:
+            self._cache = self._cache_stamp = None
             return {}
 
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache_stamp == stamp:
+            return self._cache
+
+        data: Dict[str, MappingEntry]
         try:
             with open(self.mapping_file, encoding="utf-8") as f:
                 data = json.load(f)
@@ -75,13 +91,14 @@ class MappingStore:
             # Validate the loaded data
             if not isinstance(data, dict):
                 self.logger.warning("Invalid mapping file format, starting fresh")
-                return {}
-
-            return data
+                data = {}
 
         except (json.JSONDecodeError, OSError) as e:
             self.logger.warning(f"Failed to load mappings: {e}, starting fresh")
-            return {}
+            data = {}
+
+        self._cache, self._cache_stamp = data, stamp
+        return data
 
     def _save_mappings(self, mappings: Dict[str, MappingEntry]) -> None:
         """Save mappings to the JSON file.
@@ -90,6 +107,7 @@ class MappingStore:
             mappings: Dictionary of mappings to save
         """
         self._ensure_directory_exists()
+        self._cache = self._cache_stamp = None
 
         try:
             with open(self.mapping_file, "w", encoding="utf-8") as f:
@@ -213,8 +231,8 @@ class MappingStore:
         # Normalize path to canonical repository-relative form
         normalized_path = self._normalize_path(path)
 
-        # Load current mappings
-        mappings = self._load_mappings()
+        # Load current mappings (copied so a failed save leaves the cache intact)
+        mappings = dict(self._load_mappings())
 
         # Check if this path already exists
         existing_entry = mappings.get(normalized_path)
@@ -266,19 +284,55 @@ class MappingStore:
             path: Path to the Markdown file
 
         Returns:
-            Mapping entry if found, None otherwise
+            Copy of the mapping entry if found, None otherwise
         """
         normalized_path = self._normalize_path(path)
-        mappings = self._load_mappings()
-        return mappings.get(normalized_path)
+        entry = self._load_mappings().get(normalized_path)
+        return entry.copy() if entry is not None else None
+
+    def index(self) -> Dict[str, MappingEntry]:
+        """Return all mappings keyed by normalized path for bulk lookups.
+
+        The index is the cached parse of the mapping file and is reused until the file
+        changes. Treat the returned dictionary as read-only.
+
+        Returns:
+            Dictionary of normalized path -> mapping entry
+        """
+        return self._load_mappings()
 
     def list_mappings(self) -> Dict[str, MappingEntry]:
         """List all current mappings.
 
+        The result is a copy that callers may modify freely; use :meth:`index` for a
+        read-only view without copying.
+
         Returns:
             Dictionary of all mappings
         """
-        return self._load_mappings()
+        return {path: entry.copy() for path, entry in self._load_mappings().items()}
+
+    def record_published_hashes(self, hashes: Dict[str, str]) -> None:
+        """Record the content hash last published for each mapped file.
+
+        All hashes are written in a single load/save cycle. Paths without a mapping
+        are ignored.
+
+        Args:
+            hashes: Dictionary of file path -> content hash
+        """
+        mappings = dict(self._load_mappings())
+        changed = False
+
+        for path, digest in hashes.items():
+            key = self._normalize_path(path)
+            entry = mappings.get(key)
+            if entry is not None and entry.get("last_published_hash") != digest:
+                mappings[key] = {**entry, "last_published_hash": digest}
+                changed = True
+
+        if changed:
+            self._save_mappings(mappings)
 
     def remove_mapping(self, path: str) -> bool:
         """Remove a mapping for a specific file path.
@@ -290,7 +344,7 @@ class MappingStore:
             True if mapping was removed, False if it didn't exist
         """
         normalized_path = self._normalize_path(path)
-        mappings = self._load_mappings()
+        mappings = dict(self._load_mappings())
 
         if normalized_path in mappings:
             del mappings[normalized_path]
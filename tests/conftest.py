@@ -1,7 +1,10 @@
+import types
 from typing import Optional
 
 import pytest
 
+from confluence_markdown.confluence_api import Page
+
 
 class StubConverter:
     def __init__(self):
@@ -17,10 +20,21 @@ class StubClient:
         self.created = []
         self.updated = []
         self.existing = existing or {}
+        self.pages = {}
+
+    def get_page_by_id(self, page_id: str, *, expand=("version",)):
+        return self.pages.get(page_id) or StubPage(page_id=page_id, title=f"Page {page_id}")
 
-    def get_page_by_title(self, *, space_key: str, title: str):
+    def get_page_by_title(self, *, space_key: str, title: str, expand=("version",)):
         return self.existing.get((space_key, title))
 
+    def get_pages_by_titles(self, *, space_key: str, titles, expand=("version",)):
+        return {
+            title: self.existing[(space_key, title)]
+            for title in titles
+            if (space_key, title) in self.existing
+        }
+
     def create_page(
         self,
         *,
@@ -31,16 +45,30 @@ class StubClient:
         labels=None,
     ):
         self.created.append((space_key, title, html_storage, parent_id, tuple(labels or ())))
+        return StubPage(page_id=f"new-{len(self.created)}", title=title)
 
-    def update_page(self, *, page_id: str, html_storage: str, title: Optional[str] = None):
+    def update_page(
+        self,
+        *,
+        page_id: str,
+        html_storage: str,
+        title: Optional[str] = None,
+        expected_version: Optional[int] = None,
+        parent_id=None,
+    ):
         self.updated.append((page_id, html_storage, title))
+        return StubPage(page_id=page_id, title=title or f"Page {page_id}")
 
 
 class StubPage:
-    def __init__(self, page_id: str, title: str):
+    def __init__(self, page_id: str, title: str, body_storage: Optional[str] = None):
         self.id = page_id
         self.title = title
         self.space_key = "DOC"
+        self.version = types.SimpleNamespace(number=1)
+        self.body_storage = body_storage
+
+    matches = Page.matches
 
 
 @pytest.fixture()
@@ -56,3 +84,13 @@ def stub_client():
 @pytest.fixture()
 def stub_page():
     return StubPage(page_id="stub", title="Stub Page")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cli_environment():
+    """Re-read Confluence settings from the environment in every test."""
+    from confluence_markdown.cli import _env_credentials
+
+    _env_credentials.cache_clear()
+    yield
+    _env_credentials.cache_clear()
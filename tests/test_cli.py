@@ -42,6 +42,14 @@ class TestCLI:
             main(["map", "unknown"])
         assert exc_info.value.code == 2  # argparse error
 
+    def test_cli_map_without_subcommand(self, capsys, caplog):
+        """Test that map without a subcommand reports the error and shows help."""
+        exit_code = main(["map"])
+        assert exit_code == 1
+
+        assert "Unknown map command" in caplog.text
+        assert "Available commands" in capsys.readouterr().err
+
     def test_cli_map_add_file_not_exists(self, capsys):
         """Test that map add fails when file doesn't exist."""
         exit_code = main(["map", "add", "--path", "nonexistent.md", "--page", "123456"])
@@ -220,6 +228,114 @@ class TestCLI:
         assert result.returncode == 0
         assert "conmd" in result.stdout
 
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["map", "add", "--page", "123", "--path", "docs/a.md"],
+            ["-v", "map", "add", "--path", "a.md", "--space", "DOC", "--title", "T"],
+            ["push", "--file", "README.md"],
+            ["push", "--file", "a.md", "docs/b.md"],
+        ],
+    )
+    def test_fast_parse_matches_argparse(self, argv):
+        """Test that the fast path yields the same namespace as the full parser."""
+        from confluence_markdown.cli import _fast_parse, create_parser
+
+        assert _fast_parse(argv) == create_parser().parse_args(argv)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["--help"],
+            ["map", "add", "--page", "123"],
+            ["map", "add", "--path=a.md"],
+            ["map", "add", "--pa", "a.md"],
+            ["map", "add", "--path", "a.md", "--path", "b.md"],
+            ["map", "add", "--path", "a.md", "b.md"],
+            ["push", "--file"],
+            ["push", "--file", "a.md", "-v"],
+        ],
+    )
+    def test_fast_parse_defers_to_argparse(self, argv):
+        """Test that unusual command lines fall back to argparse."""
+        from confluence_markdown.cli import _fast_parse
+
+        assert _fast_parse(argv) is None
+
+    def test_create_parser_is_reused(self):
+        """Test that the parser is built once and survives repeated parses."""
+        from confluence_markdown.cli import create_parser
+
+        parser = create_parser()
+        first = parser.parse_args(["map", "add", "--path", "a.md", "--page", "1"])
+        second = parser.parse_args(["push", "--file", "b.md"])
+
+        assert create_parser() is parser
+        assert first.page_id == "1" and not hasattr(second, "page_id")
+
+    def test_mapping_store_is_reused(self, tmp_path, monkeypatch):
+        """Test that commands share one mapping store and still see new mappings."""
+        from confluence_markdown.cli import _get_mapping_store
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "doc.md").write_text("# Doc")
+
+        store = _get_mapping_store()
+        assert main(["map", "add", "--path", "doc.md", "--page", "42"]) == 0
+
+        assert _get_mapping_store() is store
+        assert store.get_mapping("doc.md") == {"page_id": "42"}
+
+    def test_env_credentials_read_once(self, monkeypatch):
+        """Test that Confluence settings are read from the environment once and stripped."""
+        from confluence_markdown.cli import _env_credentials
+
+        monkeypatch.setenv("CMT_CONF_BASE_URL", " https://example.atlassian.net/wiki ")
+        monkeypatch.setenv("CMT_CONF_EMAIL", "")
+        monkeypatch.setenv("CMT_CONF_TOKEN", "token")
+        assert _env_credentials() == ("https://example.atlassian.net/wiki", None, "token")
+
+        monkeypatch.setenv("CMT_CONF_TOKEN", "other")
+        assert _env_credentials()[2] == "token"
+
+        _env_credentials.cache_clear()
+        assert _env_credentials()[2] == "other"
+
+    def test_setup_logging_configures_root_once(self):
+        """Test that logging is configured on first use and left alone afterwards."""
+        import subprocess
+        import sys
+
+        code = (
+            "import logging\n"
+            "from confluence_markdown.cli import setup_logging\n"
+            "root = logging.getLogger()\n"
+            "setup_logging(verbose=True)\n"
+            "assert len(root.handlers) == 1 and root.level == logging.DEBUG\n"
+            "setup_logging(verbose=False)\n"
+            "assert len(root.handlers) == 1 and root.level == logging.DEBUG\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+    def test_cli_import_defers_heavy_modules(self):
+        """Test that importing the CLI does not load the API client, converter or store."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, confluence_markdown.cli as cli\n"
+            "heavy = ('confluence_api', 'converter', 'mapping_store')\n"
+            "assert not [m for m in heavy if 'confluence_markdown.' + m in sys.modules]\n"
+            "assert cli.MappingStore.__name__ == 'MappingStore'\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
 
 class TestMappingStore:
     """Test cases for mapping store functionality."""
@@ -353,6 +469,52 @@ class TestMappingStore:
             assert "docs/test1.md" in mappings
             assert "docs/test2.md" in mappings
 
+    def test_returned_mappings_do_not_alias_the_cache(self):
+        """Test that modifying listed or fetched mappings leaves later lookups intact."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mapping_file = Path(temp_dir) / "map.json"
+            store = MappingStore(mapping_file=mapping_file)
+            store.add_mapping(path="docs/test.md", page_id="123456")
+
+            store.list_mappings()["docs/test.md"]["page_id"] = "changed"
+            store.list_mappings().clear()
+            store.get_mapping("docs/test.md")["page_id"] = "changed"
+
+            assert store.get_mapping("docs/test.md")["page_id"] == "123456"
+            assert store.index()["docs/test.md"]["page_id"] == "123456"
+
+    def test_index_is_reused_until_store_writes(self):
+        """Test that the mapping index is cached and refreshed after writes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mapping_file = Path(temp_dir) / "map.json"
+            store = MappingStore(mapping_file=mapping_file)
+            store.add_mapping(path="docs/test1.md", page_id="123456")
+
+            index = store.index()
+            assert store.index() is index
+            assert index["docs/test1.md"]["page_id"] == "123456"
+
+            store.add_mapping(path="docs/test2.md", page_id="654321")
+            assert set(store.index()) == {"docs/test1.md", "docs/test2.md"}
+
+    def test_load_mappings_reuses_parse_until_file_changes(self):
+        """Test that the mapping file is parsed once and re-read after external edits."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mapping_file = Path(temp_dir) / "map.json"
+            store = MappingStore(mapping_file=mapping_file)
+            store.add_mapping(path="docs/test.md", page_id="123456")
+
+            with patch("json.load", wraps=json.load) as mock_load:
+                store.get_mapping("docs/test.md")
+                store.list_mappings()
+                assert mock_load.call_count == 1
+
+            mapping_file.write_text(
+                json.dumps({"docs/other.md": {"page_id": "999999"}}), encoding="utf-8"
+            )
+            assert store.get_mapping("docs/other.md") == {"page_id": "999999"}
+            assert store.get_mapping("docs/test.md") is None
+
     def test_remove_mapping(self):
         """Test removing a mapping."""
         with tempfile.TemporaryDirectory() as temp_dir:
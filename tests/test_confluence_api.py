@@ -3,6 +3,7 @@
 
 """Comprehensive tests for Confluence API adapter implementation."""
 
+import gzip
 import json
 from unittest.mock import patch
 
@@ -24,11 +25,12 @@ from confluence_markdown.confluence_api import (
 class MockResponse:
     """Mock response object for testing."""
 
-    def __init__(self, status_code=200, json_body=None, text=""):
+    def __init__(self, status_code=200, json_body=None, text="", headers=None):
         self.status_code = status_code
         self._json = json_body or {}
         self.ok = 200 <= status_code < 300
         self.text = text or json.dumps(self._json)
+        self.headers = headers or {}
 
     def json(self):
         return self._json
@@ -120,6 +122,145 @@ class TestConfluenceClient:
         call_args_list = mock_logger.info.call_args_list
         assert len(call_args_list) >= 3  # Should have at least 3 log calls
 
+    @patch("requests.Session.get")
+    def test_info_logging_skipped_when_disabled(self, mock_get):
+        """Test that structured INFO records are not built when INFO is disabled."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_get.return_value = MockResponse(
+            200, {"id": "7", "title": "Quiet", "version": {"number": 1}}
+        )
+
+        with patch("confluence_markdown.confluence_api.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            client.get_page_by_id("7")
+
+        mock_logger.info.assert_not_called()
+
+    @patch("requests.Session.get")
+    def test_get_page_by_id_revalidates_with_etag(self, mock_get):
+        """Test that a cached page is reused when the server answers 304 Not Modified."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_get.side_effect = [
+            MockResponse(
+                200,
+                {"id": "42", "title": "Cached", "version": {"number": 3}},
+                headers={"ETag": '"v3"'},
+            ),
+            MockResponse(304),
+        ]
+
+        first = client.get_page_by_id("42")
+        second = client.get_page_by_id("42")
+
+        assert second is first
+        assert mock_get.call_args_list[0][1]["headers"] is None
+        assert mock_get.call_args_list[1][1]["headers"] == {"If-None-Match": '"v3"'}
+
+    @patch("requests.Session.put")
+    @patch("requests.Session.get")
+    def test_update_page_takes_title_from_cached_version(self, mock_get, mock_put):
+        """Test that a cached copy at expected_version supplies the title without a GET."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_get.return_value = MockResponse(
+            200,
+            {"id": "42", "title": "Cached", "version": {"number": 3}},
+            headers={"ETag": '"v3"'},
+        )
+        mock_put.return_value = MockResponse(
+            200, {"id": "42", "title": "Cached", "version": {"number": 4}}
+        )
+
+        client.get_page_by_id("42")
+        client.update_page(page_id="42", html_storage="<p>New</p>", expected_version=3)
+
+        assert mock_get.call_count == 1
+        payload = json.loads(mock_put.call_args[1]["data"])
+        assert payload["title"] == "Cached"
+        assert payload["version"]["number"] == 4
+
+    def test_concurrent_identical_lookups_share_one_request(self):
+        """Test that simultaneous fetches of the same page are collapsed into one GET."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        barrier = threading.Barrier(4)
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.1)
+            return MockResponse(200, {"id": "42", "title": "Shared", "version": {"number": 1}})
+
+        def fetch(_):
+            barrier.wait()
+            return client.get_page_by_id("42")
+
+        with patch.object(client.session, "get", side_effect=slow_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                pages = list(pool.map(fetch, range(4)))
+
+        assert mock_get.call_count == 1
+        assert all(page is pages[0] for page in pages)
+        assert client._inflight == {}
+
+    def test_update_detaches_inflight_lookups(self):
+        """Test that a lookup started before an update is not joined after it."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        started = threading.Event()
+        release = threading.Event()
+        versions = iter([1, 2])
+
+        def slow_get(*args, **kwargs):
+            number = next(versions)
+            if number == 1:
+                started.set()
+                release.wait(5)
+            return MockResponse(200, {"id": "42", "title": "Page", "version": {"number": number}})
+
+        with patch.object(client.session, "get", side_effect=slow_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                stale = pool.submit(client.get_page_by_id, "42")
+                started.wait(5)
+                client._forget_page("42")
+                fresh = client.get_page_by_id("42")
+                release.set()
+                assert stale.result().version.number == 1
+
+        assert fresh.version.number == 2
+        assert mock_get.call_count == 2
+        assert client._inflight == {}
+
+    @patch("requests.Session.put")
+    @patch("requests.Session.get")
+    def test_page_cache_ttl_serves_fresh_pages_from_memory(self, mock_get, mock_put):
+        """Test that pages within the TTL skip the GET until an update invalidates them."""
+        client = ConfluenceClient(
+            base_url="https://example.atlassian.net/wiki", token="test", page_cache_ttl=30
+        )
+        page_json = {"id": "42", "title": "Cached", "space": {"key": "TEST"}}
+        mock_get.side_effect = [
+            MockResponse(200, {**page_json, "version": {"number": 3}}),
+            MockResponse(200, {"results": [{**page_json, "version": {"number": 3}}]}),
+            MockResponse(200, {**page_json, "version": {"number": 4}}),
+        ]
+        mock_put.return_value = MockResponse(200, {**page_json, "version": {"number": 4}})
+
+        first = client.get_page_by_id("42")
+        assert client.get_page_by_id("42") is first
+        by_title = client.get_page_by_title(space_key="TEST", title="Cached")
+        assert client.get_page_by_title(space_key="TEST", title="Cached") is by_title
+        assert mock_get.call_count == 2
+        assert client.cache_stats() == {"hits": 2, "misses": 2, "size": 2}
+
+        client.update_page(page_id="42", html_storage="<p>New</p>", expected_version=3)
+
+        assert client.get_page_by_id("42").version.number == 4
+        assert mock_get.call_count == 3
+        assert client.cache_stats()["size"] == 1
+
     @patch("requests.Session.get")
     def test_get_page_not_found(self, mock_get):
         """Test 404 error handling for getPage method."""
@@ -166,6 +307,45 @@ class TestConfluenceClient:
         # Verify logging
         mock_logger.info.assert_called()
 
+    @patch("requests.Session.post")
+    def test_create_page_sends_utf8_json_bytes(self, mock_post):
+        """Test that page bodies are sent as unescaped UTF-8 JSON bytes."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_post.return_value = MockResponse(
+            200, {"id": "1", "title": "Café", "version": {"number": 1}}
+        )
+
+        client.create_page(space_key="TEST", title="Café", html_storage="<p>naïve</p>")
+
+        body = mock_post.call_args[1]["data"]
+        assert isinstance(body, bytes)
+        assert "<p>naïve</p>".encode() in body
+
+    @patch("requests.Session.post")
+    def test_create_page_compresses_body_when_enabled(self, mock_post):
+        """Test that compress_requests gzips large JSON bodies and sets Content-Encoding."""
+        client = ConfluenceClient(
+            base_url="https://example.atlassian.net/wiki", token="test", compress_requests=True
+        )
+        mock_post.return_value = MockResponse(
+            200, {"id": "1", "title": "Zipped", "version": {"number": 1}}
+        )
+
+        html_storage = "<p>Body</p>" * 200
+        client.create_page(space_key="TEST", title="Zipped", html_storage=html_storage)
+
+        call_kwargs = mock_post.call_args[1]
+        assert call_kwargs["headers"] == {"Content-Encoding": "gzip"}
+        assert len(call_kwargs["data"]) < len(html_storage)
+        payload = json.loads(gzip.decompress(call_kwargs["data"]))
+        assert payload["body"]["storage"]["value"] == html_storage
+
+        client.create_page(space_key="TEST", title="Small", html_storage="<p>Body</p>")
+
+        call_kwargs = mock_post.call_args[1]
+        assert call_kwargs["headers"] is None
+        assert json.loads(call_kwargs["data"])["body"]["storage"]["value"] == "<p>Body</p>"
+
     @patch("requests.Session.post")
     def test_create_page_conflict_error(self, mock_post):
         """Test 409 conflict error when page already exists."""
@@ -277,6 +457,30 @@ class TestConfluenceClient:
 
         assert exc_info.value.status == 500
 
+    @pytest.mark.parametrize(
+        ("status", "error_cls", "message"),
+        [
+            (401, AuthError, "Auth failed during ctx"),
+            (403, AuthError, "Auth failed during ctx"),
+            (404, NotFoundError, "Resource not found during ctx"),
+            (409, ConflictError, "Version conflict during ctx"),
+            (429, RateLimitError, "Rate limited during ctx"),
+            (503, ServerError, "Server error 503 during ctx"),
+            (418, ConfluenceAPIError, "Unexpected status 418 during ctx"),
+        ],
+    )
+    def test_handle_error_maps_status_to_exception(self, status, error_cls, message):
+        """Each error status raises its exact exception type with the operation context."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+
+        with pytest.raises(ConfluenceAPIError) as exc_info:
+            client._handle_error(MockResponse(status, {"message": "boom"}), "ctx")
+
+        assert type(exc_info.value) is error_cls
+        assert str(exc_info.value) == message
+        assert exc_info.value.status == status
+        assert exc_info.value.payload == {"message": "boom"}
+
     def test_retry_configuration(self):
         """Test that retry logic is properly configured."""
         client = ConfluenceClient(
@@ -293,6 +497,142 @@ class TestConfluenceClient:
         assert 429 in adapter.max_retries.status_forcelist
         assert 500 in adapter.max_retries.status_forcelist
 
+    def test_retry_honours_retry_after_with_cap(self):
+        """Test that Retry-After drives the retry wait but is capped at MAX_BACKOFF."""
+        from types import SimpleNamespace
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        retry = client.session.get_adapter("https://example.atlassian.net").max_retries
+
+        def response(value):
+            return SimpleNamespace(headers={"Retry-After": value})
+
+        assert retry.respect_retry_after_header
+        assert retry.get_retry_after(response("7")) == 7
+        assert retry.get_retry_after(response("3600")) == ConfluenceClient.MAX_BACKOFF
+        assert retry.get_retry_after(SimpleNamespace(headers={})) is None
+        assert type(retry.increment(method="GET", url="/x")) is type(retry)
+
+    def test_retry_falls_back_to_rate_limit_reset(self):
+        """Test that X-RateLimit-Reset sets the wait when Retry-After is absent."""
+        from datetime import datetime, timedelta, timezone
+        from types import SimpleNamespace
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        retry = client.session.get_adapter("https://example.atlassian.net").max_retries
+        reset = (datetime.now(timezone.utc) + timedelta(seconds=20)).isoformat()
+        stale = "2000-01-01T00:00:00Z"
+
+        assert (
+            15 < retry.get_retry_after(SimpleNamespace(headers={"X-RateLimit-Reset": reset})) <= 20
+        )
+        assert retry.get_retry_after(SimpleNamespace(headers={"X-RateLimit-Reset": stale})) == 0
+        assert retry.get_retry_after(SimpleNamespace(headers={"Retry-After": "soon"})) is None
+
+    @patch("requests.Session.get")
+    def test_rate_limit_error_exposes_retry_after(self, mock_get):
+        """Test that an exhausted 429 reports how long the server asked callers to wait."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_get.return_value = MockResponse(429, headers={"Retry-After": "12"})
+
+        with pytest.raises(RateLimitError) as exc_info:
+            client.get_page_by_id("123")
+
+        assert exc_info.value.retry_after == 12.0
+        assert exc_info.value.status == 429
+        assert RateLimitError("Rate limited").retry_after is None
+
+    def test_retry_backoff_uses_capped_decorrelated_jitter(self):
+        """Test that retry waits are jittered, grow from the previous wait and stay capped."""
+        client = ConfluenceClient(
+            base_url="https://example.atlassian.net/wiki",
+            token="test",
+            max_retries=10,
+            backoff_factor=1.0,
+            backoff_cap=5.0,
+        )
+        retry = client.session.get_adapter("https://example.atlassian.net").max_retries
+
+        waits = []
+        for _ in range(8):
+            retry = retry.increment(method="GET", url="/x", error=OSError("reset"))
+            waits.append(retry.get_backoff_time())
+
+        assert waits[0] == 0
+        assert all(1.0 <= wait <= 5.0 for wait in waits[1:])
+
+        plain = ConfluenceClient(
+            base_url="https://example.atlassian.net/wiki",
+            token="test",
+            max_retries=10,
+            backoff_factor=1.0,
+            backoff_cap=5.0,
+            backoff_jitter=False,
+        )
+        retry = plain.session.get_adapter("https://example.atlassian.net").max_retries
+        assert not retry.jitter
+        for _ in range(8):
+            retry = retry.increment(method="GET", url="/x", error=OSError("reset"))
+        assert retry.get_backoff_time() == 5.0
+
+    def test_retry_does_not_pass_backoff_max_to_urllib3(self):
+        """Test that the retry policy builds with urllib3 1.26, which lacks backoff_max."""
+        from urllib3.util import Retry
+
+        with patch.object(Retry, "__init__", autospec=True, side_effect=Retry.__init__) as init:
+            ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+
+        assert init.called
+        assert all("backoff_max" not in call.kwargs for call in init.call_args_list)
+
+    def test_rate_limit_paces_requests_with_token_bucket(self):
+        """Test that rate_limit installs a token bucket that delays requests beyond the burst."""
+        from confluence_markdown.confluence_api import _TokenBucket
+
+        client = ConfluenceClient(
+            base_url="https://example.atlassian.net/wiki", token="test", rate_limit=10
+        )
+        adapter = client.session.get_adapter("https://example.atlassian.net")
+        assert adapter.bucket.rate == 10
+
+        bucket = _TokenBucket(rate=10, capacity=2)
+        with patch("confluence_markdown.confluence_api.time.sleep") as mock_sleep:
+            waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        mock_sleep.assert_called_once_with(waits[2])
+
+    def test_rate_limit_burst_and_stats(self):
+        """Test that rate_limit_burst sizes the bucket and rate_limit_stats reports usage."""
+        client = ConfluenceClient(
+            base_url="https://example.atlassian.net/wiki",
+            token="test",
+            rate_limit=5,
+            rate_limit_burst=1,
+        )
+        bucket = client.session.get_adapter("https://example.atlassian.net").bucket
+        assert bucket.capacity == 1
+
+        with patch("confluence_markdown.confluence_api.time.sleep"):
+            bucket.acquire()
+            bucket.acquire()
+
+        stats = client.rate_limit_stats()
+        assert stats["acquired"] == 2
+        assert stats["waited"] == pytest.approx(0.2, abs=0.01)
+        assert stats["tokens"] < 0
+        assert ConfluenceClient(base_url="https://x.example", token="t").rate_limit_stats() is None
+
+    def test_connection_pool_size_is_configurable(self):
+        """Test that the pooled connection count follows pool_maxsize."""
+        client = ConfluenceClient(
+            base_url="https://example.atlassian.net/wiki", token="test", pool_maxsize=32
+        )
+
+        adapter = client.session.get_adapter("https://example.atlassian.net")
+        assert adapter._pool_maxsize == 32
+
     def test_cmd43_method_aliases_exist(self):
         """Test that required API method names exist and work."""
         client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
@@ -327,6 +667,63 @@ class TestConfluenceClient:
         assert page.version.number == 2
         assert page.body_storage == "<h1>Hello</h1>"
 
+    def test_page_objects_are_frozen_and_slotted(self):
+        """Test that Page values are immutable and, on 3.10+, carry no instance dict."""
+        import dataclasses
+        import sys
+
+        page = Page(id="1", title="T", space_key="S", version=PageVersion(number=1))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            page.title = "Changed"
+        if sys.version_info >= (3, 10):
+            assert not hasattr(page, "__dict__")
+            assert not hasattr(page.version, "__dict__")
+
+    @patch("requests.Session.get")
+    def test_page_matches_compares_stored_body(self, mock_get):
+        """Test that Page.matches detects unchanged bodies and reuses the parsed page on 304."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_get.side_effect = [
+            MockResponse(
+                200,
+                {
+                    "id": "1",
+                    "title": "T",
+                    "version": {"number": 4},
+                    "body": {"storage": {"value": "<p>Same</p>", "representation": "storage"}},
+                },
+                headers={"ETag": '"v4"'},
+            ),
+            MockResponse(304),
+        ]
+        expand = ("version", "body.storage")
+
+        page = client.get_page_by_id("1", expand=expand)
+
+        assert page.matches("<p>Same</p>")
+        assert page.matches("<p>Same</p>\n")
+        assert not page.matches("<p>Changed</p>")
+        assert client.get_page_by_id("1", expand=expand) is page
+        assert not Page(id="1", title="T", space_key="S", version=PageVersion(1)).matches("")
+
+    @patch("requests.Session.get")
+    def test_expand_string_is_joined_once_per_tuple(self, mock_get):
+        """Test that expand tuples are joined through the memoised module helper."""
+        from confluence_markdown.confluence_api import _join_expand
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_get.return_value = MockResponse(200, {"results": []})
+        expand = ("version", "body.storage")
+        _join_expand.cache_clear()
+
+        for title in ("A", "B", "C"):
+            client.get_page_by_title(space_key="TEST", title=title, expand=expand)
+
+        assert mock_get.call_args[1]["params"]["expand"] == "version,body.storage"
+        info = _join_expand.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
     def test_page_from_json_minimal_data(self):
         """Test page parsing with minimal data (handles missing fields gracefully)."""
         client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
@@ -341,6 +738,16 @@ class TestConfluenceClient:
         assert page.version.number == 1
         assert page.body_storage is None
 
+    def test_page_from_json_null_nested_objects(self):
+        """Test page parsing when nested objects are present but null."""
+        data = {"content": {"id": "9"}, "space": None, "version": None, "body": None}
+        page = ConfluenceClient._page_from_json(data)
+
+        assert page.id == "9"
+        assert page.space_key == ""
+        assert page.version.number == 1
+        assert page.body_storage is None
+
     @patch("requests.Session.get")
     def test_get_page_by_title_logging(self, mock_get):
         """Test that get_page_by_title includes proper logging like get_page_by_id."""
@@ -377,6 +784,161 @@ class TestConfluenceClient:
             len(call_args_list) >= 3
         )  # Should have operation start, API completion, and result logs
 
+    @patch("requests.Session.get")
+    def test_get_pages_by_titles_batches_cql_queries(self, mock_get):
+        """Test that get_pages_by_titles OR-joins titles into chunked CQL searches."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        client.TITLE_BATCH_SIZE = 2
+
+        mock_get.side_effect = [
+            MockResponse(
+                200,
+                {
+                    "results": [
+                        {"id": "1", "title": "One", "version": {"number": 2}},
+                        {"id": "9", "title": "Unrelated", "version": {"number": 1}},
+                    ]
+                },
+            ),
+            MockResponse(200, {"results": []}),
+        ]
+
+        pages = client.get_pages_by_titles(
+            space_key="TEST", titles=["One", 'Say "Hi"', "One", "Three"]
+        )
+
+        assert list(pages) == ["One"]
+        assert pages["One"].version.number == 2
+        assert mock_get.call_count == 2
+
+        first_params = mock_get.call_args_list[0][1]["params"]
+        assert mock_get.call_args_list[0][0][0].endswith("/rest/api/content/search")
+        assert first_params["cql"] == (
+            'space="TEST" AND type=page AND (title="One" OR title="Say \\"Hi\\"")'
+        )
+        assert mock_get.call_args_list[1][1]["params"]["cql"].endswith('(title="Three")')
+
+    @patch("requests.Session.get")
+    def test_get_pages_by_ids_batches_cql_queries(self, mock_get):
+        """Test that get_pages_by_ids chunks IDs into CQL searches and keeps input order."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        client.ID_BATCH_SIZE = 2
+
+        mock_get.side_effect = [
+            MockResponse(
+                200,
+                {
+                    "results": [
+                        {"id": "2", "title": "Two", "version": {"number": 5}},
+                        {"id": "1", "title": "One", "version": {"number": 2}},
+                    ]
+                },
+            ),
+            MockResponse(200, {"results": []}),
+        ]
+
+        pages = client.get_pages_by_ids(["1", "2", "1", "404"])
+
+        assert list(pages) == ["1", "2"]
+        assert pages["2"].version.number == 5
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[0][1]["params"]["cql"] == 'id in ("1","2")'
+        assert mock_get.call_args_list[1][1]["params"]["cql"] == 'id in ("404")'
+
+    def test_async_update_pages_prefetches_versions_in_one_batch(self):
+        """Test that update_pages resolves missing versions and titles with one lookup."""
+        import asyncio
+
+        from confluence_markdown.confluence_api import AsyncConfluenceClient
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        current = {
+            "1": Page(id="1", title="One", space_key="TEST", version=PageVersion(3)),
+            "2": Page(id="2", title="Two", space_key="TEST", version=PageVersion(7)),
+        }
+
+        async def run():
+            return await AsyncConfluenceClient(client).update_pages(
+                [
+                    {"page_id": "1", "html_storage": "<p>1</p>"},
+                    {"page_id": "2", "html_storage": "<p>2</p>", "title": "Renamed"},
+                    {
+                        "page_id": "3",
+                        "html_storage": "<p>3</p>",
+                        "expected_version": 1,
+                        "title": "T",
+                    },
+                ]
+            )
+
+        with patch.object(client, "get_pages_by_ids", return_value=current) as mock_lookup:
+            with patch.object(client, "update_page") as mock_update:
+                asyncio.run(run())
+
+        mock_lookup.assert_called_once_with(["1", "2"])
+        calls = sorted(mock_update.call_args_list, key=lambda call: call.kwargs["page_id"])
+        assert calls[0].kwargs["expected_version"] == 3
+        assert calls[0].kwargs["title"] == "One"
+        assert calls[1].kwargs["expected_version"] == 7
+        assert calls[1].kwargs["title"] == "Renamed"
+        assert calls[2].kwargs["expected_version"] == 1
+
+    def test_async_update_pages_ignores_titles_from_a_stale_batch(self):
+        """Test that a batched title from an older version is not sent with a newer one."""
+        import asyncio
+
+        from confluence_markdown.confluence_api import AsyncConfluenceClient
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        # The search index still has the title from before the rename at version 4
+        stale = {"1": Page(id="1", title="Old", space_key="TEST", version=PageVersion(3))}
+
+        async def run():
+            return await AsyncConfluenceClient(client).update_pages(
+                [{"page_id": "1", "html_storage": "<p>1</p>", "expected_version": 4}]
+            )
+
+        with patch.object(client, "get_pages_by_ids", return_value=stale):
+            with patch.object(client, "update_page") as mock_update:
+                asyncio.run(run())
+
+        assert mock_update.call_args.kwargs == {
+            "page_id": "1",
+            "html_storage": "<p>1</p>",
+            "expected_version": 4,
+        }
+
+    def test_async_update_pages_retries_stale_batched_version(self):
+        """Test that a conflict on a batched version is retried with the current version."""
+        import asyncio
+
+        from confluence_markdown.confluence_api import AsyncConfluenceClient, ConflictError
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        # The search index still reports version 3 after the page moved on to 4
+        stale = {"1": Page(id="1", title="One", space_key="TEST", version=PageVersion(3))}
+        updated = Page(id="1", title="One", space_key="TEST", version=PageVersion(5))
+
+        def update_page(**kwargs):
+            if kwargs.get("expected_version") == 3:
+                raise ConflictError("Version conflict", status=409)
+            return updated
+
+        async def run():
+            return await AsyncConfluenceClient(client).update_pages(
+                [{"page_id": "1", "html_storage": "<p>1</p>"}]
+            )
+
+        with patch.object(client, "get_pages_by_ids", return_value=stale):
+            with patch.object(client, "update_page", side_effect=update_page) as mock_update:
+                assert asyncio.run(run()) == [updated]
+
+        assert mock_update.call_count == 2
+        assert mock_update.call_args_list[1].kwargs == {
+            "page_id": "1",
+            "html_storage": "<p>1</p>",
+        }
+
     @patch("requests.Session.get")
     def test_get_page_by_title_not_found_logging(self, mock_get):
         """Test that get_page_by_title logs when page is not found."""
@@ -486,6 +1048,32 @@ class TestConfluenceClient:
         # Should log successful label addition
         mock_logger.info.assert_called()
 
+    @patch("requests.Session.post")
+    def test_create_page_with_label_iterator(self, mock_post):
+        """Test that one-shot label iterables are both sent and logged in full."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_post.side_effect = [
+            MockResponse(200, {"id": "1", "title": "Labelled", "version": {"number": 1}}),
+            MockResponse(200, {}),
+        ]
+
+        with patch("confluence_markdown.confluence_api.logger") as mock_logger:
+            client.create_page(
+                space_key="TEST",
+                title="Labelled",
+                html_storage="<p>x</p>",
+                labels=iter(["docs", "api"]),
+            )
+
+        sent = json.loads(mock_post.call_args_list[1][1]["data"])
+        assert [label["name"] for label in sent] == ["docs", "api"]
+        logged = [
+            call[1]["extra"]["labels"]
+            for call in mock_logger.info.call_args_list
+            if call[0][0] == "Labels added successfully"
+        ]
+        assert logged == [["docs", "api"]]
+
     @patch("requests.Session.post")
     def test_create_page_with_labels_failure(self, mock_post):
         """Test page creation with labels when label addition fails."""
@@ -565,6 +1153,30 @@ class TestConfluenceClient:
         expected = [{"prefix": "global", "name": "test"}, {"prefix": "global", "name": "example"}]
         assert payload == expected
 
+    @patch("requests.Session.post")
+    def test_add_labels_sends_one_request_for_many_labels(self, mock_post):
+        """Test that any number of labels is added with a single POST."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_post.return_value = MockResponse(200, {})
+
+        client.add_labels("123", [f"label-{n}" for n in range(25)])
+
+        mock_post.assert_called_once()
+        assert len(json.loads(mock_post.call_args[1]["data"])) == 25
+
+    @patch("requests.Session.post")
+    def test_add_labels_dedupes_and_skips_empty(self, mock_post):
+        """Test that labels are sent once each and an empty list makes no request."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        mock_post.return_value = MockResponse(200, {})
+
+        client.add_labels("123", [])
+        mock_post.assert_not_called()
+
+        client.add_labels("123", ["docs", "docs", "api"])
+        payload = json.loads(mock_post.call_args[1]["data"])
+        assert [label["name"] for label in payload] == ["docs", "api"]
+
     @patch("requests.Session.post")
     def test_add_labels_failure(self, mock_post):
         """Test label addition failure handling."""
@@ -589,6 +1201,19 @@ class TestConfluenceClient:
         assert resolved_title == "New Title"
         assert target_version == 6  # expected_version + 1
 
+    def test_resolve_version_and_title_fetches_once_for_missing_title(self):
+        """Test that a missing title costs one fetch and the caller's version still wins."""
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        current = Page(id="123", title="Stored", space_key="TEST", version=PageVersion(number=9))
+
+        with patch.object(client, "get_page_by_id", return_value=current) as mock_get_page:
+            target_version, resolved_title = client._resolve_version_and_title(
+                page_id="123", expected_version=5, title=None
+            )
+
+        assert (target_version, resolved_title) == (6, "Stored")
+        mock_get_page.assert_called_once_with("123", expand=("version",))
+
     @patch("requests.Session.get")
     def test_get_page_by_title_error_handling(self, mock_get):
         """Test get_page_by_title error handling when response is not OK."""
@@ -645,3 +1270,64 @@ class TestConfluenceClient:
 
         # Verify logging includes ancestor information
         mock_logger.info.assert_called()
+
+    def test_async_client_update_pages_respects_concurrency(self):
+        """Test that batched async updates run concurrently up to the configured limit."""
+        import asyncio
+        import threading
+        import time
+
+        from confluence_markdown.confluence_api import AsyncConfluenceClient
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+        lock = threading.Lock()
+        active = peak = 0
+
+        def fake_update(*, page_id, html_storage):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return Page(id=page_id, title=page_id, space_key="TEST", version=PageVersion(2))
+
+        async def run():
+            async with AsyncConfluenceClient(client, max_concurrency=2) as async_client:
+                return await async_client.update_pages(
+                    {"page_id": str(n), "html_storage": "<p>x</p>"} for n in range(6)
+                )
+
+        with patch.object(client, "update_page", side_effect=fake_update):
+            with patch.object(client, "get_pages_by_ids", return_value={}):
+                with patch.object(client.session, "close") as mock_close:
+                    pages = asyncio.run(run())
+
+        assert [page.id for page in pages] == [str(n) for n in range(6)]
+        assert peak == 2
+        mock_close.assert_called_once()
+
+    def test_async_client_create_pages_preserves_order(self):
+        """Test that batched async creations return pages in request order."""
+        import asyncio
+
+        from confluence_markdown.confluence_api import AsyncConfluenceClient
+
+        client = ConfluenceClient(base_url="https://example.atlassian.net/wiki", token="test")
+
+        def fake_create(*, space_key, title, html_storage, labels=None):
+            return Page(id=f"id-{title}", title=title, space_key=space_key, version=PageVersion(1))
+
+        async def run():
+            async_client = AsyncConfluenceClient(client, max_concurrency=3)
+            return await async_client.create_pages(
+                {"space_key": "TEST", "title": f"T{n}", "html_storage": "<p>x</p>"}
+                for n in range(5)
+            )
+
+        with patch.object(client, "create_page", side_effect=fake_create) as mock_create:
+            pages = asyncio.run(run())
+
+        assert [page.id for page in pages] == [f"id-T{n}" for n in range(5)]
+        assert mock_create.call_count == 5
@@ -96,6 +96,17 @@ echo "Hello"
         assert '<ac:parameter ac:name="language">bash</ac:parameter>' in result
         assert '<![CDATA[echo "Hello"]]>' in result
 
+    def test_convert_untagged_code_block_keeps_content_verbatim(self) -> None:
+        """Test that an untagged fence defaults to "text" and its markup is left untouched."""
+        markdown = """```
+**not bold** <b>raw</b> [link](https://example.com)
+```"""
+
+        result = self.publisher.create_confluence_content("Test", "v1.0.0", markdown)
+
+        assert '<ac:parameter ac:name="language">text</ac:parameter>' in result
+        assert "<![CDATA[**not bold** <b>raw</b> [link](https://example.com)]]>" in result
+
     def test_convert_inline_code(self) -> None:
         """Test inline code conversion."""
         markdown = "Use the `publish_release.py` script to publish."
@@ -351,10 +362,10 @@ class TestEndToEndPublishing:
                 "results": [{"id": "12345", "version": {"number": 1}}]
             }
 
-            # Mock successful page update
+            # Mock successful page update; the reply body is never parsed
             mock_put_response = Mock()
             mock_put_response.status_code = 200
-            mock_put_response.json.return_value = {"id": "12345"}
+            mock_put_response.json.side_effect = ValueError("empty body")
 
             # Configure session methods
             mock_session.get.return_value = mock_get_response
@@ -366,6 +377,44 @@ class TestEndToEndPublishing:
             assert mock_session.get.called
             assert mock_session.put.called
 
+    @patch("scripts.publish_release.requests.Session")
+    def test_session_reused_across_requests(self, mock_session_class: Mock) -> None:
+        """Test that one authenticated session serves every API call."""
+        config_values = {
+            "CONFLUENCE_URL": "https://test.atlassian.net/wiki",
+            "CONFLUENCE_USER": "test@example.com",
+            "CONFLUENCE_TOKEN": "test_token",
+            "CONFLUENCE_SPACE": "TEST",
+            "CONFLUENCE_PARENT_PAGE": "Release Notes",
+        }
+
+        with patch(
+            "scripts.publish_release.config",
+            side_effect=mock_config(config_values),
+        ):
+            publisher = ConfluencePublisher()
+
+            mock_session = Mock()
+            mock_session.headers = {}
+            mock_session_class.return_value = mock_session
+
+            mock_get_response = Mock()
+            mock_get_response.status_code = 200
+            mock_get_response.json.return_value = {"results": []}
+            mock_session.get.return_value = mock_get_response
+
+            mock_post_response = Mock()
+            mock_post_response.status_code = 200
+            mock_post_response.json.return_value = {"id": "12345"}
+            mock_session.post.return_value = mock_post_response
+
+            result = publisher.publish_release_notes("v1.0.0", "Test release notes")
+
+            assert result is True
+            assert mock_session.get.call_count == 2
+            assert mock_session_class.call_count == 1
+            assert mock_session.headers["Authorization"].startswith("Basic ")
+
     @patch("scripts.publish_release.requests.Session")
     def test_failed_authentication(self, mock_session_class: Mock) -> None:
         """Test authentication failure handling."""
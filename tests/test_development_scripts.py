@@ -1,8 +1,11 @@
+import asyncio
+import os
 import types
 from pathlib import Path
 from typing import Optional
 
 import pytest
+import requests
 
 from scripts import (
     bulk_publish_docs,
@@ -33,6 +36,30 @@ def test_create_page_title_variants(repo):
 
     assert common.create_page_title(readme, repo_root=repo) == "README"
     assert common.create_page_title(nested, repo_root=repo) == "docs / Intro Guide"
+    assert common.create_page_title(repo.parent / "outside-note.md", repo_root=repo) == (
+        "Outside Note"
+    )
+
+
+def test_load_markdown_normalises_newlines(tmp_path):
+    target = tmp_path / "doc.md"
+    target.write_bytes(b"one\r\ntwo\rthree\n")
+    assert common.load_markdown(target) == "one\ntwo\nthree\n"
+
+
+def test_find_repository_root_is_cached_per_start(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for root in (first, second):
+        (root / ".git").mkdir(parents=True)
+        (root / "docs").mkdir()
+
+    assert common.find_repository_root(first / "docs") == first
+    (first / ".git").rmdir()
+    assert common.find_repository_root(first / "docs") == first
+
+    monkeypatch.chdir(second / "docs")
+    assert common.find_repository_root() == second
 
 
 def test_publish_documents_handles_create_and_missing(repo, stub_client, stub_converter):
@@ -98,11 +125,206 @@ def test_publish_documents_updates_existing_page(repo, stub_client, stub_convert
         dry_run=False,
     )
 
-    assert client.updated == [("42", "<p>converted</p>", None)]
+    assert client.updated == [("42", "<p>converted</p>", "Page 42")]
+    assert outcomes[0].action == "updated"
+    assert outcomes[0].status == "success"
+
+
+def test_publish_documents_batches_title_lookups(repo, stub_client, stub_converter, stub_page):
+    mapping_store = common.MappingStore(mapping_file=repo / ".cmt" / "map.json")
+    docs = repo / "docs"
+    docs.mkdir(parents=True, exist_ok=True)
+    existing = docs / "existing.md"
+    fresh = docs / "fresh.md"
+    for target, title in ((existing, "Existing"), (fresh, "Fresh")):
+        target.write_text(title, encoding="utf-8")
+        mapping_store.add_mapping(str(target), space_key="DOC", title=title)
+    stub_client.existing[("DOC", "Existing")] = stub_page
+    single_lookups = []
+    lookup = stub_client.get_page_by_title
+
+    def record_single_lookup(**kwargs):
+        single_lookups.append(kwargs["title"])
+        return lookup(**kwargs)
+
+    stub_client.get_page_by_title = record_single_lookup
+
+    outcomes = common.publish_documents(
+        [existing, fresh], mapping_store=mapping_store, client=stub_client, converter=stub_converter
+    )
+
+    assert [outcome.action for outcome in outcomes] == ["updated", "created"]
+    assert stub_client.updated == [("stub", "<p>converted</p>", "Existing")]
+    # Batch hits are trusted; misses are confirmed before creating
+    assert single_lookups == ["Fresh"]
+
+
+def test_publish_documents_confirms_batch_misses(repo, stub_client, stub_converter, stub_page):
+    mapping_store = common.MappingStore(mapping_file=repo / ".cmt" / "map.json")
+    target = repo / "docs" / "lagging.md"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text("lagging", encoding="utf-8")
+    mapping_store.add_mapping(str(target), space_key="DOC", title="Lagging")
+    stub_client.existing[("DOC", "Lagging")] = stub_page
+    # The search index has not caught up with the page yet
+    stub_client.get_pages_by_titles = lambda **_: {}
+
+    outcomes = common.publish_documents(
+        [target], mapping_store=mapping_store, client=stub_client, converter=stub_converter
+    )
+
     assert outcomes[0].action == "updated"
+    assert stub_client.created == []
+
+
+def test_publish_documents_falls_back_when_batch_lookup_errors(repo, stub_client, stub_converter):
+    mapping_store = common.MappingStore(mapping_file=repo / ".cmt" / "map.json")
+    target = repo / "docs" / "offline.md"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text("offline", encoding="utf-8")
+    mapping_store.add_mapping(str(target), space_key="DOC", title="Offline")
+
+    def fail_batch(**_):
+        raise requests.ConnectionError("connection reset")
+
+    stub_client.get_pages_by_titles = fail_batch
+
+    outcomes = common.publish_documents(
+        [target], mapping_store=mapping_store, client=stub_client, converter=stub_converter
+    )
+
+    assert outcomes[0].action == "created"
     assert outcomes[0].status == "success"
 
 
+def test_publish_documents_skips_update_when_remote_matches(
+    repo, stub_client, stub_converter, stub_page
+):
+    page_type = stub_page.__class__
+    mapping_store = common.MappingStore(mapping_file=repo / ".cmt" / "map.json")
+    by_id = repo / "docs" / "by-id.md"
+    by_title = repo / "docs" / "by-title.md"
+    by_id.parent.mkdir(parents=True, exist_ok=True)
+    by_id.write_text("one", encoding="utf-8")
+    by_title.write_text("two", encoding="utf-8")
+    mapping_store.add_mapping(str(by_id), page_id="42")
+    mapping_store.add_mapping(str(by_title), space_key="DOC", title="Same")
+
+    stub_client.pages["42"] = page_type("42", "By Id", body_storage="<p>converted</p>")
+    stub_client.existing[("DOC", "Same")] = page_type("7", "Same", body_storage="<p>converted</p>")
+
+    outcomes = common.publish_documents(
+        [by_id, by_title], mapping_store=mapping_store, client=stub_client, converter=stub_converter
+    )
+
+    assert [outcome.detail for outcome in outcomes] == ["no-change", "no-change"]
+    assert all(outcome.status == "success" for outcome in outcomes)
+    assert stub_client.updated == [] and stub_client.created == []
+
+
+def test_publish_documents_skips_unchanged_content(repo, stub_client, stub_converter):
+    mapping_store = common.MappingStore(mapping_file=repo / ".cmt" / "map.json")
+    target = repo / "docs" / "stable.md"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text("hello", encoding="utf-8")
+    mapping_store.add_mapping(str(target), page_id="42")
+
+    def publish():
+        return common.publish_documents(
+            [target], mapping_store=mapping_store, client=stub_client, converter=stub_converter
+        )
+
+    assert publish()[0].action == "updated"
+    assert mapping_store.get_mapping(str(target))["last_published_hash"] == common.content_hash(
+        "hello"
+    )
+
+    outcome = publish()[0]
+    assert (outcome.action, outcome.status, outcome.detail) == ("skipped", "success", "unchanged")
+    assert len(stub_client.updated) == 1
+
+    target.write_text("hello again", encoding="utf-8")
+    assert publish()[0].action == "updated"
+    assert len(stub_client.updated) == 2
+
+
+def test_publish_documents_async_preserves_input_order(repo, stub_client, stub_converter):
+    mapping_store = common.MappingStore(mapping_file=repo / ".cmt" / "map.json")
+    docs = repo / "docs"
+    docs.mkdir(parents=True, exist_ok=True)
+    targets = []
+    for index in range(5):
+        target = docs / f"doc{index}.md"
+        target.write_text(f"doc {index}", encoding="utf-8")
+        mapping_store.add_mapping(str(target), space_key="DOC", title=f"Doc {index}")
+        targets.append(target)
+    unmapped = docs / "unmapped.md"
+    unmapped.write_text("orphan", encoding="utf-8")
+    targets.insert(2, unmapped)
+
+    outcomes = asyncio.run(
+        common.publish_documents_async(
+            targets,
+            mapping_store=mapping_store,
+            client=stub_client,
+            converter=stub_converter,
+            concurrency=2,
+        )
+    )
+
+    assert [outcome.path for outcome in outcomes] == targets
+    assert outcomes[2].detail == "No mapping found"
+    assert sorted(title for _, title, *_ in stub_client.created) == [
+        f"Doc {index}" for index in range(5)
+    ]
+
+
+def test_publish_documents_isolates_conversion_failures(repo, stub_client):
+    mapping_store = common.MappingStore(mapping_file=repo / ".cmt" / "map.json")
+    docs = repo / "docs"
+    docs.mkdir(parents=True, exist_ok=True)
+    targets = []
+    for name in ("good", "bad", "fine"):
+        target = docs / f"{name}.md"
+        target.write_text(name, encoding="utf-8")
+        mapping_store.add_mapping(str(target), space_key="DOC", title=name.title())
+        targets.append(target)
+
+    class PickyConverter:
+        def convert(self, value: str) -> str:
+            if value == "bad":
+                raise ValueError("cannot convert")
+            return f"<p>{value}</p>"
+
+    outcomes = common.publish_documents(
+        targets, mapping_store=mapping_store, client=stub_client, converter=PickyConverter()
+    )
+
+    assert [outcome.status for outcome in outcomes] == ["success", "failure", "success"]
+    assert outcomes[1].detail == "cannot convert"
+    assert sorted(title for _, title, *_ in stub_client.created) == ["Fine", "Good"]
+
+
+def test_publish_documents_rejects_invalid_concurrency(repo, stub_client, stub_converter):
+    with pytest.raises(ValueError, match="concurrency"):
+        common.publish_documents([], client=stub_client, converter=stub_converter, concurrency=0)
+
+
+def test_convert_documents_uses_worker_processes_for_batches(tmp_path):
+    converter = common.MarkdownToConfluenceConverter()
+    paths = []
+    for index in range(common.PARALLEL_CONVERSION_THRESHOLD):
+        path = tmp_path / f"doc{index}.md"
+        path.write_text(f"# Title {index}\n\nBody", encoding="utf-8")
+        paths.append(path)
+
+    htmls = common.convert_documents(paths, converter=converter)
+
+    assert list(htmls) == paths
+    for path in paths:
+        assert htmls[path] == converter.convert(path.read_text(encoding="utf-8"))
+
+
 def test_publish_documents_requires_mapping(repo, stub_client, stub_converter):
     mapping_store = common.MappingStore(mapping_file=repo / ".cmt" / "map.json")
     target = repo / "docs" / "unmapped.md"
@@ -223,6 +445,93 @@ def test_bulk_publish_main_propagates_failures(monkeypatch, tmp_path):
     assert bulk_publish_docs.main([str(demo_file)]) == 1
 
 
+def test_bulk_publish_summary_counts_statuses():
+    outcomes = [
+        PublishOutcome(path=Path("a.md"), action="created", status="success"),
+        PublishOutcome(path=Path("b.md"), action="updated", status="success"),
+        PublishOutcome(path=Path("c.md"), action="skipped", status="failure"),
+    ]
+    assert bulk_publish_docs._summarise(outcomes) == (
+        "Processed 3 document(s): 2 succeeded, 1 failed, 0 skipped"
+    )
+
+
+def test_bulk_publish_watch_republishes_on_change(monkeypatch, tmp_path):
+    monkeypatch.setattr(bulk_publish_docs, "configure_logging", lambda *_: None)
+    demo_file = tmp_path / "doc.md"
+    demo_file.write_text("data", encoding="utf-8")
+
+    class StubMappingStore:
+        mapping_file = tmp_path / "map.json"
+
+    runs = []
+
+    def fake_publish(targets, *, mapping_store, dry_run):
+        runs.append(list(targets))
+        return [PublishOutcome(path=demo_file, action="updated", status="success")]
+
+    sleeps = iter([lambda: None, lambda: os.utime(demo_file, ns=(0, 0)), _raise_interrupt])
+
+    monkeypatch.setattr(bulk_publish_docs, "MappingStore", StubMappingStore)
+    monkeypatch.setattr(bulk_publish_docs, "publish_documents", fake_publish)
+    monkeypatch.setattr(bulk_publish_docs.time, "sleep", lambda _: next(sleeps)())
+
+    assert bulk_publish_docs.main(["--watch", str(demo_file)]) == 0
+    assert runs == [[demo_file], [demo_file]]
+
+
+def test_bulk_publish_watch_ignores_its_own_mapping_writes(monkeypatch, tmp_path):
+    monkeypatch.setattr(bulk_publish_docs, "configure_logging", lambda *_: None)
+    demo_file = tmp_path / "doc.md"
+    demo_file.write_text("data", encoding="utf-8")
+
+    class StubMappingStore:
+        mapping_file = tmp_path / "map.json"
+
+    mapping_file = StubMappingStore.mapping_file
+    mapping_file.write_text("{}", encoding="utf-8")
+    runs = []
+
+    def fake_publish(targets, *, mapping_store, dry_run):
+        # Publishing rewrites the mapping file with the new content hashes
+        runs.append(list(targets))
+        os.utime(mapping_file, ns=(len(runs), len(runs)))
+        return [PublishOutcome(path=demo_file, action="updated", status="failure")]
+
+    sleeps = iter(
+        [lambda: os.utime(demo_file, ns=(0, 0)), lambda: None, lambda: None, _raise_interrupt]
+    )
+
+    monkeypatch.setattr(bulk_publish_docs, "MappingStore", StubMappingStore)
+    monkeypatch.setattr(bulk_publish_docs, "publish_documents", fake_publish)
+    monkeypatch.setattr(bulk_publish_docs.time, "sleep", lambda _: next(sleeps)())
+
+    assert bulk_publish_docs.main(["--watch", str(demo_file)]) == 1
+    assert runs == [[demo_file], [demo_file]]
+
+
+def test_bulk_publish_watch_keeps_initial_exit_code(monkeypatch, tmp_path):
+    monkeypatch.setattr(bulk_publish_docs, "configure_logging", lambda *_: None)
+    demo_file = tmp_path / "doc.md"
+    demo_file.write_text("data", encoding="utf-8")
+
+    class StubMappingStore:
+        mapping_file = tmp_path / "map.json"
+
+    def fake_publish(targets, *, mapping_store, dry_run):
+        return [PublishOutcome(path=demo_file, action="skipped", status="failure")]
+
+    monkeypatch.setattr(bulk_publish_docs, "MappingStore", StubMappingStore)
+    monkeypatch.setattr(bulk_publish_docs, "publish_documents", fake_publish)
+    monkeypatch.setattr(bulk_publish_docs.time, "sleep", lambda _: _raise_interrupt())
+
+    assert bulk_publish_docs.main(["--watch", str(demo_file)]) == 1
+
+
+def _raise_interrupt():
+    raise KeyboardInterrupt
+
+
 def test_interactive_publish_main_with_paths(monkeypatch, tmp_path):
     monkeypatch.setattr(interactive_publish, "configure_logging", lambda *_: None)
 
@@ -404,6 +713,18 @@ def test_test_formatting_main_reports_diffs(monkeypatch, tmp_path):
     assert logs  # ensures an error was recorded
 
 
+def test_test_formatting_render_diff_truncates_around_first_mismatch():
+    expected = "\n".join(f"line {i}" for i in range(1000))
+    actual = expected.replace("line 500", "changed 500")
+
+    diff = test_formatting._render_diff(expected, actual)
+
+    assert diff.startswith("… (truncated to lines 496-700)")
+    assert "-line 500" in diff and "+changed 500" in diff
+    assert "line 100\n" not in diff
+    assert test_formatting._render_diff("a\nb", "a\nc").startswith("--- expected")
+
+
 def test_confluence_publisher_find_files_and_dry_run(tmp_path, monkeypatch):
     repo_root = tmp_path / "repo"
     repo_root.mkdir()
@@ -426,6 +747,41 @@ def test_confluence_publisher_find_files_and_dry_run(tmp_path, monkeypatch):
     assert success == 1 and errors == 0
 
 
+def test_confluence_publisher_find_files_prunes_and_includes(tmp_path):
+    repo_root = tmp_path / "repo"
+    for rel_path in (
+        "README.md",
+        "docs/guide/intro.md",
+        "docs/notes.txt",
+        "pkg/node_modules/dep/README.md",
+        "pkg/build/out.md",
+        "pkg/venv/README.md",
+        "sub/docs/nested.md",
+        "tests/golden_corpus/case/input.md",
+    ):
+        target = repo_root / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("content", encoding="utf-8")
+
+    publisher = confluence_publisher.ConfluencePublisher("https://example", "DOC", "1")
+    publisher.repo_root = repo_root
+
+    assert publisher.find_markdown_files() == [
+        repo_root / "README.md",
+        repo_root / "docs" / "guide" / "intro.md",
+        repo_root / "sub" / "docs" / "nested.md",
+    ]
+    assert publisher.find_markdown_files(["docs/**/*.md", "tests/golden_corpus/**"]) == [
+        repo_root / "docs" / "guide" / "intro.md",
+        repo_root / "sub" / "docs" / "nested.md",
+        repo_root / "tests" / "golden_corpus" / "case" / "input.md",
+    ]
+    # Slash patterns match at the end of the path, as PurePath.match did
+    assert publisher.find_markdown_files(["docs/*.md"]) == [
+        repo_root / "sub" / "docs" / "nested.md"
+    ]
+
+
 class StubConfluenceClient:
     def __init__(self, page_factory=None):
         self.created = []
@@ -441,6 +797,9 @@ class StubConfluenceClient:
     def get_page_by_title(self, *, space_key: str, title: str):
         return self.lookup.get(title)
 
+    def get_pages_by_titles(self, *, space_key: str, titles):
+        return {title: self.lookup[title] for title in titles if title in self.lookup}
+
     def update_page(self, *, page_id: str, html_storage: str, title: str):
         self.updated.append((page_id, html_storage, title))
 
@@ -508,7 +867,135 @@ def test_push_core_docs_helpers(tmp_path, monkeypatch):
     assert html.strip().startswith("<") and "data" in html
 
 
+def test_push_core_docs_push_files_concurrently(tmp_path, monkeypatch, stub_client, stub_page):
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    new_file = repo_root / "new.md"
+    existing_file = repo_root / "existing.md"
+    broken_file = repo_root / "broken.md"
+    for path in (new_file, existing_file):
+        path.write_text("# Doc", encoding="utf-8")
+
+    existing_title = common.create_page_title(existing_file, repo_root=repo_root)
+    stub_client.existing[("DOC", existing_title)] = stub_page.__class__("page-7", existing_title)
+    stub_client.title_lookups = 0
+    batched_lookup = stub_client.get_pages_by_titles
+
+    def counting_lookup(**kwargs):
+        stub_client.title_lookups += 1
+        return batched_lookup(**kwargs)
+
+    single_lookups = []
+    lookup = stub_client.get_page_by_title
+
+    def single_lookup(**kwargs):
+        single_lookups.append(kwargs["title"])
+        return lookup(**kwargs)
+
+    stub_client.get_pages_by_titles = counting_lookup
+    stub_client.get_page_by_title = single_lookup
+    monkeypatch.setattr("builtins.print", lambda *_, **__: None)
+
+    success, errors = asyncio.run(
+        push_core_docs.push_files(
+            stub_client,
+            [broken_file, existing_file, new_file],
+            space_key="DOC",
+            parent_page_id="parent",
+            repo_root=repo_root,
+            concurrency=2,
+        )
+    )
+
+    assert (success, errors) == (2, 1)
+    assert stub_client.updated[0][0] == "page-7"
+    assert stub_client.title_lookups == 1
+    # Only the batch miss is confirmed individually before it is created
+    assert single_lookups == [common.create_page_title(new_file, repo_root=repo_root)]
+    assert stub_client.created[0][1] == common.create_page_title(new_file, repo_root=repo_root)
+    assert stub_client.created[0][3] == "parent"
+
+
+def test_push_core_docs_falls_back_when_batch_lookup_errors(
+    tmp_path, monkeypatch, stub_client, stub_page
+):
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    doc = repo_root / "doc.md"
+    doc.write_text("# Doc", encoding="utf-8")
+    title = common.create_page_title(doc, repo_root=repo_root)
+    stub_client.existing[("DOC", title)] = stub_page.__class__("page-5", title)
+
+    def fail_batch(**_):
+        raise requests.ConnectionError("connection reset")
+
+    stub_client.get_pages_by_titles = fail_batch
+    monkeypatch.setattr("builtins.print", lambda *_, **__: None)
+
+    success, errors = asyncio.run(
+        push_core_docs.push_files(
+            stub_client, [doc], space_key="DOC", parent_page_id="parent", repo_root=repo_root
+        )
+    )
+
+    assert (success, errors) == (1, 0)
+    assert stub_client.updated[0][0] == "page-5"
+
+
+def test_push_core_docs_skips_unchanged_files(tmp_path, monkeypatch, stub_client, stub_page):
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    doc = repo_root / "doc.md"
+    doc.write_text("# Doc", encoding="utf-8")
+    cache_path = repo_root / push_core_docs.PUSH_CACHE_FILE
+
+    title = common.create_page_title(doc, repo_root=repo_root)
+    stub_client.existing[("DOC", title)] = stub_page.__class__("page-3", title)
+    monkeypatch.setattr("builtins.print", lambda *_, **__: None)
+
+    def push():
+        return asyncio.run(
+            push_core_docs.push_files(
+                stub_client,
+                [doc],
+                space_key="DOC",
+                parent_page_id="parent",
+                repo_root=repo_root,
+                cache_path=cache_path,
+            )
+        )
+
+    assert push() == (1, 0)
+    assert push() == (1, 0)
+    assert len(stub_client.updated) == 1
+    assert push_core_docs.load_push_cache(cache_path)["doc.md"][1] == 1
+
+    doc.write_text("# Doc v2", encoding="utf-8")
+    assert push() == (1, 0)
+    assert len(stub_client.updated) == 2
+
+
+def _clear_credential_env(monkeypatch):
+    for name in ("CMT_CONF_EMAIL", "CMT_CONF_TOKEN", "CONFLUENCE_USER", "CONFLUENCE_TOKEN"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_push_core_docs_get_credentials_from_env(monkeypatch):
+    _clear_credential_env(monkeypatch)
+    monkeypatch.setenv("CMT_CONF_EMAIL", "env@example.com")
+    monkeypatch.setenv("CONFLUENCE_TOKEN", "env-token")
+
+    def no_prompt(*_):
+        raise AssertionError("should not prompt when credentials are in the environment")
+
+    monkeypatch.setattr("builtins.input", no_prompt)
+    monkeypatch.setattr("getpass.getpass", no_prompt)
+
+    assert push_core_docs.get_credentials() == ("env@example.com", "env-token")
+
+
 def test_push_core_docs_get_credentials(monkeypatch):
+    _clear_credential_env(monkeypatch)
     inputs = iter(["user@example.com"])
     monkeypatch.setattr("builtins.input", lambda prompt: next(inputs))
     monkeypatch.setattr("getpass.getpass", lambda prompt: "token-123")
@@ -520,6 +1007,7 @@ def test_push_core_docs_get_credentials(monkeypatch):
 
 
 def test_push_core_docs_get_credentials_missing_email(monkeypatch):
+    _clear_credential_env(monkeypatch)
     monkeypatch.setattr("builtins.input", lambda prompt: "")
     monkeypatch.setattr("builtins.print", lambda *_, **__: None)
 
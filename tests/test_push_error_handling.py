@@ -207,6 +207,39 @@ class TestPushErrorHandling:
                     assert result == EXIT_SUCCESS
                     assert "Successfully pushed" in caplog.text
 
+    @patch.dict(
+        os.environ,
+        {"CMT_CONF_BASE_URL": "https://test.atlassian.net/wiki", "CMT_CONF_TOKEN": "test-token"},
+    )
+    def test_push_multiple_files_shares_setup(self, caplog, temp_markdown_file):
+        """Test that a batch push sets up once and returns the worst per-file exit code."""
+        with patch("confluence_markdown.cli.MappingStore") as mock_store:
+            mock_store.return_value.get_mapping.side_effect = [{"page_id": "12345"}, None]
+
+            with patch("confluence_markdown.cli.MarkdownToConfluenceConverter") as mock_converter:
+                mock_converter.return_value.convert.return_value = "<p>Test</p>"
+
+                with patch("confluence_markdown.cli.ConfluenceClient") as mock_client_class:
+                    with caplog.at_level(logging.INFO):
+                        result = main(
+                            [
+                                "push",
+                                "--file",
+                                str(temp_markdown_file),
+                                str(temp_markdown_file),
+                                "missing.md",
+                            ]
+                        )
+
+        assert result == EXIT_CONFIG_ERROR
+        assert "Successfully pushed" in caplog.text
+        assert "No mapping found" in caplog.text
+        assert "File does not exist: missing.md" in caplog.text
+        mock_store.assert_called_once()
+        mock_converter.assert_called_once()
+        mock_client_class.assert_called_once()
+        mock_client_class.return_value.update_page.assert_called_once()
+
     @patch.dict(
         os.environ,
         {"CMT_CONF_BASE_URL": "https://test.atlassian.net/wiki", "CMT_CONF_TOKEN": "test-token"},
@@ -334,7 +367,7 @@ class TestPushErrorHandling:
                     result = main(["push", "--file", str(temp_markdown_file)])
 
                     assert result == EXIT_API_ERROR
-                    assert "Unexpected error during Confluence operation" in caplog.text
+                    assert "Unexpected error during push" in caplog.text
 
     @patch.dict(
         os.environ,
@@ -342,14 +375,22 @@ class TestPushErrorHandling:
     )
     def test_push_file_read_error(self, caplog, temp_markdown_file, mock_mapping_store):
         """Test error handling when file cannot be read."""
-        # Mock file existence check to pass, but reading fails
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("builtins.open", side_effect=OSError("Permission denied")):
-                with caplog.at_level(logging.ERROR):
-                    result = main(["push", "--file", str(temp_markdown_file)])
+        with patch("pathlib.Path.read_text", side_effect=OSError("Permission denied")):
+            with caplog.at_level(logging.ERROR):
+                result = main(["push", "--file", str(temp_markdown_file)])
+
+                assert result == EXIT_CONVERSION_ERROR
+                assert "Failed to convert markdown file" in caplog.text
 
-                    assert result == EXIT_CONVERSION_ERROR
-                    assert "Failed to convert markdown file" in caplog.text
+    def test_push_file_not_exists_skips_stat(self, caplog, mock_mapping_store):
+        """Test that a missing file is detected from the read, without a separate stat."""
+        with patch("pathlib.Path.exists") as mock_exists:
+            with caplog.at_level(logging.ERROR):
+                result = main(["push", "--file", "nonexistent.md"])
+
+        assert result == EXIT_CONFIG_ERROR
+        assert "File does not exist: nonexistent.md" in caplog.text
+        mock_exists.assert_not_called()
 
     def test_push_missing_file_argument_internal_check(self, caplog):
         """Test internal --file validation (lines 55-56)."""
@@ -386,22 +427,48 @@ class TestPushErrorHandling:
                 assert "Client setup failed" in caplog.text
 
     def test_push_outer_exception_handler(self, caplog, temp_markdown_file):
-        """Test outer exception handler in cmd_push (lines 129-131)."""
+        """Test that unexpected errors escaping cmd_push are reported by main()."""
         # Create an error that happens before any other handling
         from argparse import Namespace
 
         from confluence_markdown.cli import cmd_push
 
-        with patch("confluence_markdown.cli.Path") as mock_path:
-            mock_path.side_effect = RuntimeError("Unexpected path error")
+        with patch("confluence_markdown.cli._get_mapping_store") as mock_get_store:
+            mock_get_store.side_effect = RuntimeError("Unexpected store error")
+
+            with pytest.raises(RuntimeError):
+                cmd_push(Namespace(file=str(temp_markdown_file)))
 
             with caplog.at_level(logging.ERROR):
-                args = Namespace(file=str(temp_markdown_file))
-                result = cmd_push(args)
+                result = main(["push", "--file", str(temp_markdown_file)])
 
                 assert result == EXIT_API_ERROR
                 assert "Unexpected error in push command" in caplog.text
 
+    @patch.dict(
+        os.environ,
+        {"CMT_CONF_BASE_URL": "https://test.atlassian.net/wiki", "CMT_CONF_TOKEN": "test-token"},
+    )
+    def test_get_confluence_client_is_reused(self):
+        """Test that repeated calls share one client (and its pooled session)."""
+        from confluence_markdown.cli import _get_confluence_client
+
+        with patch("confluence_markdown.cli.ConfluenceClient") as mock_client_class:
+            first = _get_confluence_client()
+            second = _get_confluence_client()
+
+        assert first is second
+        mock_client_class.assert_called_once()
+
+    def test_get_converter_is_reused(self):
+        """Test that pushes in one process share a single converter."""
+        from confluence_markdown.cli import _get_converter
+
+        with patch("confluence_markdown.cli.MarkdownToConfluenceConverter") as mock_converter:
+            assert _get_converter() is _get_converter()
+
+        mock_converter.assert_called_once()
+
     @patch.dict(os.environ, {"CMT_CONF_BASE_URL": "https://test.atlassian.net/wiki"}, clear=True)
     def test_get_confluence_client_missing_token(self, caplog):
         """Test AuthenticationError when token is missing (line 155)."""
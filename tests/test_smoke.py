@@ -23,6 +23,22 @@ def test_smoke():
     assert True
 
 
+def test_package_exports_resolve_lazily():
+    """Test that the top-level exports load their submodules only on first access."""
+    code = (
+        "import sys, confluence_markdown as cm\n"
+        "assert 'confluence_markdown.confluence_api' not in sys.modules\n"
+        "cm.MarkdownToConfluenceConverter\n"
+        "assert 'confluence_markdown.confluence_api' not in sys.modules\n"
+        "assert all(getattr(cm, name) is not None for name in cm.__all__)\n"
+        "assert set(cm.__all__) <= set(dir(cm))\n"
+    )
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env = {**os.environ, "PYTHONPATH": src_dir}
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
 def test_main_function_direct_call():
     """Test that the main function can be called directly and shows help."""
     import sys